@@ -0,0 +1,73 @@
+"""
+Throughput and CPU cost of the codecs used to compress exports on the fly.
+
+A synthetic transactions CSV is split into export-sized chunks and pushed through
+`compress_stream` once per codec level, the same way the export views do it.
+
+Usage: python -m benchmarks.export_compression [--rows 200000] [--chunk-rows 2000]
+"""
+import argparse
+import csv
+import datetime
+import io
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from export_app.service.export_compression import GZIP, ZSTD, available_codecs, compress_stream
+
+LEVELS = {
+    GZIP: (1, 3, 6, 9),
+    ZSTD: (1, 3, 6, 12, 19),
+}
+
+CATEGORIES = ('salary', 'food', 'rent', 'transport', 'entertainment', 'health', 'utilities', 'gifts')
+
+
+def build_chunks(rows: int, chunk_rows: int) -> list[bytes]:
+    rng = random.Random(42)
+    users = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(1000)]
+    start = datetime.date(2020, 1, 1)
+    chunks = []
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['Id', 'amount', 'date', 'transaction_type', 'category', 'user_id'])
+    for row in range(1, rows + 1):
+        writer.writerow([uuid.UUID(int=rng.getrandbits(128)),
+                         Decimal(rng.randint(1, 1_000_000)) / 100,
+                         start + datetime.timedelta(days=rng.randint(0, 1500)),
+                         rng.choice(('income', 'expense')),
+                         rng.choice(CATEGORIES),
+                         rng.choice(users)])
+        if row % chunk_rows == 0:
+            chunks.append(buffer.getvalue().encode('utf-8'))
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.getvalue():
+        chunks.append(buffer.getvalue().encode('utf-8'))
+    return chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--chunk-rows', type=int, default=2000)
+    args = parser.parse_args()
+
+    chunks = build_chunks(args.rows, args.chunk_rows)
+    raw_size = sum(len(chunk) for chunk in chunks)
+    print(f"{args.rows} rows, {raw_size / 2 ** 20:.1f} MiB of CSV in {len(chunks)} chunks\n")
+    print(f"{'codec':<6} {'level':>5} {'ratio':>7} {'MiB/s':>9} {'CPU s':>7} {'CPU s/GiB':>10}")
+
+    for codec in available_codecs():
+        for level in LEVELS[codec]:
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            compressed_size = sum(len(part) for part in compress_stream(iter(chunks), codec, level))
+            wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            print(f"{codec:<6} {level:>5} {raw_size / compressed_size:>6.1f}x {raw_size / 2 ** 20 / wall:>9.1f}"
+                  f" {cpu:>7.2f} {cpu / (raw_size / 2 ** 30):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Cost of serializing list endpoint pages with the DRF model serializers and with the compiled read path.
+
+A throwaway database is created next to the configured one and filled with synthetic users, transactions
+and reports. Each list is then read and rendered to JSON both ways: model instances through
+`ModelSerializer(many=True)`, and named ``values_list()`` rows through `CompiledSerializer`. The rendered
+bodies are checked to be identical before timing.
+
+Usage: python -m benchmarks.list_serialization [--rows 100000] [--repeat 5]
+"""
+import argparse
+import datetime
+import os
+import random
+import time
+from typing import Callable
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core_app.settings')
+django.setup()
+
+from django.db import connection  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from benchmarks.parallel_export import generate_csv  # noqa: E402
+from import_app.service.import_service_impl import ImportServiceImpl  # noqa: E402
+from reports_app.models import TransactionReport  # noqa: E402
+from reports_app.serializers import REPORT_LIST_SERIALIZER, ReportResponseSerializer  # noqa: E402
+from transactions_app.models import Transaction  # noqa: E402
+from transactions_app.serializers import TRANSACTION_LIST_SERIALIZER, TransactionSerializer  # noqa: E402
+from users_app.models import User  # noqa: E402
+from users_app.serializers import USER_LIST_SERIALIZER, UserSerializer  # noqa: E402
+
+LISTS = (
+    ('transactions', Transaction, ('date', 'id'), TransactionSerializer, TRANSACTION_LIST_SERIALIZER),
+    ('users', User, ('reg_date', 'id'), UserSerializer, USER_LIST_SERIALIZER),
+    ('reports', TransactionReport, ('start_date', 'id'), ReportResponseSerializer, REPORT_LIST_SERIALIZER),
+)
+
+
+def populate(rows: int) -> None:
+    users = User.objects.bulk_create(User(first_name='Bench', last_name=str(n), email=f'bench{n}@example.com')
+                                     for n in range(rows // 10))
+    ImportServiceImpl.import_transactions_csv(generate_csv(rows, [str(user.id) for user in users]))
+    rng = random.Random(7)
+    start = datetime.date(2020, 1, 1)
+    TransactionReport.objects.bulk_create(
+        TransactionReport(total_income=rng.randint(0, 10 ** 9) / 100, total_expense=rng.randint(0, 10 ** 9) / 100,
+                          net_income=rng.randint(-10 ** 9, 10 ** 9) / 100,
+                          start_date=start + datetime.timedelta(days=n % 1000),
+                          end_date=start + datetime.timedelta(days=n % 1000 + 30))
+        for n in range(rows // 10))
+    with connection.cursor() as cursor:
+        cursor.execute('VACUUM ANALYZE')
+
+
+def best_of(repeat: int, render: Callable[[], bytes]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000, help="Transactions to load; users and reports get a tenth")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        populate(args.rows)
+        renderer = JSONRenderer()
+        print(f"{'list':<14} {'rows':>8} {'drf s':>8} {'compiled s':>11} {'speedup':>8}")
+        for name, model, ordering, serializer_class, compiled in LISTS:
+            queryset = model.objects.order_by(*ordering)
+
+            def drf() -> bytes:
+                return renderer.render(serializer_class(queryset.all(), many=True).data)
+
+            def fast() -> bytes:
+                return renderer.render(compiled.many(compiled.records(queryset)))
+
+            assert drf() == fast(), f"{name}: compiled output differs"
+            drf_seconds, fast_seconds = best_of(args.repeat, drf), best_of(args.repeat, fast)
+            print(f"{name:<14} {queryset.count():>8} {drf_seconds:>8.3f} {fast_seconds:>11.3f} "
+                  f"{drf_seconds / fast_seconds:>7.2f}x")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
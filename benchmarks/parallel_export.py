@@ -0,0 +1,83 @@
+"""
+Scaling of the parallel export backend from one worker process to many.
+
+A throwaway database is created next to the configured one and filled with synthetic transactions
+through the bulk importer. The whole table is then exported with the single-connection backend and with
+`ParallelExportServiceImpl` at increasing worker counts, reporting throughput and speedup.
+
+Usage: python -m benchmarks.parallel_export [--rows 1000000] [--workers 1,2,4,8] [--backend orm|copy]
+"""
+import argparse
+import datetime
+import os
+import random
+import time
+from typing import Iterator
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core_app.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from export_app.service.export_backends import EXPORT_BACKENDS  # noqa: E402
+from export_app.service.export_querysets import get_transactions_for_export  # noqa: E402
+from import_app.service.import_service_impl import ImportServiceImpl  # noqa: E402
+from users_app.models import User  # noqa: E402
+
+CATEGORIES = ('salary', 'food', 'rent', 'transport', 'entertainment', 'health', 'utilities', 'gifts')
+
+
+def generate_csv(rows: int, user_ids: list[str]) -> Iterator[str]:
+    rng = random.Random(42)
+    start = datetime.date(2020, 1, 1)
+    yield 'amount,date,transaction_type,category,user_id\n'
+    for _ in range(rows):
+        yield (f'{rng.randint(1, 1_000_000) / 100:.2f},{start + datetime.timedelta(days=rng.randint(0, 1500))},'
+               f'{rng.choice(("income", "expense"))},{rng.choice(CATEGORIES)},{rng.choice(user_ids)}\n')
+
+
+def measure(backend: str) -> tuple[float, int]:
+    started = time.perf_counter()
+    size = sum(len(chunk) for chunk in EXPORT_BACKENDS[backend].stream_transactions_csv(
+        get_transactions_for_export({})))
+    return time.perf_counter() - started, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', default=','.join(str(2 ** n) for n in range((os.cpu_count() or 1).bit_length())))
+    parser.add_argument('--backend', choices=('orm', 'copy'), default='orm',
+                        help="Backend encoding each range; 'orm' is CPU bound in Python, 'copy' in PostgreSQL")
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        users = [User.objects.create(first_name='Bench', last_name=str(n), email=f'bench{n}@example.com')
+                 for n in range(100)]
+        started = time.perf_counter()
+        ImportServiceImpl.import_transactions_csv(generate_csv(args.rows, [str(user.id) for user in users]))
+        with connection.cursor() as cursor:
+            cursor.execute('VACUUM ANALYZE')
+        print(f"Loaded {args.rows} rows in {time.perf_counter() - started:.1f}s\n")
+
+        baseline, size = measure(args.backend)
+        print(f"{'workers':>8} {'seconds':>8} {'MiB/s':>8} {'speedup':>8}")
+        print(f"{'single':>8} {baseline:>8.2f} {size / 2 ** 20 / baseline:>8.1f} {1:>7.2f}x")
+
+        settings.EXPORT_PARALLEL_BACKEND = args.backend
+        for workers in (int(value) for value in args.workers.split(',')):
+            settings.EXPORT_PARALLEL_WORKERS = workers
+            measure('parallel')  # warm up: spawn the worker pool
+            elapsed, _ = measure('parallel')
+            print(f"{workers:>8} {elapsed:>8.2f} {size / 2 ** 20 / elapsed:>8.1f} {baseline / elapsed:>7.2f}x")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
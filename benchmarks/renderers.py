@@ -0,0 +1,81 @@
+"""
+Render and parse cost of large transaction lists with the stdlib JSON, orjson and MessagePack codecs.
+
+Synthetic rows shaped like the transaction list output (string ids, amounts and dates, UUID user keys as
+DRF leaves them) are rendered by each renderer and parsed back by the matching parser.
+
+Usage: python -m benchmarks.renderers [--rows 100000] [--repeat 5]
+"""
+import argparse
+import datetime
+import io
+import os
+import random
+import time
+import uuid
+from typing import Callable
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core_app.settings')
+django.setup()
+
+from rest_framework.parsers import BaseParser, JSONParser  # noqa: E402
+from rest_framework.renderers import BaseRenderer, JSONRenderer  # noqa: E402
+
+from core_app.parsers import MessagePackParser, ORJSONParser  # noqa: E402
+from core_app.renderers import MessagePackRenderer, ORJSONRenderer, msgpack, orjson  # noqa: E402
+
+CATEGORIES = ('salary', 'food', 'rent', 'transport', 'entertainment', 'health', 'utilities', 'gifts')
+
+
+def build_rows(rows: int) -> list[dict]:
+    rng = random.Random(42)
+    users = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(1000)]
+    start = datetime.date(2020, 1, 1)
+    return [{
+        'id': str(uuid.UUID(int=rng.getrandbits(128))),
+        'amount': f'{rng.randint(1, 1_000_000) / 100:.2f}',
+        'date': (start + datetime.timedelta(days=rng.randint(0, 1500))).isoformat(),
+        'transaction_type': rng.choice(('income', 'expense')),
+        'category': rng.choice(CATEGORIES),
+        'user': rng.choice(users),
+    } for _ in range(rows)]
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    data = build_rows(args.rows)
+    codecs: list[tuple[str, BaseRenderer, BaseParser]] = [('json (stdlib)', JSONRenderer(), JSONParser())]
+    if orjson is not None:
+        codecs.append(('orjson', ORJSONRenderer(), ORJSONParser()))
+    if msgpack is not None:
+        codecs.append(('msgpack', MessagePackRenderer(), MessagePackParser()))
+
+    print(f"{args.rows} rows")
+    print(f"{'codec':<14} {'MiB':>7} {'render s':>9} {'parse s':>8} {'render x':>9} {'parse x':>8}")
+    baseline = None
+    for name, renderer, body_parser in codecs:
+        body = renderer.render(data)
+        render_seconds = best_of(args.repeat, lambda: renderer.render(data))
+        parse_seconds = best_of(args.repeat, lambda: body_parser.parse(io.BytesIO(body), None, {}))
+        baseline = baseline or (render_seconds, parse_seconds)
+        print(f"{name:<14} {len(body) / 2 ** 20:>7.2f} {render_seconds:>9.3f} {parse_seconds:>8.3f} "
+              f"{baseline[0] / render_seconds:>8.2f}x {baseline[1] / parse_seconds:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
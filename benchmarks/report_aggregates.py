@@ -0,0 +1,129 @@
+"""
+Time of the totals of a report computed four ways: three queries over the transactions, one pass over the
+transactions, the daily rollup and the range index.
+
+A throwaway database is created next to the configured one, its date partitions are created for the generated
+period, and it is filled with synthetic transactions by an ``INSERT ... SELECT`` over ``generate_series``
+(which also fills the daily totals through their triggers). The totals of report periods of increasing length
+are then computed with ``exists()`` followed by one ``Sum`` per transaction type, as `create_report` first did;
+with one scan of the period's transactions and ``FILTER`` clauses; by summing the daily totals of the period;
+and with `TransactionReportServiceImpl.compute_totals`, which catches the shared range index up with one query
+and subtracts two of its prefix sums. The index is timed again while allowed to lag behind by
+REPORT_RANGE_INDEX_MAX_LAG_SECONDS, as dashboards may, which leaves the database out.
+
+Usage: python -m benchmarks.report_aggregates [--rows 10000000] [--repeat 5]
+"""
+import argparse
+import datetime
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core_app.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Sum  # noqa: E402
+
+from reports_app.service.transaction_report_service_impl import (_DAILY_TOTALS, _TOTALS,  # noqa: E402
+                                                                 TransactionReportServiceImpl)
+from transactions_app.models import DailyTotal, Transaction  # noqa: E402
+from transactions_app.service.transaction_partitioning import create_partitions, is_partitioned  # noqa: E402
+from users_app.models import User  # noqa: E402
+
+START = datetime.date(2020, 1, 1)
+DAYS = 1500
+PERIODS = (('month', 30), ('quarter', 91), ('year', 365), ('all', DAYS))
+
+
+def populate(rows: int) -> None:
+    users = User.objects.bulk_create(User(first_name='Bench', last_name=str(n), email=f'bench{n}@example.com')
+                                     for n in range(1000))
+    table = Transaction._meta.db_table
+    if is_partitioned(connection, table):
+        create_partitions(connection, table, settings.TRANSACTION_PARTITION_INTERVAL, START,
+                          START + datetime.timedelta(days=DAYS))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (id, amount, date, transaction_type, category, user_id) "
+            f"SELECT gen_random_uuid(), round((random() * 10000)::numeric, 2), %s::date + (n %% %s), "
+            f"CASE WHEN random() < 0.3 THEN 'income' ELSE 'expense' END, 'misc', (%s::uuid[])[1 + n %% %s] "
+            f"FROM generate_series(1, %s) AS n",
+            [START, DAYS, [str(user.id) for user in users], len(users), rows])
+        cursor.execute('VACUUM ANALYZE')
+
+
+def legacy_totals(start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
+    transactions = Transaction.objects.filter(date__range=[start_date, end_date])
+    if not transactions.exists():
+        return {'total_income': 0, 'total_expense': 0}
+    income = transactions.filter(transaction_type='income').aggregate(Sum('amount'))['amount__sum'] or 0
+    expense = transactions.filter(transaction_type='expense').aggregate(Sum('amount'))['amount__sum'] or 0
+    return {'total_income': income, 'total_expense': expense}
+
+
+def scan_totals(start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
+    return Transaction.objects.filter(date__range=[start_date, end_date]).aggregate(**_TOTALS)
+
+
+def rollup_totals(start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
+    return DailyTotal.objects.filter(date__range=[start_date, end_date], user_id=None,
+                                     category=None).aggregate(**_DAILY_TOTALS)
+
+
+def best_of(repeat: int, run: Callable[[], dict[str, Any]]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    old_name = connection.settings_dict['NAME']
+    settings.REPORT_RANGE_INDEX_DIR = tempfile.mkdtemp()
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        populate(args.rows)
+        print(f"{args.rows} transactions")
+        print(f"{'period':<8} {'rows':>10} {'3 queries s':>12} {'1 scan s':>9} {'rollup s':>9} {'index s':>9} "
+              f"{'lagged s':>9} {'speedup':>8}")
+        for name, days in PERIODS:
+            start_date = START + datetime.timedelta(days=DAYS - days)
+            end_date = START + datetime.timedelta(days=DAYS - 1)
+            settings.REPORT_RANGE_INDEX_MAX_LAG_SECONDS = 0
+            totals = TransactionReportServiceImpl.compute_totals(start_date, end_date)
+            legacy = legacy_totals(start_date, end_date)
+            scanned = scan_totals(start_date, end_date)
+            assert (legacy['total_income'], legacy['total_expense']) == (totals['total_income'],
+                                                                         totals['total_expense'])
+            assert scanned == {key: totals[key] for key in scanned}
+            assert rollup_totals(start_date, end_date) == scanned
+
+            legacy_seconds = best_of(args.repeat, lambda: legacy_totals(start_date, end_date))
+            scan_seconds = best_of(args.repeat, lambda: scan_totals(start_date, end_date))
+            rollup_seconds = best_of(args.repeat, lambda: rollup_totals(start_date, end_date))
+            index_seconds = best_of(args.repeat, lambda: TransactionReportServiceImpl.compute_totals(start_date,
+                                                                                                    end_date))
+            settings.REPORT_RANGE_INDEX_MAX_LAG_SECONDS = 60
+            lagged_seconds = best_of(args.repeat, lambda: TransactionReportServiceImpl.compute_totals(start_date,
+                                                                                                     end_date))
+            rows = totals['income_count'] + totals['expense_count']
+            print(f"{name:<8} {rows:>10} {legacy_seconds:>12.3f} {scan_seconds:>9.3f} {rollup_seconds:>9.4f} "
+                  f"{index_seconds:>9.5f} {lagged_seconds:>9.6f} {legacy_seconds / index_seconds:>7.0f}x")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
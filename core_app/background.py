@@ -0,0 +1,43 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def submit_background_task(task: Callable[..., Any], *args: Any) -> None:
+    """
+    Run a task on the process-local worker pool once the current DB transaction commits.
+
+    Deferring the submission to commit time guarantees the task sees the rows created by the caller.
+    With ``BACKGROUND_TASKS_EAGER`` enabled the task runs synchronously instead, which is meant for tests.
+    """
+    if settings.BACKGROUND_TASKS_EAGER:
+        transaction.on_commit(lambda: task(*args))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(_run_task, task, *args))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.BACKGROUND_TASK_WORKERS,
+                                           thread_name_prefix='background-task')
+        return _executor
+
+
+def _run_task(task: Callable[..., Any], *args: Any) -> None:
+    try:
+        task(*args)
+    except Exception:
+        logger.exception(f"Background task {task.__qualname__} failed")
+    finally:
+        connections.close_all()
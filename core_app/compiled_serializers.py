@@ -0,0 +1,124 @@
+import datetime
+from decimal import Decimal
+from functools import cached_property
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.db import models
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+class CompiledSerializer:
+    """
+    Read-only fast path producing the same representation as a `ModelSerializer` for list endpoints.
+
+    Rows are read with ``values_list(named=True)`` instead of being built into model instances, and turned
+    into dicts by a single function compiled from the serializer's fields: plain values are copied, and
+    the few types DRF converts (UUIDs, decimals, dates, datetimes) go through one precomputed converter
+    each. Field types without a known conversion fall back to the DRF field's own ``to_representation``,
+    so the output renders to exactly the same JSON as ``serializer_class(instances, many=True).data``.
+
+    The named rows keep attribute access, so they can be paginated with `KeysetPagination`.
+    """
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer]) -> None:
+        self.serializer_class = serializer_class
+
+    def records(self, queryset: QuerySet) -> QuerySet:
+        """
+        Return the queryset as lightweight named rows holding just the serialized columns.
+        """
+        return queryset.values_list(*self._columns, named=True)
+
+    def to_representation(self, record: tuple) -> dict[str, Any]:
+        return self._compiled(record)
+
+    def many(self, records: Iterable[tuple]) -> list[dict[str, Any]]:
+        return list(map(self._compiled, records))
+
+    @cached_property
+    def _fields(self) -> list[tuple[str, str, Converter, bool]]:
+        """
+        The readable fields as ``(name, column, converter, nullable)``, in the serializer's field order.
+
+        Built on first use, since instantiating the serializer's fields needs the app registry.
+        """
+        model = self.serializer_class.Meta.model
+        fields = []
+        for field in self.serializer_class()._readable_fields:
+            if '.' in field.source or field.source == '*':
+                raise ValueError(f"{self.serializer_class.__name__}.{field.field_name}: "
+                                 f"only model field sources can be compiled")
+            model_field = model._meta.get_field(field.source)
+            fields.append((field.field_name, model_field.attname, _converter(field, model_field), model_field.null))
+        return fields
+
+    @cached_property
+    def _columns(self) -> list[str]:
+        return [column for _, column, _, _ in self._fields]
+
+    @cached_property
+    def _compiled(self) -> Callable[[tuple], dict[str, Any]]:
+        namespace: dict[str, Any] = {}
+        items = []
+        for index, (name, _, convert, nullable) in enumerate(self._fields):
+            value = f'r[{index}]'
+            if convert is not None:
+                namespace[f'c{index}'] = convert
+                value = f'c{index}({value})'
+                if nullable:
+                    value = f'(None if r[{index}] is None else {value})'
+            items.append(f'{name!r}: {value}')
+        return eval(f'lambda r: {{{", ".join(items)}}}', namespace)
+
+
+def _converter(field: serializers.Field, model_field: models.Field) -> Converter:
+    """
+    Return the conversion DRF applies to a field's database value, or None if the value is used as is.
+    """
+    if isinstance(field, PrimaryKeyRelatedField):
+        # The column already holds the related primary key, which is the representation without a pk_field.
+        return None if field.pk_field is None else field.pk_field.to_representation
+    if isinstance(field, (serializers.CharField, serializers.ChoiceField, serializers.BooleanField,
+                          serializers.IntegerField)):
+        return None
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == 'hex_verbose':
+        return str
+    if isinstance(field, serializers.DecimalField) and _decimal_is_plain_string(field):
+        if (isinstance(model_field, models.DecimalField) and model_field.decimal_places == field.decimal_places
+                and model_field.max_digits <= field.max_digits):
+            # Column values come back at the column's scale, so they are already quantized and str()
+            # gives their fixed-point form.
+            return str
+        exponent = Decimal(1).scaleb(-field.decimal_places)
+        return lambda value: format(value.quantize(exponent, rounding=field.rounding), 'f')
+    if isinstance(field, serializers.DateTimeField) and _iso_8601(field, api_settings.DATETIME_FORMAT):
+        if settings.USE_TZ and not hasattr(field, 'timezone'):
+            return _aware_datetime_to_iso
+    elif isinstance(field, serializers.DateField) and _iso_8601(field, api_settings.DATE_FORMAT):
+        return datetime.date.isoformat
+    return field.to_representation
+
+
+def _iso_8601(field: serializers.Field, default_format: Optional[str]) -> bool:
+    output_format = getattr(field, 'format', default_format)
+    return output_format is not None and output_format.lower() == ISO_8601
+
+
+def _decimal_is_plain_string(field: serializers.DecimalField) -> bool:
+    coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    return (coerce_to_string and not field.localize and field.decimal_places is not None
+            and field.max_digits is not None)
+
+
+def _aware_datetime_to_iso(value: datetime.datetime) -> str:
+    representation = value.astimezone(timezone.get_current_timezone()).isoformat()
+    if representation.endswith('+00:00'):
+        return representation[:-6] + 'Z'
+    return representation
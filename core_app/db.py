@@ -0,0 +1,39 @@
+from typing import Any, Mapping, Optional, TypeVar, cast
+
+from django.db import connections
+from django.db.models import Model
+from django.db.models.sql import UpdateQuery
+
+M = TypeVar('M', bound=Model)
+
+
+def update_returning(model: type[M], pk: Any, values: Mapping[str, Any],
+                     filters: Optional[Mapping[str, Any]] = None) -> M:
+    """
+    Write the given fields of one row and return the updated instance.
+
+    On PostgreSQL this is a single ``UPDATE ... WHERE pk = ... RETURNING`` statement that only sets the given
+    columns; other databases fall back to an UPDATE followed by a SELECT.
+    Raises ``model.DoesNotExist`` if no row has the primary key, or none also matches the optional ``filters``.
+    """
+    queryset = model._default_manager.filter(pk=pk, **(filters or {}))
+    if not values:
+        return queryset.get()
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        if not queryset.update(**values):
+            raise model.DoesNotExist(f"{model._meta.object_name} matching query does not exist.")
+        return queryset.get()
+
+    query = cast(UpdateQuery, queryset.query.chain(UpdateQuery))
+    query.add_update_values(dict(values))
+    sql, params = query.get_compiler(queryset.db).as_sql()
+    fields = model._meta.concrete_fields
+    # Concrete fields always have a column.
+    returning = ', '.join(connection.ops.quote_name(cast(str, field.column)) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f'{sql} RETURNING {returning}', params)
+        row = cursor.fetchone()
+    if row is None:
+        raise model.DoesNotExist(f"{model._meta.object_name} matching query does not exist.")
+    return model.from_db(queryset.db, [field.attname for field in fields], row)
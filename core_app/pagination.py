@@ -0,0 +1,104 @@
+import base64
+import binascii
+import json
+from typing import Any, Optional, cast
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Field, Model, Q, QuerySet
+from drf_yasg import openapi
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+KEYSET_PAGINATION_PARAMETERS = [
+    openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                      description="Opaque cursor of the next page, taken from the Link or X-Next-Cursor header"),
+    openapi.Parameter('page_size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+]
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks by the values of the last row instead of skipping rows with OFFSET.
+
+    Pages are ordered by a field and a unique key breaking its ties, e.g. ``('date', 'id')``.
+    The ``cursor`` query parameter holds the ordering values of the previous page's last row, encoded as
+    an opaque token, and the next page starts right after that row. With a composite index on the ordering
+    fields every page is a single index range scan, so deep pages cost the same as the first one.
+
+    Pages may hold model instances or named ``values_list()`` rows, as long as the ordering fields are
+    attributes of each row. The response body stays a plain list; the next page is announced in the ``Link`` header
+    (``rel="next"``) and the ``X-Next-Cursor`` header, which are absent on the last page.
+
+    Pagination is opt-in so existing clients keep getting complete lists: only requests with a ``cursor`` or
+    ``page_size`` parameter are paginated, and ``paginate_queryset`` returns ``None`` for the others.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def __init__(self, ordering: tuple[str, str]) -> None:
+        self.ordering = ordering
+        self.next_cursor: Optional[str] = None
+        self.request: Optional[Request] = None
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request,
+                          view: Optional[APIView] = None) -> Optional[list[Any]]:
+        if not {self.cursor_query_param, self.page_size_query_param} & request.query_params.keys():
+            return None
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self._seek_condition(queryset.model, self.decode_cursor(cursor)))
+
+        rows = list(queryset[:page_size + 1])
+        page = rows[:page_size]
+        self.next_cursor = self.encode_cursor(page[-1]) if len(rows) > page_size else None
+        return page
+
+    def get_paginated_response(self, data: Any) -> Response:
+        headers = {}
+        if self.next_cursor is not None and self.request is not None:
+            url = replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+            headers = {'Link': f'<{url}>; rel="next"', 'X-Next-Cursor': self.next_cursor}
+        return Response(data, headers=headers)
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.API_DEFAULT_PAGE_SIZE
+        return min(max(page_size, 1), settings.API_MAX_PAGE_SIZE)
+
+    def encode_cursor(self, row: Any) -> str:
+        values = [getattr(row, field) for field in self.ordering]
+        payload = json.dumps([value.isoformat() if hasattr(value, 'isoformat') else str(value) for value in values])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> list[str]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        except (binascii.Error, ValueError):
+            raise NotFound("Invalid cursor.")
+        if (not isinstance(values, list) or len(values) != len(self.ordering)
+                or not all(isinstance(value, str) for value in values)):
+            raise NotFound("Invalid cursor.")
+        return values
+
+    def _seek_condition(self, model: type[Model], values: list[str]) -> Q:
+        """
+        Build the condition ``(field, key) > (value, key value)`` as ``field >= value AND NOT (field = value AND
+        key <= key value)``, whose leading range lets the database walk the composite index from the cursor.
+        """
+        try:
+            value, key_value = [cast(Field, model._meta.get_field(name)).to_python(raw)
+                                for name, raw in zip(self.ordering, values)]
+        except ValidationError:
+            raise NotFound("Invalid cursor.")
+        field, key = self.ordering
+        return Q(**{f'{field}__gte': value}) & ~Q(**{field: value, f'{key}__lte': key_value})
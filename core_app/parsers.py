@@ -0,0 +1,41 @@
+import codecs
+from typing import IO, Any, Mapping, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from core_app.renderers import MessagePackRenderer, msgpack, orjson
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSON parser backed by orjson. Like `JSONParser` in strict mode, it rejects NaN and infinities.
+
+    Bodies in a charset other than UTF-8, and installations without orjson, fall back to `JSONParser`.
+    """
+
+    def parse(self, stream: IO[bytes], media_type: Optional[str] = None,
+              parser_context: Optional[Mapping[str, Any]] = None) -> Any:
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parse MessagePack request bodies sent with ``Content-Type: application/msgpack``.
+    """
+    media_type = MessagePackRenderer.media_type
+
+    def parse(self, stream: IO[bytes], media_type: Optional[str] = None,
+              parser_context: Optional[Mapping[str, Any]] = None) -> Any:
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc}')
@@ -0,0 +1,75 @@
+import decimal
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson support is optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # MessagePack support is optional
+    msgpack = None
+
+_fallback_encoder = JSONEncoder()
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Convert the values the fast encoders do not handle natively.
+
+    Decimals become their exact string form; everything else is converted like DRF's JSON encoder does
+    (lazy strings, querysets, timedeltas, generators, ...).
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, which encodes UUIDs, dates and datetimes natively in C.
+
+    The output is compact UTF-8 like `JSONRenderer`'s, and U+2028/U+2029 are escaped the same way.
+    Requests for indented output (``Accept: application/json; indent=4``), data orjson cannot encode
+    (e.g. integers beyond 64 bits) and installations without orjson fall back to `JSONRenderer`.
+    """
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None,
+               renderer_context: Optional[Mapping[str, Any]] = None) -> bytes:
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            rendered = orjson.dumps(data, default=encode_default,
+                                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Valid JSON, but not valid JavaScript; escaped for the same reasons as in JSONRenderer.
+        if b'\xe2\x80\xa8' in rendered or b'\xe2\x80\xa9' in rendered:
+            rendered = rendered.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return rendered
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer for internal clients, selected with ``Accept: application/msgpack``.
+
+    UUIDs, dates and decimals are sent as the same strings as in the JSON representation.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None,
+               renderer_context: Optional[Mapping[str, Any]] = None) -> bytes:
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
+
@@ -1,6 +1,8 @@
 from dotenv import load_dotenv, find_dotenv
 from pathlib import Path
+import datetime
 import logging
+import importlib.util
 import os
 
 
@@ -33,7 +35,10 @@ INSTALLED_APPS = [
     'users_app',
     'transactions_app',
     'reports_app',
-    'export_app'
+    'export_app',
+    'export_jobs_app',
+    'versioning_app',
+    'import_app'
 ]
 
 MIDDLEWARE = [
@@ -92,11 +97,36 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# orjson backs JSON rendering and parsing when installed; MessagePack is offered to clients when msgpack is.
+_MSGPACK_INSTALLED = importlib.util.find_spec('msgpack') is not None
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [],
     'DEFAULT_PERMISSION_CLASSES': [],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core_app.renderers.ORJSONRenderer',
+        *(['core_app.renderers.MessagePackRenderer'] if _MSGPACK_INSTALLED else []),
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core_app.parsers.ORJSONParser',
+        *(['core_app.parsers.MessagePackParser'] if _MSGPACK_INSTALLED else []),
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Page sizes of the list endpoints when paginated with a cursor or page size (see core_app.pagination); clients may
+# ask for up to the maximum.
+API_DEFAULT_PAGE_SIZE = int(os.environ.get('API_DEFAULT_PAGE_SIZE', 100))
+API_MAX_PAGE_SIZE = int(os.environ.get('API_MAX_PAGE_SIZE', 1000))
+
+# Number of rows fetched from the server-side cursor and encoded per chunk by streamed list responses (?stream=1).
+API_STREAM_CHUNK_SIZE = int(os.environ.get('API_STREAM_CHUNK_SIZE', 2000))
+
+# Largest number of transactions accepted by one POST /transactions/batch request.
+TRANSACTION_BATCH_MAX_SIZE = int(os.environ.get('TRANSACTION_BATCH_MAX_SIZE', 1000))
+
 LANGUAGE_CODE = 'en-us'
 
 TIME_ZONE = 'UTC'
@@ -109,3 +139,108 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Number of rows fetched from the server-side cursor and encoded per chunk by streaming exports.
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 2000))
+
+# Export backend: 'copy' (PostgreSQL COPY ... TO STDOUT), 'orm' (csv.writer over the ORM),
+# 'parallel' (primary key ranges encoded by worker processes) or 'auto'.
+EXPORT_BACKEND = os.environ.get('EXPORT_BACKEND', 'auto')
+EXPORT_COPY_BUFFER_SIZE = 64 * 1024
+EXPORT_COPY_QUEUE_SIZE = 8
+
+# Parallel exports: number of worker processes, key ranges per worker, and the backend the workers
+# encode their ranges with ('copy', 'orm' or 'auto'). Ranges are spooled to EXPORT_PARALLEL_TMP_DIR.
+EXPORT_PARALLEL_WORKERS = int(os.environ.get('EXPORT_PARALLEL_WORKERS', os.cpu_count() or 1))
+EXPORT_PARALLEL_PARTITIONS_PER_WORKER = 4
+EXPORT_PARALLEL_BACKEND = os.environ.get('EXPORT_PARALLEL_BACKEND', 'auto')
+EXPORT_PARALLEL_TMP_DIR = os.environ.get('EXPORT_PARALLEL_TMP_DIR') or None
+
+# The transactions table is partitioned by ranges of dates on PostgreSQL, with one partition per 'month' or 'year'.
+# Partitions are created TRANSACTION_PARTITIONS_AHEAD intervals in advance by `migrate` and by the
+# `partition_transactions` command, which is meant to be run on a schedule (cron).
+TRANSACTION_PARTITION_INTERVAL = os.environ.get('TRANSACTION_PARTITION_INTERVAL', 'month')
+TRANSACTION_PARTITIONS_AHEAD = int(os.environ.get('TRANSACTION_PARTITIONS_AHEAD', 3))
+
+# Report range totals are answered from prefix sums of the daily totals, kept in one memory-mapped file per
+# database in this directory and shared by the worker processes of a host (see reports_app.service.range_index).
+# An empty value turns the index off. It covers REPORT_RANGE_INDEX_DAYS days from REPORT_RANGE_INDEX_FIRST_DAY;
+# other periods are summed from the daily totals.
+REPORT_RANGE_INDEX_DIR = os.environ.get('REPORT_RANGE_INDEX_DIR', os.path.join(BASE_DIR, 'range_index'))
+REPORT_RANGE_INDEX_FIRST_DAY = datetime.date.fromisoformat(os.environ.get('REPORT_RANGE_INDEX_FIRST_DAY',
+                                                                          '2000-01-01'))
+REPORT_RANGE_INDEX_DAYS = int(os.environ.get('REPORT_RANGE_INDEX_DAYS', 100 * 366))
+# Seconds the index may lag behind committed writes; at 0 every range total first catches up with them.
+REPORT_RANGE_INDEX_MAX_LAG_SECONDS = float(os.environ.get('REPORT_RANGE_INDEX_MAX_LAG_SECONDS', 0))
+# Days written to the daily totals are logged for the index and the report cache to catch up and kept this long
+# (see the prune_daily_total_changes command); an index that has not caught up for longer is rebuilt.
+REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS = int(os.environ.get('REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS',
+                                                                 24 * 60 * 60))
+# Concurrent requests for the report of the same period wait for the first one for up to this long, then create
+# their own (see reports_app.service.report_flights).
+REPORT_FLIGHT_TIMEOUT_SECONDS = float(os.environ.get('REPORT_FLIGHT_TIMEOUT_SECONDS', 30))
+
+# Number of transactions removed per database transaction when a deleted user is purged in the background.
+USER_PURGE_BATCH_SIZE = int(os.environ.get('USER_PURGE_BATCH_SIZE', 10000))
+# Pending or running purges without a heartbeat for this long were lost with their process-local pool (e.g. after a
+# restart); they are resumed by the next deletion request of the user or by `resume_user_purges`.
+USER_PURGE_STALE_SECONDS = int(os.environ.get('USER_PURGE_STALE_SECONDS', 10 * 60))
+
+# Process-local worker pool for background tasks such as asynchronous export jobs.
+BACKGROUND_TASK_WORKERS = int(os.environ.get('BACKGROUND_TASK_WORKERS', 2))
+BACKGROUND_TASKS_EAGER = False
+
+# Asynchronous export jobs write their CSV artifacts here and delete them after EXPORT_JOBS_TTL_SECONDS.
+EXPORT_JOBS_DIR = os.environ.get('EXPORT_JOBS_DIR', os.path.join(BASE_DIR, 'export_artifacts'))
+EXPORT_JOBS_TTL_SECONDS = int(os.environ.get('EXPORT_JOBS_TTL_SECONDS', 24 * 60 * 60))
+# Running jobs record their progress at most this often, which also serves as their heartbeat.
+EXPORT_JOBS_PROGRESS_INTERVAL_SECONDS = float(os.environ.get('EXPORT_JOBS_PROGRESS_INTERVAL_SECONDS', 1))
+# Pending or running jobs without a heartbeat for this long are marked failed by `expire_export_jobs`,
+# as the process-local pool that ran them is gone (e.g. after a restart).
+EXPORT_JOBS_STALE_SECONDS = int(os.environ.get('EXPORT_JOBS_STALE_SECONDS', 10 * 60))
+# Optional header (e.g. 'X-Accel-Redirect' or 'X-Sendfile') to hand artifact downloads off to the web server.
+EXPORT_JOBS_SENDFILE_HEADER = os.environ.get('EXPORT_JOBS_SENDFILE_HEADER', '')
+EXPORT_JOBS_SENDFILE_PREFIX = os.environ.get('EXPORT_JOBS_SENDFILE_PREFIX', '/protected-exports/')
+
+# Number of CSV rows validated and copied into the staging table at a time by bulk imports.
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', 5000))
+# Import reports list the errors of at most this many rows; the failed count covers all of them.
+IMPORT_MAX_REPORTED_ERRORS = 1000
+
+# Default levels of the codecs used to compress exports on the fly (see export_app.service.export_compression).
+EXPORT_COMPRESSION_LEVELS = {
+    'gzip': 6,
+    'zstd': 3,
+}
+
+# Column compression of Parquet exports (snappy, zstd, gzip, lz4, brotli or none).
+EXPORT_PARQUET_COMPRESSION = os.environ.get('EXPORT_PARQUET_COMPRESSION', 'zstd')
+EXPORT_PARQUET_ROW_GROUP_SIZE = 128 * 1024
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Generated exports, keyed by their filters and the data version of the exported table.
+    'exports': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'exports',
+        'TIMEOUT': int(os.environ.get('EXPORT_CACHE_TTL_SECONDS', 60 * 60)),
+        'OPTIONS': {
+            'MAX_ENTRIES': 64,
+        },
+    },
+    # Totals of report periods, revalidated against the change log of the daily totals on every read (see
+    # reports_app.service.report_cache). Least recently used periods are culled beyond MAX_ENTRIES; point
+    # REPORT_CACHE_BACKEND at a cache shared by all workers, such as Redis with an LRU eviction policy, in production.
+    'reports': {
+        'BACKEND': os.environ.get('REPORT_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('REPORT_CACHE_LOCATION', 'reports'),
+        'TIMEOUT': REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('REPORT_CACHE_MAX_ENTRIES', 1024)),
+        },
+    },
+}
+# Exports larger than this are streamed without being cached.
+EXPORT_CACHE_MAX_BYTES = int(os.environ.get('EXPORT_CACHE_MAX_BYTES', 16 * 1024 * 1024))
@@ -0,0 +1,100 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core_app.compiled_serializers import CompiledSerializer
+from export_jobs_app.models import ExportJob, ExportJobStatus
+from export_jobs_app.serializers import ExportJobSerializer
+from reports_app.models import TransactionReport
+from reports_app.serializers import REPORT_LIST_SERIALIZER, ReportResponseSerializer
+from transactions_app.models import Transaction
+from transactions_app.serializers import TRANSACTION_LIST_SERIALIZER, TransactionSerializer
+from users_app.models import User
+from users_app.serializers import USER_LIST_SERIALIZER, UserSerializer
+
+
+@pytest.fixture
+def users():
+    return [User.objects.create(first_name=name, last_name="Doe", email=f"{name.lower()}@example.com")
+            for name in ("John", "Jane", "Zoë")]
+
+
+@pytest.fixture
+def transactions(users):
+    amounts = ("0", "0.5", "12.30", "99999999.99", "100")
+    return [Transaction.objects.create(user=users[n % 3], amount=amount, transaction_type=("income", "expense")[n % 2],
+                                       category="salary & \"bonus\"", date=datetime.date(2024, 1 + n, 28))
+            for n, amount in enumerate(amounts)]
+
+
+@pytest.fixture
+def reports():
+    return [TransactionReport.objects.create(total_income="1000.10", total_expense="0", net_income="-5.5",
+                                             start_date="2024-01-01", end_date="2024-12-31")]
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("compiled, serializer_class, model", [
+    (TRANSACTION_LIST_SERIALIZER, TransactionSerializer, Transaction),
+    (USER_LIST_SERIALIZER, UserSerializer, User),
+    (REPORT_LIST_SERIALIZER, ReportResponseSerializer, TransactionReport),
+])
+def test_compiled_serializer_matches_model_serializer(transactions, reports, compiled, serializer_class, model):
+    """
+    Test case: Serialize the same rows with the compiled serializer and with the DRF serializer.
+
+    Expected Result:
+    - The rendered JSON is byte-identical.
+    """
+    queryset = model.objects.order_by('pk')
+
+    expected = render(serializer_class(queryset, many=True).data)
+
+    assert render(compiled.many(compiled.records(queryset))) == expected
+
+
+@pytest.mark.django_db
+def test_compiled_serializer_nullable_and_fallback_fields():
+    """
+    Test case: Compile a serializer with nullable columns and a field without a dedicated conversion.
+
+    Expected Result:
+    - NULLs stay None, the JSON field goes through DRF's own conversion, and the output matches.
+    """
+    ExportJob.objects.create(kind='transactions', filters={'user': None, 'start_date': '2024-01-01'})
+    ExportJob.objects.create(kind='reports', status=ExportJobStatus.FINISHED, rows_total=3, rows_written=3,
+                             finished_at=timezone.now())
+    compiled = CompiledSerializer(ExportJobSerializer)
+    queryset = ExportJob.objects.order_by('created_at')
+
+    assert 'file_path' not in compiled.records(queryset).query.values_select
+    assert render(compiled.many(compiled.records(queryset))) == render(
+        ExportJobSerializer(queryset, many=True).data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name, serializer_class, model", [
+    ('transactions', TransactionSerializer, Transaction),
+    ('users', UserSerializer, User),
+    ('reports', ReportResponseSerializer, TransactionReport),
+])
+def test_list_endpoints_render_as_before(transactions, reports, url_name, serializer_class, model):
+    """
+    Test case: Fetch each list endpoint, which reads through the compiled serializers.
+
+    Expected Result:
+    - The response body is byte-identical to rendering the DRF serializer over the same rows in the same order.
+    """
+    response = APIClient().get(reverse(url_name))
+
+    ordering = {'transactions': ('date', 'id'), 'users': ('reg_date', 'id'), 'reports': ()}[url_name]
+    queryset = model.objects.order_by(*ordering) if ordering else model.objects.all()
+    assert response.content == render(serializer_class(queryset, many=True).data)
@@ -0,0 +1,60 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from core_app.db import update_returning
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.mark.django_db
+def test_update_returning_returns_the_updated_row(user):
+    """
+    Test case: Update some fields of a transaction.
+
+    Expected Result:
+    - The returned instance holds every column of the updated row, converted to Python values.
+    """
+    transaction = Transaction.objects.create(user=user, amount=100, transaction_type="income", category="salary",
+                                             date="2024-01-01")
+
+    result = update_returning(Transaction, transaction.id, {'amount': Decimal('12.30'), 'category': 'bonus'})
+
+    assert result.pk == transaction.pk
+    assert result.amount == Decimal('12.30') and result.category == 'bonus'
+    assert result.date == datetime.date(2024, 1, 1) and result.user_id == user.id
+    assert not result._state.adding
+
+
+@pytest.mark.django_db
+def test_update_returning_assigns_foreign_keys(user):
+    """
+    Test case: Move a transaction to another user by passing the user instance.
+
+    Expected Result:
+    - The foreign key column is written with the user's primary key.
+    """
+    other = User.objects.create(first_name="Jane", last_name="Doe", email="jane@example.com")
+    transaction = Transaction.objects.create(user=user, amount=1, transaction_type="income", category="salary",
+                                             date="2024-01-01")
+
+    assert update_returning(Transaction, transaction.id, {'user': other}).user_id == other.id
+
+
+@pytest.mark.django_db
+def test_update_returning_missing_row():
+    """
+    Test case: Update a row that does not exist.
+
+    Expected Result:
+    - The model's DoesNotExist is raised.
+    """
+    with pytest.raises(User.DoesNotExist):
+        update_returning(User, uuid.uuid4(), {'first_name': 'Jane'})
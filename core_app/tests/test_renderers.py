@@ -0,0 +1,160 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core_app.parsers import MessagePackParser, ORJSONParser
+from core_app.renderers import MessagePackRenderer, ORJSONRenderer
+from transactions_app.models import Transaction
+from users_app.models import User
+
+msgpack = pytest.importorskip('msgpack')
+pytest.importorskip('orjson')
+
+DATA = [
+    {
+        'id': uuid.UUID('5f0c6d2e-8a4b-4c1e-9a7b-2d3e4f5a6b7c'),
+        'amount': '12.30',
+        'date': datetime.date(2024, 2, 29),
+        'created': datetime.datetime(2024, 2, 29, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        'category': 'café "quoted"   line',
+        'flags': [True, False, None],
+        'count': 3,
+    },
+]
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def test_orjson_renderer_matches_json_renderer():
+    """
+    Test case: Render the same data with orjson and with DRF's JSONRenderer.
+
+    Expected Result:
+    - The bodies are byte-identical, including UUIDs, dates, datetimes, unicode and escaped U+2028.
+    """
+    assert ORJSONRenderer().render(DATA) == JSONRenderer().render(DATA)
+
+
+def test_orjson_renderer_keeps_decimals_exact():
+    """
+    Test case: Render decimals that have no exact float representation.
+
+    Expected Result:
+    - Decimals are rendered as their exact strings instead of floats.
+    """
+    assert ORJSONRenderer().render({'amount': Decimal('0.10'), 'big': Decimal('12345678901234567890.01')}) == \
+        b'{"amount":"0.10","big":"12345678901234567890.01"}'
+
+
+def test_orjson_renderer_big_integers_fall_back():
+    """
+    Test case: Render an integer beyond the 64-bit range orjson can encode.
+
+    Expected Result:
+    - The output of JSONRenderer is returned instead of an error.
+    """
+    data = {'count': 2 ** 70, 'negative': -2 ** 64}
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data) == \
+        b'{"count":1180591620717411303424,"negative":-18446744073709551616}'
+
+
+def test_orjson_renderer_indent_falls_back():
+    """
+    Test case: Ask for indented JSON through the Accept header parameters.
+
+    Expected Result:
+    - The indented output of JSONRenderer is returned.
+    """
+    rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=2', {})
+
+    assert rendered == b'{\n  "a": 1\n}'
+
+
+def test_orjson_parser_rejects_invalid_json():
+    """
+    Test case: Parse a malformed body and a body with NaN.
+
+    Expected Result:
+    - Both raise ParseError, as JSONParser does in strict mode.
+    """
+    for body in (b'{"a": ', b'{"a": NaN}'):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(body), 'application/json', {})
+
+
+def test_msgpack_round_trip():
+    """
+    Test case: Render data as MessagePack and parse it back.
+
+    Expected Result:
+    - Values come back as their JSON representations.
+    """
+    parsed = MessagePackParser().parse(io.BytesIO(MessagePackRenderer().render(DATA)), 'application/msgpack', {})
+
+    assert parsed == [{
+        'id': '5f0c6d2e-8a4b-4c1e-9a7b-2d3e4f5a6b7c',
+        'amount': '12.30',
+        'date': '2024-02-29',
+        'created': '2024-02-29T12:30:15.123456Z',
+        'category': 'café "quoted"   line',
+        'flags': [True, False, None],
+        'count': 3,
+    }]
+
+
+def test_msgpack_parser_rejects_invalid_body():
+    """
+    Test case: Parse a truncated MessagePack body.
+
+    Expected Result:
+    - ParseError is raised.
+    """
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(io.BytesIO(msgpack.packb({'a': 'long value'})[:-3]), 'application/msgpack', {})
+
+
+@pytest.mark.django_db
+def test_list_endpoint_negotiates_msgpack(user):
+    """
+    Test case: Request the transaction list with Accept: application/msgpack.
+
+    Expected Result:
+    - The response is MessagePack holding the same data as the JSON response.
+    """
+    Transaction.objects.create(user=user, amount="12.30", transaction_type="income", category="salary",
+                               date="2024-01-01")
+    client = APIClient()
+
+    packed = client.get(reverse('transactions'), HTTP_ACCEPT='application/msgpack')
+    json = client.get(reverse('transactions'), HTTP_ACCEPT='application/json')
+
+    assert packed['Content-Type'] == 'application/msgpack'
+    assert msgpack.unpackb(packed.content) == json.json()
+
+
+@pytest.mark.django_db
+def test_create_endpoint_parses_msgpack(user):
+    """
+    Test case: Create a batch of transactions with a MessagePack request body.
+
+    Expected Result:
+    - The request is parsed and the transactions are created.
+    """
+    body = msgpack.packb([{'user': str(user.id), 'amount': '5.00', 'transaction_type': 'expense',
+                           'category': 'food', 'date': '2024-01-02'}])
+
+    response = APIClient().post(reverse('transactions-batch'), body, content_type='application/msgpack')
+
+    assert response.status_code == 201
+    assert Transaction.objects.get().amount == Decimal('5.00')
@@ -0,0 +1,133 @@
+import datetime
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def users():
+    return [User.objects.create(first_name=f"User{n}", last_name="Doe", email=f"user{n}@example.com")
+            for n in range(3)]
+
+
+@pytest.fixture
+def transactions(users):
+    return [Transaction.objects.create(user=users[n % 3], amount=f"{n}.50", transaction_type=("income", "expense")[n % 2],
+                                       category="food", date=datetime.date(2024, 1, 1 + n % 28))
+            for n in range(7)]
+
+
+@pytest.fixture
+def small_chunks(settings):
+    settings.API_STREAM_CHUNK_SIZE = 2
+
+
+def stream(response):
+    assert response.streaming
+    return list(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_streamed_transactions_match_full_listing(transactions, small_chunks):
+    """
+    Test case: Stream all transactions as a JSON array, fetched two rows at a time.
+
+    Expected Result:
+    - The body arrives in several chunks and is byte-identical to a page holding every transaction.
+    """
+    client = APIClient()
+
+    chunks = stream(client.get(reverse('transactions'), {'stream': '1'}))
+    page = client.get(reverse('transactions'), {'page_size': 100})
+
+    assert len(chunks) > 3
+    assert b''.join(chunks) == page.content
+    assert len(json.loads(b''.join(chunks))) == 7
+
+
+@pytest.mark.django_db
+def test_streamed_transactions_apply_filters(transactions, users, small_chunks):
+    """
+    Test case: Stream the transactions of one user as NDJSON.
+
+    Expected Result:
+    - Each line holds one transaction of that user, in (date, id) order, with the NDJSON content type.
+    """
+    response = APIClient().get(reverse('transactions'), {'stream': 'ndjson', 'user': str(users[0].id)})
+
+    lines = b''.join(stream(response)).splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert response['Content-Type'] == 'application/x-ndjson'
+    assert {row['user'] for row in rows} == {str(users[0].id)}
+    assert len(rows) == 3
+    assert [(row['date'], row['id']) for row in rows] == sorted((row['date'], row['id']) for row in rows)
+
+
+@pytest.mark.django_db
+def test_streamed_empty_list():
+    """
+    Test case: Stream a list with no rows.
+
+    Expected Result:
+    - The body is an empty JSON array.
+    """
+    assert b''.join(stream(APIClient().get(reverse('transactions'), {'stream': 'json'}))) == b'[]'
+
+
+@pytest.mark.django_db
+def test_streamed_users_match_full_listing(users, small_chunks):
+    """
+    Test case: Stream all users as a JSON array.
+
+    Expected Result:
+    - The body is byte-identical to a page holding every user.
+    """
+    client = APIClient()
+
+    body = b''.join(stream(client.get(reverse('users'), {'stream': 'true'})))
+
+    assert body == client.get(reverse('users'), {'page_size': 100}).content
+
+
+@pytest.mark.django_db
+def test_streamed_reports(small_chunks):
+    """
+    Test case: Stream all reports as NDJSON.
+
+    Expected Result:
+    - Each line holds one report, with the same data as the regular list.
+    """
+    for day in range(1, 6):
+        TransactionReport.objects.create(total_income="10.00", total_expense="2.50", net_income="7.50",
+                                         start_date=datetime.date(2024, 1, day), end_date=datetime.date(2024, 2, day))
+    client = APIClient()
+
+    lines = b''.join(stream(client.get(reverse('reports'), {'stream': 'ndjson'}))).splitlines()
+
+    streamed = sorted((json.loads(line) for line in lines), key=lambda row: row['id'])
+    assert streamed == sorted(client.get(reverse('reports')).json(), key=lambda row: row['id'])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url', ['transactions', 'users', 'reports'])
+def test_stream_disabled_or_invalid(url):
+    """
+    Test case: Pass `stream=0` and an unknown stream format.
+
+    Expected Result:
+    - `stream=0` returns the regular response; an unknown format returns 400.
+    """
+    client = APIClient()
+
+    regular = client.get(reverse(url), {'stream': '0'})
+    invalid = client.get(reverse(url), {'stream': 'xml'})
+
+    assert regular.status_code == 200 and not regular.streaming
+    assert invalid.status_code == 400
+    assert 'stream' in invalid.json()
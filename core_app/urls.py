@@ -4,9 +4,11 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
 from export_app.views import ExportTransactionsCSVView, ExportReportsCSVView
+from export_jobs_app.views import ExportJobListView, ExportJobDetailsView, ExportJobDownloadView
+from import_app.views import ImportTransactionsView
 from reports_app.views import ReportListView, ReportDetailsView
-from transactions_app.views import TransactionListView, TransactionDetailsView
-from users_app.views import UserListView, UserDetailsView
+from transactions_app.views import TransactionBatchView, TransactionBulkView, TransactionListView, TransactionDetailsView
+from users_app.views import UserListView, UserDetailsView, UserPurgeDetailsView
 
 # from django.contrib import admin
 from django.urls import path, re_path
@@ -31,11 +33,18 @@ urlpatterns = [
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path('users', UserListView.as_view(), name='users'),
     path('users/<uuid:id>/', UserDetailsView.as_view(), name='user-detail'),
+    path('users/purges/<uuid:id>/', UserPurgeDetailsView.as_view(), name='user-purge-detail'),
     path('transactions', TransactionListView.as_view(), name='transactions'),
+    path('transactions/batch', TransactionBatchView.as_view(), name='transactions-batch'),
+    path('transactions/bulk', TransactionBulkView.as_view(), name='transactions-bulk'),
     path('transactions/<uuid:id>/', TransactionDetailsView.as_view(), name='transaction-detail'),
     path('reports', ReportListView.as_view(), name='reports'),
     path('reports/<uuid:id>/', ReportDetailsView.as_view(), name='report-detail'),
     path('export/transactions', ExportTransactionsCSVView.as_view(), name='export-transactions'),
     path('export/reports', ExportReportsCSVView.as_view(), name='export-reports'),
+    path('export/jobs', ExportJobListView.as_view(), name='export-jobs'),
+    path('export/jobs/<uuid:id>/', ExportJobDetailsView.as_view(), name='export-job-detail'),
+    path('export/jobs/<uuid:id>/download', ExportJobDownloadView.as_view(), name='export-job-download'),
+    path('import/transactions', ImportTransactionsView.as_view(), name='import-transactions'),
 
 ]
@@ -0,0 +1,33 @@
+from typing import Any
+
+from rest_framework import serializers
+
+from export_app.service.columnar_export_service_impl import columnar_formats_available
+from export_app.service.content_negotiation import ARROW, CSV, PARQUET
+from export_app.service.export_compression import CODEC_LEVELS, GZIP, IDENTITY, ZSTD, available_codecs
+
+
+class ExportOptionsSerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(required=False, choices=[CSV, ARROW, PARQUET])
+    compression = serializers.ChoiceField(required=False, choices=[GZIP, ZSTD, IDENTITY])
+    compression_level = serializers.IntegerField(required=False)
+    after = serializers.UUIDField(required=False)
+
+    def validate_export_format(self, value: str) -> str:
+        if value != CSV and not columnar_formats_available():
+            raise serializers.ValidationError(f"Format {value} is not available.")
+        return value
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        compression = data.get('compression')
+        if compression not in (None, IDENTITY) and compression not in available_codecs():
+            raise serializers.ValidationError({'compression': f"Compression {compression} is not available."})
+        if 'compression_level' in data:
+            levels = CODEC_LEVELS.get(compression or '')
+            if levels is None:
+                raise serializers.ValidationError(
+                    {'compression_level': "Compression level requires gzip or zstd compression."})
+            if data['compression_level'] not in levels:
+                raise serializers.ValidationError(
+                    {'compression_level': f"Compression level must be between {levels.start} and {levels.stop - 1}."})
+        return data
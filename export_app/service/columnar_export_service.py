@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from django.db.models import QuerySet
+
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+
+
+class ColumnarExportService(ABC):
+    """
+    Abstract class that defines the interface for columnar (Apache Arrow IPC and Parquet) exports.
+    Implementations encode a queryset in batches of typed columns and yield the encoded bytes
+    as soon as each batch is written.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def stream_transactions(transactions: QuerySet[Transaction], export_format: str) -> Iterator[bytes]:
+        """
+        Encode the given transactions in a columnar format, batch by batch.
+
+        :param transactions: The queryset of transactions to export.
+        :param export_format: The columnar format to produce ('arrow' or 'parquet').
+        :return: An iterator of encoded chunks forming one Arrow IPC stream or Parquet file.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def stream_reports(reports: QuerySet[TransactionReport], export_format: str) -> Iterator[bytes]:
+        """
+        Encode the given transaction reports in a columnar format, batch by batch.
+
+        :param reports: The queryset of reports to export.
+        :param export_format: The columnar format to produce ('arrow' or 'parquet').
+        :return: An iterator of encoded chunks forming one Arrow IPC stream or Parquet file.
+        """
+        pass
@@ -0,0 +1,170 @@
+import logging
+from typing import Any, Iterator, Sequence
+
+from django.conf import settings
+from django.db import models
+from django.db.models import QuerySet
+
+from export_app.service.columnar_export_service import ColumnarExportService
+from export_app.service.content_negotiation import ARROW, PARQUET
+from export_app.service.export_service import REPORT_CSV_COLUMNS, TRANSACTION_CSV_COLUMNS
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # columnar exports are optional
+    pyarrow = None
+
+
+def columnar_formats_available() -> bool:
+    return pyarrow is not None
+
+
+class ColumnarExportServiceImpl(ColumnarExportService):
+    """
+    Columnar export backend built on pyarrow.
+
+    Rows are read as plain tuples through a server-side cursor, ``EXPORT_CHUNK_SIZE`` at a time, and turned into
+    one record batch per fetch. Column types are derived from the model fields: decimals keep their precision and
+    scale, dates become ``date32``, UUIDs use the Arrow UUID type and strings are dictionary encoded.
+    """
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def stream_transactions(transactions: QuerySet[Transaction], export_format: str) -> Iterator[bytes]:
+        ColumnarExportServiceImpl.logger.info(f"Streaming transactions {export_format} export")
+        return ColumnarExportServiceImpl._stream_batches(transactions, TRANSACTION_CSV_COLUMNS, export_format)
+
+    @staticmethod
+    def stream_reports(reports: QuerySet[TransactionReport], export_format: str) -> Iterator[bytes]:
+        ColumnarExportServiceImpl.logger.info(f"Streaming reports {export_format} export")
+        return ColumnarExportServiceImpl._stream_batches(reports, REPORT_CSV_COLUMNS, export_format)
+
+    @staticmethod
+    def build_schema(model: type[models.Model], columns: Sequence[tuple[str, str]]) -> Any:
+        value_fields = ColumnarExportServiceImpl._value_fields(model, columns)
+        return pyarrow.schema([
+            pyarrow.field(header, ColumnarExportServiceImpl._arrow_type(value_field),
+                          nullable=model._meta.get_field(field).null)
+            for (header, field), value_field in zip(columns, value_fields)
+        ])
+
+    @staticmethod
+    def _value_fields(model: type[models.Model], columns: Sequence[tuple[str, str]]) -> list[models.Field]:
+        """
+        Resolve the model fields holding the exported values, following foreign keys to the referenced field.
+        """
+        fields = [model._meta.get_field(field) for _, field in columns]
+        return [field.target_field if field.is_relation else field for field in fields]
+
+    @staticmethod
+    def _arrow_type(field: models.Field) -> Any:
+        if isinstance(field, models.UUIDField):
+            return pyarrow.uuid() if hasattr(pyarrow, 'uuid') else pyarrow.binary(16)
+        if isinstance(field, models.DecimalField):
+            return pyarrow.decimal128(field.max_digits, field.decimal_places)
+        if isinstance(field, models.DateField) and not isinstance(field, models.DateTimeField):
+            return pyarrow.date32()
+        if isinstance(field, models.CharField):
+            index_type = pyarrow.int8() if field.choices else pyarrow.int32()
+            return pyarrow.dictionary(index_type, pyarrow.string())
+        raise TypeError(f"No Arrow type for field {field.name!r}")
+
+    @staticmethod
+    def _build_array(values: Sequence[Any], arrow_type: Any, field: models.Field) -> Any:
+        if pyarrow.types.is_dictionary(arrow_type):
+            if field.choices:
+                dictionary = [value for value, _ in field.choices]
+                positions = {value: position for position, value in enumerate(dictionary)}
+                indices = pyarrow.array([positions.get(value) for value in values], arrow_type.index_type)
+                return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(dictionary, pyarrow.string()))
+            return pyarrow.array(values, pyarrow.string()).dictionary_encode().cast(arrow_type)
+        if isinstance(field, models.UUIDField):
+            return pyarrow.array([None if value is None else value.bytes for value in values], arrow_type)
+        return pyarrow.array(values, arrow_type)
+
+    @staticmethod
+    def _stream_batches(queryset: QuerySet, columns: Sequence[tuple[str, str]],
+                        export_format: str) -> Iterator[bytes]:
+        if pyarrow is None:
+            raise RuntimeError("Columnar exports require the pyarrow package")
+
+        schema = ColumnarExportServiceImpl.build_schema(queryset.model, columns)
+        batches = ColumnarExportServiceImpl._record_batches(queryset, columns, schema)
+        sink = _ChunkSink()
+        if export_format == ARROW:
+            writer = pyarrow.ipc.new_stream(sink, schema)
+            for batch in batches:
+                writer.write_batch(batch)
+                yield sink.drain()
+        elif export_format == PARQUET:
+            # Batches are grouped so that row groups are large enough for efficient columnar scans.
+            writer = pyarrow.parquet.ParquetWriter(sink, schema, compression=settings.EXPORT_PARQUET_COMPRESSION)
+            row_group: list = []
+            row_group_rows = 0
+            for batch in batches:
+                row_group.append(batch)
+                row_group_rows += batch.num_rows
+                if row_group_rows >= settings.EXPORT_PARQUET_ROW_GROUP_SIZE:
+                    writer.write_table(pyarrow.Table.from_batches(row_group, schema))
+                    row_group, row_group_rows = [], 0
+                    yield sink.drain()
+            if row_group:
+                writer.write_table(pyarrow.Table.from_batches(row_group, schema))
+        else:
+            raise ValueError(f"Unsupported columnar format: {export_format!r}")
+        writer.close()
+        yield sink.drain()
+
+    @staticmethod
+    def _record_batches(queryset: QuerySet, columns: Sequence[tuple[str, str]], schema: Any) -> Iterator[Any]:
+        value_fields = ColumnarExportServiceImpl._value_fields(queryset.model, columns)
+        chunk_size = settings.EXPORT_CHUNK_SIZE
+        rows = queryset.values_list(*[field for _, field in columns]).iterator(chunk_size=chunk_size)
+        batch: list[tuple] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield ColumnarExportServiceImpl._build_batch(batch, schema, value_fields)
+                batch = []
+        if batch:
+            yield ColumnarExportServiceImpl._build_batch(batch, schema, value_fields)
+
+    @staticmethod
+    def _build_batch(rows: list[tuple], schema: Any, value_fields: list[models.Field]) -> Any:
+        arrays = [ColumnarExportServiceImpl._build_array(values, schema.field(index).type, value_fields[index])
+                  for index, values in enumerate(zip(*rows))]
+        return pyarrow.record_batch(arrays, schema=schema)
+
+
+class _ChunkSink:
+    """
+    Write-only file-like object collecting the bytes pyarrow writes until the generator drains them.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        chunk = bytes(self.buffer)
+        self.buffer.clear()
+        return chunk
@@ -0,0 +1,57 @@
+from typing import Optional
+
+CSV = 'csv'
+ARROW = 'arrow'
+PARQUET = 'parquet'
+
+FORMAT_MEDIA_TYPES = {
+    CSV: 'text/csv',
+    ARROW: 'application/vnd.apache.arrow.stream',
+    PARQUET: 'application/vnd.apache.parquet',
+}
+
+FORMAT_FILE_EXTENSIONS = {
+    CSV: 'csv',
+    ARROW: 'arrows',
+    PARQUET: 'parquet',
+}
+
+
+def parse_quality_values(header: str) -> dict[str, float]:
+    """
+    Parse an ``Accept``-style header into a mapping of lower-cased values to their quality (``q``) weights.
+    """
+    weights: dict[str, float] = {}
+    for entry in header.split(','):
+        value, *params = entry.split(';')
+        value = value.strip().lower()
+        if not value:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, weight = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(weight)
+                except ValueError:
+                    quality = 0.0
+        weights[value] = quality
+    return weights
+
+
+def negotiate_format(accept: str, formats: tuple[str, ...]) -> str:
+    """
+    Pick the export format for an ``Accept`` header among the given formats, listed in server preference order.
+
+    Exact media types take precedence over ``type/*`` and ``*/*`` wildcards; if the client accepts none
+    of the formats, the first one is used, so plain clients keep receiving CSV.
+    """
+    weights = parse_quality_values(accept)
+    candidates = []
+    for rank, export_format in enumerate(formats):
+        media_type = FORMAT_MEDIA_TYPES[export_format]
+        main_type = media_type.split('/')[0]
+        quality = weights.get(media_type, weights.get(f'{main_type}/*', weights.get('*/*', 0.0)))
+        candidates.append((quality, -rank, export_format))
+    quality, _, export_format = max(candidates)
+    return export_format if quality > 0 else formats[0]
@@ -0,0 +1,162 @@
+import logging
+import queue
+import threading
+from typing import Any, Iterator, Sequence
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.db.models import Field, QuerySet
+from django.db.models.options import Options
+
+from export_app.service.export_service import ExportService, REPORT_CSV_COLUMNS, TRANSACTION_CSV_COLUMNS
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+
+_COPY_DONE = object()
+
+
+class CopyExportServiceImpl(ExportService):
+    """
+    PostgreSQL export backend that lets the database encode the CSV.
+
+    The queryset is compiled into ``COPY (SELECT ...) TO STDOUT WITH CSV HEADER`` and the raw output
+    is forwarded in ``EXPORT_COPY_BUFFER_SIZE`` chunks, so no Python model objects or row tuples are created.
+    """
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def stream_transactions_csv(transactions: QuerySet[Transaction], header: bool = True) -> Iterator[bytes]:
+        CopyExportServiceImpl.logger.info("Streaming transactions CSV export with COPY")
+        return CopyExportServiceImpl._stream_copy(transactions, TRANSACTION_CSV_COLUMNS, header)
+
+    @staticmethod
+    def stream_reports_csv(reports: QuerySet[TransactionReport], header: bool = True) -> Iterator[bytes]:
+        CopyExportServiceImpl.logger.info("Streaming reports CSV export with COPY")
+        return CopyExportServiceImpl._stream_copy(reports, REPORT_CSV_COLUMNS, header)
+
+    @staticmethod
+    def build_copy_sql(queryset: QuerySet, columns: Sequence[tuple[str, str]], header: bool = True) -> str:
+        """
+        Compile the queryset into a ``COPY ... TO STDOUT`` statement producing the given columns.
+
+        COPY does not accept bind parameters, so the query parameters are interpolated client-side
+        with the driver's own quoting. The queryset ordering is repeated on the outer query, since
+        PostgreSQL does not guarantee that a subquery's ORDER BY carries over; it may only use exported fields.
+        """
+        connection = connections[queryset.db]
+        quote = connection.ops.quote_name
+        meta = queryset.model._meta
+        fields = [field for _, field in columns]
+
+        sql, params = queryset.values_list(*fields).query.sql_with_params()
+        select = connection.ops.compose_sql(sql, params)
+        projection = ', '.join(f'{quote(meta.get_field(field).column)} AS {quote(header)}'
+                               for header, field in columns)
+        ordering = ''
+        if queryset.query.order_by:
+            ordering = ' ORDER BY ' + ', '.join(
+                f'{quote(CopyExportServiceImpl._ordering_field(meta, name).column)}'
+                f'{" DESC" if name.startswith("-") else ""}'
+                for name in queryset.query.order_by)
+        options = 'CSV HEADER' if header else 'CSV'
+        return f'COPY (SELECT {projection} FROM ({select}) AS export{ordering}) TO STDOUT WITH {options}'
+
+    @staticmethod
+    def _ordering_field(meta: Options, name: str) -> Field:
+        name = name.lstrip('-')
+        return meta.pk if name == 'pk' else meta.get_field(name)
+
+    @staticmethod
+    def _stream_copy(queryset: QuerySet, columns: Sequence[tuple[str, str]], header: bool) -> Iterator[bytes]:
+        sql = CopyExportServiceImpl.build_copy_sql(queryset, columns, header)
+        connection = connections[queryset.db]
+        with connection.cursor() as cursor:
+            if is_psycopg3:
+                yield from CopyExportServiceImpl._stream_psycopg3(cursor.cursor, sql)
+            else:
+                yield from CopyExportServiceImpl._stream_psycopg2(connection, cursor.cursor, sql)
+
+    @staticmethod
+    def _stream_psycopg3(raw_cursor: Any, sql: str) -> Iterator[bytes]:
+        buffer_size = settings.EXPORT_COPY_BUFFER_SIZE
+        buffer = bytearray()
+        with raw_cursor.copy(sql) as copy:
+            for data in copy:
+                buffer += data
+                if len(buffer) >= buffer_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    @staticmethod
+    def _stream_psycopg2(connection: BaseDatabaseWrapper, raw_cursor: Any, sql: str) -> Iterator[bytes]:
+        """
+        psycopg2 can only COPY into a file object, so the COPY runs in a helper thread that writes
+        into a bounded queue while this generator hands the chunks to the response.
+        If the client goes away, the running query is cancelled on the server.
+        """
+        chunks: queue.Queue = queue.Queue(maxsize=settings.EXPORT_COPY_QUEUE_SIZE)
+        sink = _QueueWriter(chunks, settings.EXPORT_COPY_BUFFER_SIZE)
+
+        def run_copy() -> None:
+            try:
+                raw_cursor.copy_expert(sql, sink)
+                sink.flush()
+                chunks.put(_COPY_DONE)
+            except BaseException as exc:
+                chunks.put(exc)
+
+        worker = threading.Thread(target=run_copy, name='export-copy', daemon=True)
+        worker.start()
+        finished = False
+        try:
+            while True:
+                item = chunks.get()
+                if item is _COPY_DONE:
+                    finished = True
+                    return
+                if isinstance(item, BaseException):
+                    finished = True
+                    raise item
+                yield item
+        finally:
+            if not finished:
+                sink.discard = True
+                raw_cursor.connection.cancel()
+                if connection.in_atomic_block:
+                    connection.needs_rollback = True
+                while worker.is_alive() or not chunks.empty():
+                    try:
+                        chunks.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+            worker.join()
+
+
+class _QueueWriter:
+    """
+    Minimal file-like sink for ``copy_expert`` that coalesces the per-row writes of COPY
+    into large chunks before handing them to the consumer queue.
+    """
+
+    def __init__(self, chunks: queue.Queue, buffer_size: int) -> None:
+        self.chunks = chunks
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.discard = False
+
+    def write(self, data: bytes) -> int:
+        if self.discard:
+            return len(data)
+        self.buffer += data
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        if self.buffer and not self.discard:
+            self.chunks.put(bytes(self.buffer))
+        self.buffer.clear()
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.db import connection
+
+from export_app.service.copy_export_service_impl import CopyExportServiceImpl
+from export_app.service.export_service import ExportService
+from export_app.service.export_service_impl import ExportServiceImpl
+from export_app.service.parallel_export_service_impl import ParallelExportServiceImpl
+
+EXPORT_BACKENDS: dict[str, type[ExportService]] = {
+    'copy': CopyExportServiceImpl,
+    'orm': ExportServiceImpl,
+    'parallel': ParallelExportServiceImpl,
+}
+
+
+def get_export_service() -> type[ExportService]:
+    """
+    Return the export backend configured by ``settings.EXPORT_BACKEND``.
+
+    ``'auto'`` picks the COPY backend on PostgreSQL and falls back to the ORM-based writer
+    on any other database.
+    """
+    backend = settings.EXPORT_BACKEND
+    if backend == 'auto':
+        backend = 'copy' if connection.vendor == 'postgresql' else 'orm'
+    try:
+        return EXPORT_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown export backend: {settings.EXPORT_BACKEND!r}")
@@ -0,0 +1,56 @@
+import hashlib
+import json
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+EXPORT_CACHE_ALIAS = 'exports'
+
+# Options that only change the transfer encoding, not the exported data.
+TRANSFER_OPTIONS = ('compression', 'compression_level')
+
+
+def export_etag(kind: str, version: str, export_format: str, filters: Mapping[str, Any],
+                options: Mapping[str, Any]) -> str:
+    """
+    Build the weak ETag of an export from the data version of the exported table and the export parameters.
+
+    The ETag is weak because the same data may be sent with different content codings.
+    """
+    parameters = {
+        'filters': filters,
+        'options': {name: value for name, value in options.items() if name not in TRANSFER_OPTIONS},
+    }
+    digest = hashlib.sha256(f'{kind}:{version}:{export_format}:'.encode())
+    digest.update(json.dumps(parameters, sort_keys=True, default=str).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def get_cached_export(etag: str) -> Optional[bytes]:
+    """
+    Return the uncompressed body of the export with the given ETag, if it is cached.
+    """
+    return caches[EXPORT_CACHE_ALIAS].get(_cache_key(etag))
+
+
+def cache_export(etag: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Pass the chunks of an export through, caching the whole body under its ETag once the last chunk is sent.
+
+    Exports are only cached when fully consumed and no larger than ``EXPORT_CACHE_MAX_BYTES``,
+    so aborted downloads and huge files never end up in the cache.
+    """
+    body: Optional[bytearray] = bytearray()
+    for chunk in chunks:
+        if body is not None:
+            body += chunk
+            if len(body) > settings.EXPORT_CACHE_MAX_BYTES:
+                body = None
+        yield chunk
+    if body is not None:
+        caches[EXPORT_CACHE_ALIAS].set(_cache_key(etag), bytes(body))
+
+
+def _cache_key(etag: str) -> str:
+    return f'export:{etag[3:-1]}'
@@ -0,0 +1,72 @@
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from export_app.service.content_negotiation import parse_quality_values
+
+try:
+    import zstandard
+except ImportError:  # zstd support is optional
+    zstandard = None
+
+GZIP = 'gzip'
+ZSTD = 'zstd'
+IDENTITY = 'identity'
+
+# Codecs in server preference order, used to break ties between equally weighted Accept-Encoding entries.
+CODEC_PREFERENCE = (ZSTD, GZIP)
+
+CODEC_LEVELS = {
+    GZIP: range(1, 10),
+    ZSTD: range(1, 23),
+}
+
+CODEC_CONTENT_TYPES = {
+    GZIP: 'application/gzip',
+    ZSTD: 'application/zstd',
+}
+
+CODEC_FILE_EXTENSIONS = {
+    GZIP: 'gz',
+    ZSTD: 'zst',
+}
+
+
+def available_codecs() -> tuple[str, ...]:
+    """
+    Return the compression codecs supported by this installation, in server preference order.
+    """
+    return tuple(codec for codec in CODEC_PREFERENCE if codec != ZSTD or zstandard is not None)
+
+
+def negotiate_codec(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the codec for a response from an ``Accept-Encoding`` header.
+
+    The entry with the highest quality value wins, ties are broken by `CODEC_PREFERENCE`.
+    Returns None if the client accepts none of the available codecs.
+    """
+    weights = parse_quality_values(accept_encoding)
+    wildcard = weights.get('*', 0.0)
+    candidates = [(weights.get(codec, wildcard), -rank, codec) for rank, codec in enumerate(available_codecs())]
+    quality, _, codec = max(candidates, default=(0.0, 0, None))
+    return codec if quality > 0 else None
+
+
+def compress_stream(chunks: Iterable[bytes], codec: str, level: int) -> Iterator[bytes]:
+    """
+    Compress a stream of chunks incrementally, yielding compressed data as soon as the codec emits it.
+
+    Only the codec's own window is kept in memory, never the whole file.
+    """
+    if codec == GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    elif codec == ZSTD and zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    else:
+        raise ValueError(f"Unsupported compression codec: {codec!r}")
+
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
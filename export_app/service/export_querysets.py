@@ -0,0 +1,54 @@
+from typing import Any, Mapping, Optional
+from uuid import UUID
+
+from django.db.models import QuerySet
+
+from reports_app.models import TransactionReport
+from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
+from transactions_app.models import Transaction
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+
+
+def get_transactions_for_export(filters: Mapping[str, Any], after: Optional[UUID] = None) -> QuerySet[Transaction]:
+    """
+    Build the transactions queryset of an export from the validated `TransactionFilterSerializer` data.
+
+    Rows are ordered by primary key, so an interrupted export can be resumed after the last received id.
+    """
+    transactions = TransactionServiceImpl.filter_transactions(
+        start_date=filters.get('start_date'),
+        end_date=filters.get('end_date'),
+        user_id=filters.get('user'),
+        category=filters.get('category'),
+        transaction_type=filters.get('transaction_type'),
+        min_amount=filters.get('min_amount'),
+        max_amount=filters.get('max_amount')
+    )
+    return resume_after(transactions, after)
+
+
+def get_reports_for_export(filters: Mapping[str, Any], after: Optional[UUID] = None) -> QuerySet[TransactionReport]:
+    """
+    Build the reports queryset of an export from the validated `ReportFilterSerializer` data.
+
+    Rows are ordered by primary key, so an interrupted export can be resumed after the last received id.
+    """
+    reports = TransactionReportServiceImpl.filter_reports(
+        start_date=filters.get('start_date'),
+        end_date=filters.get('end_date')
+    )
+    return resume_after(reports, after)
+
+
+def resume_after(queryset: QuerySet, after: Optional[UUID]) -> QuerySet:
+    """
+    Order the queryset by primary key and skip the rows up to and including ``after``.
+
+    The skip is a keyset condition on the primary key index rather than an OFFSET,
+    so resuming costs the same as reading the remaining rows. On the partitioned transactions table, the
+    condition is one index range scan per partition, merged in primary key order.
+    """
+    queryset = queryset.order_by('pk')
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+    return queryset
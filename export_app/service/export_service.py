@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from django.db.models import QuerySet
+
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+
+# Pairs of (CSV header, model field) describing the columns of every export.
+TRANSACTION_CSV_COLUMNS = (
+    ('Id', 'id'),
+    ('amount', 'amount'),
+    ('date', 'date'),
+    ('transaction_type', 'transaction_type'),
+    ('category', 'category'),
+    ('user_id', 'user_id'),
+)
+
+REPORT_CSV_COLUMNS = (
+    ('id', 'id'),
+    ('start_date', 'start_date'),
+    ('end_Date', 'end_date'),
+    ('total_income', 'total_income'),
+    ('total_expense', 'total_expense'),
+    ('net_income', 'net_income'),
+)
+
+
+class ExportService(ABC):
+    """
+    Abstract class that defines the interface for CSV export functionality.
+    Implementations turn a queryset into an iterator of encoded CSV chunks, so the caller
+    can stream the file without holding all rows in memory.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def stream_transactions_csv(transactions: QuerySet[Transaction], header: bool = True) -> Iterator[bytes]:
+        """
+        Encode the given transactions as CSV, chunk by chunk.
+
+        :param transactions: The queryset of transactions to export.
+        :param header: Whether to start with the header row; resumed exports leave it out.
+        :return: An iterator of UTF-8 encoded CSV chunks.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def stream_reports_csv(reports: QuerySet[TransactionReport], header: bool = True) -> Iterator[bytes]:
+        """
+        Encode the given transaction reports as CSV, chunk by chunk.
+
+        :param reports: The queryset of reports to export.
+        :param header: Whether to start with the header row; resumed exports leave it out.
+        :return: An iterator of UTF-8 encoded CSV chunks.
+        """
+        pass
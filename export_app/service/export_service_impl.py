@@ -0,0 +1,58 @@
+import csv
+import io
+import logging
+from typing import Iterator, Sequence
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from export_app.service.export_service import ExportService, REPORT_CSV_COLUMNS, TRANSACTION_CSV_COLUMNS
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+
+
+class ExportServiceImpl(ExportService):
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def stream_transactions_csv(transactions: QuerySet[Transaction], header: bool = True) -> Iterator[bytes]:
+        ExportServiceImpl.logger.info("Streaming transactions CSV export")
+        return ExportServiceImpl._stream_csv(transactions, TRANSACTION_CSV_COLUMNS, header)
+
+    @staticmethod
+    def stream_reports_csv(reports: QuerySet[TransactionReport], header: bool = True) -> Iterator[bytes]:
+        ExportServiceImpl.logger.info("Streaming reports CSV export")
+        return ExportServiceImpl._stream_csv(reports, REPORT_CSV_COLUMNS, header)
+
+    @staticmethod
+    def _stream_csv(queryset: QuerySet, columns: Sequence[tuple[str, str]], header: bool) -> Iterator[bytes]:
+        """
+        Read plain value tuples through a server-side cursor and yield one CSV chunk per fetched batch.
+
+        Only the selected columns are fetched (``user_id`` is read straight from the foreign key column),
+        so neither model instances nor related objects are created and memory stays bounded by the chunk size.
+        """
+        chunk_size = settings.EXPORT_CHUNK_SIZE
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if header:
+            writer.writerow([name for name, _ in columns])
+
+        rows = queryset.values_list(*[field for _, field in columns]).iterator(chunk_size=chunk_size)
+        pending = 0
+        for row in rows:
+            writer.writerow(row)
+            pending += 1
+            if pending == chunk_size:
+                yield ExportServiceImpl._drain(buffer)
+                pending = 0
+        tail = ExportServiceImpl._drain(buffer)
+        if tail:
+            yield tail
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> bytes:
+        chunk = buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
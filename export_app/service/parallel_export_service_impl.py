@@ -0,0 +1,153 @@
+import collections
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import QuerySet
+
+from export_app.service.copy_export_service_impl import CopyExportServiceImpl
+from export_app.service.export_service import ExportService
+from export_app.service.export_service_impl import ExportServiceImpl
+from export_app.service.parallel_export_worker import export_partition, init_worker
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+
+# Backends that encode the partitions inside the worker processes.
+PARTITION_BACKENDS: dict[str, type[ExportService]] = {
+    'copy': CopyExportServiceImpl,
+    'orm': ExportServiceImpl,
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_key: Optional[tuple[int, str, str]] = None
+_pool_lock = threading.Lock()
+
+
+class ParallelExportServiceImpl(ExportService):
+    """
+    Export backend that encodes a table in parallel worker processes.
+
+    The primary key space is split into ``EXPORT_PARALLEL_WORKERS * EXPORT_PARALLEL_PARTITIONS_PER_WORKER``
+    ranges. Each range is encoded by a worker process with its own database connection and the configured
+    ``EXPORT_PARALLEL_BACKEND``, into a temporary file. The files are streamed in key order, so the output
+    is the same as a single-connection export ordered by primary key.
+
+    On PostgreSQL all workers read from one snapshot exported by the coordinating connection,
+    so the stitched file is as consistent as a single query.
+    """
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def stream_transactions_csv(transactions: QuerySet[Transaction], header: bool = True) -> Iterator[bytes]:
+        ParallelExportServiceImpl.logger.info("Streaming transactions CSV export with parallel workers")
+        return ParallelExportServiceImpl._stream_partitions(transactions, 'stream_transactions_csv', header)
+
+    @staticmethod
+    def stream_reports_csv(reports: QuerySet[TransactionReport], header: bool = True) -> Iterator[bytes]:
+        ParallelExportServiceImpl.logger.info("Streaming reports CSV export with parallel workers")
+        return ParallelExportServiceImpl._stream_partitions(reports, 'stream_reports_csv', header)
+
+    @staticmethod
+    def partition_bounds(partitions: int) -> list[tuple[Optional[uuid.UUID], Optional[uuid.UUID]]]:
+        """
+        Split the UUID key space into contiguous ``[lower, upper)`` ranges of equal width.
+
+        Primary keys are random UUIDs, so equal-width ranges hold about the same number of rows
+        and can be computed without scanning the table. The outer ranges are left open.
+        """
+        points = [uuid.UUID(int=index * 2 ** 128 // partitions) for index in range(1, partitions)]
+        return list(zip([None, *points], [*points, None]))
+
+    @staticmethod
+    def _stream_partitions(queryset: QuerySet, method: str, header: bool) -> Iterator[bytes]:
+        workers = settings.EXPORT_PARALLEL_WORKERS
+        bounds = ParallelExportServiceImpl.partition_bounds(workers * settings.EXPORT_PARALLEL_PARTITIONS_PER_WORKER)
+        backend = ParallelExportServiceImpl._partition_backend(queryset.db)
+        connection = connections[queryset.db]
+        snapshot_connection = connection.copy() if connection.vendor == 'postgresql' else None
+        pool = _get_pool(workers, queryset.db, connection.settings_dict['NAME'])
+        # Only a couple of finished partitions may wait on disk for a slow client.
+        pending: collections.deque[Future] = collections.deque()
+        try:
+            snapshot = ParallelExportServiceImpl._export_snapshot(snapshot_connection)
+            for index, (lower, upper) in enumerate(bounds):
+                partition = queryset
+                if lower is not None:
+                    partition = partition.filter(pk__gte=lower)
+                if upper is not None:
+                    partition = partition.filter(pk__lt=upper)
+                pending.append(pool.submit(export_partition, backend, method, partition.query, queryset.db,
+                                           header and index == 0, snapshot, settings.EXPORT_PARALLEL_TMP_DIR))
+                if len(pending) >= 2 * workers:
+                    yield from ParallelExportServiceImpl._read_partition(pending.popleft())
+            while pending:
+                yield from ParallelExportServiceImpl._read_partition(pending.popleft())
+        finally:
+            for future in pending:
+                if not future.cancel():
+                    future.add_done_callback(_remove_partition_file)
+            if snapshot_connection is not None:
+                snapshot_connection.close()
+
+    @staticmethod
+    def _partition_backend(alias: str) -> str:
+        backend = settings.EXPORT_PARALLEL_BACKEND
+        if backend == 'auto':
+            backend = 'copy' if connections[alias].vendor == 'postgresql' else 'orm'
+        if backend not in PARTITION_BACKENDS:
+            raise ValueError(f"Unknown parallel export backend: {settings.EXPORT_PARALLEL_BACKEND!r}")
+        return backend
+
+    @staticmethod
+    def _export_snapshot(snapshot_connection: Optional[BaseDatabaseWrapper]) -> Optional[str]:
+        """
+        Open a repeatable read transaction on the coordinating connection and export its snapshot.
+
+        The transaction stays open until the export finishes, which keeps the snapshot importable by the workers.
+        """
+        if snapshot_connection is None:
+            return None
+        snapshot_connection.set_autocommit(False)
+        with snapshot_connection.cursor() as cursor:
+            cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY')
+            cursor.execute('SELECT pg_export_snapshot()')
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _read_partition(future: Future) -> Iterator[bytes]:
+        path = future.result()
+        try:
+            with open(path, 'rb') as partition_file:
+                while chunk := partition_file.read(settings.EXPORT_COPY_BUFFER_SIZE):
+                    yield chunk
+        finally:
+            os.remove(path)
+
+
+def _get_pool(workers: int, alias: str, database_name: str) -> ProcessPoolExecutor:
+    """
+    Return the process-local worker pool, recreating it if the worker count or database changed.
+
+    Workers are spawned rather than forked, so they never inherit the parent's database connections or threads.
+    """
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is None or _pool_key != (workers, alias, database_name):
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                        initializer=init_worker, initargs=(alias, database_name))
+            _pool_key = (workers, alias, database_name)
+        return _pool
+
+
+def _remove_partition_file(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        os.remove(future.result())
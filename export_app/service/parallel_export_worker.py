@@ -0,0 +1,52 @@
+"""
+Entry points of the worker processes of `ParallelExportServiceImpl`.
+
+Spawned workers import this module to unpickle the functions before Django is set up,
+so it must not import models at module level; the export backends are imported per task,
+once `init_worker` has populated the app registry.
+"""
+import os
+import tempfile
+from typing import Any, Optional
+
+import django
+from django.conf import settings
+from django.db import connections, transaction
+
+
+def init_worker(alias: str, database_name: str) -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core_app.settings')
+    django.setup()
+    # The parent may run against another database than configured, e.g. the test database.
+    settings.DATABASES[alias]['NAME'] = database_name
+    connections[alias].settings_dict['NAME'] = database_name
+
+
+def export_partition(backend: str, method: str, query: Any, alias: str, header: bool,
+                     snapshot: Optional[str], tmp_dir: Optional[str]) -> str:
+    """
+    Encode one partition into a temporary file and return its path.
+
+    With a snapshot, the partition is read in a transaction importing it, so all partitions see the same data.
+    """
+    from export_app.service.parallel_export_service_impl import PARTITION_BACKENDS
+
+    queryset = query.model._default_manager.using(alias).all()
+    queryset.query = query
+    stream = getattr(PARTITION_BACKENDS[backend], method)
+    partition_file = tempfile.NamedTemporaryFile(dir=tmp_dir, suffix='.csv.part', delete=False)
+    try:
+        with partition_file, transaction.atomic(using=alias):
+            if snapshot is not None:
+                with connections[alias].cursor() as cursor:
+                    cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY')
+                    cursor.execute('SET TRANSACTION SNAPSHOT %s', [snapshot])
+            for chunk in stream(queryset, header=header):
+                partition_file.write(chunk)
+    except BaseException:
+        os.remove(partition_file.name)
+        raise
+    finally:
+        # Idle workers must not hold connections, the snapshot is per task anyway.
+        connections.close_all()
+    return partition_file.name
@@ -0,0 +1,124 @@
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from export_app.service.content_negotiation import ARROW, CSV, PARQUET, negotiate_format
+from transactions_app.models import Transaction
+from users_app.models import User
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+requires_pyarrow = pytest.mark.skipif(pyarrow is None, reason="pyarrow is not installed")
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def transactions():
+    user = User.objects.create(id=uuid.uuid4(), first_name="John", last_name="Doe", email="john@example.com")
+    return [Transaction.objects.create(amount=Decimal('10.25') + i, date='2024-01-01',
+                                       transaction_type='income' if i % 2 else 'expense',
+                                       category='salary', user=user) for i in range(5)]
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ('', CSV),
+    ('*/*', CSV),
+    ('application/vnd.apache.arrow.stream', ARROW),
+    ('application/vnd.apache.parquet, text/csv;q=0.5', PARQUET),
+    ('text/csv;q=0.2, application/vnd.apache.arrow.stream;q=0.8', ARROW),
+    ('application/json', CSV),
+])
+def test_negotiate_format(accept, expected):
+    """Test Accept negotiation honours quality values and falls back to the first format."""
+    assert negotiate_format(accept, (CSV, ARROW, PARQUET)) == expected
+
+
+@requires_pyarrow
+@pytest.mark.django_db
+def test_export_transactions_arrow(api_client, transactions, settings):
+    """Test the Arrow stream keeps the column types and spans one record batch per chunk."""
+    settings.EXPORT_CHUNK_SIZE = 2
+    response = api_client.get(reverse('export-transactions'), HTTP_ACCEPT='application/vnd.apache.arrow.stream')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/vnd.apache.arrow.stream'
+    assert response['Content-Disposition'] == 'attachment; filename="transactions.arrows"'
+    assert 'Accept' in response['Vary']
+
+    reader = pyarrow.ipc.open_stream(b''.join(response.streaming_content))
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    schema = reader.schema
+    assert schema.names == ['Id', 'amount', 'date', 'transaction_type', 'category', 'user_id']
+    assert schema.field('amount').type == pyarrow.decimal128(10, 2)
+    assert schema.field('date').type == pyarrow.date32()
+    assert pyarrow.types.is_dictionary(schema.field('transaction_type').type)
+
+    table = pyarrow.Table.from_batches(batches)
+    assert sorted(table.column('amount').to_pylist()) == [t.amount for t in transactions]
+    assert set(table.column('transaction_type').to_pylist()) == {'income', 'expense'}
+    ids = [value if isinstance(value, uuid.UUID) else uuid.UUID(bytes=value)
+           for value in table.column('Id').to_pylist()]
+    assert set(ids) == {t.id for t in transactions}
+
+
+@requires_pyarrow
+@pytest.mark.django_db
+def test_export_transactions_parquet(api_client, transactions):
+    """Test the export_format query parameter selects Parquet, which is not compressed again on the wire."""
+    response = api_client.get(reverse('export-transactions'), {'export_format': 'parquet'}, HTTP_ACCEPT_ENCODING='gzip')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/vnd.apache.parquet'
+    assert response['Content-Disposition'] == 'attachment; filename="transactions.parquet"'
+    assert 'Content-Encoding' not in response
+
+    table = pyarrow.parquet.read_table(io.BytesIO(b''.join(response.streaming_content)))
+    assert table.num_rows == len(transactions)
+    assert table.schema.field('amount').type == pyarrow.decimal128(10, 2)
+
+
+@requires_pyarrow
+@pytest.mark.django_db
+def test_export_reports_arrow_with_filters(api_client):
+    """Test report exports support the Arrow format and keep an empty result readable."""
+    response = api_client.get(reverse('export-reports'), {'export_format': 'arrow', 'start_date': '2024-01-01'})
+
+    assert response.status_code == status.HTTP_200_OK
+    reader = pyarrow.ipc.open_stream(b''.join(response.streaming_content))
+    assert reader.read_all().num_rows == 0
+    assert reader.schema.field('net_income').type == pyarrow.decimal128(10, 2)
+
+
+@pytest.mark.django_db
+def test_export_unknown_format(api_client):
+    """Test an unknown format is rejected."""
+    response = api_client.get(reverse('export-transactions'), {'export_format': 'xlsx'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'export_format' in response.json()
+
+
+@pytest.mark.django_db
+def test_export_error_with_export_media_type_accepted(api_client):
+    """Test errors are rendered as JSON to a client accepting only an export media type, not rejected with 406."""
+    response = api_client.get(reverse('export-transactions'), {'export_format': 'xlsx'},
+                              HTTP_ACCEPT='application/vnd.apache.parquet')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response['Content-Type'].startswith('application/json')
+    assert 'export_format' in response.json()
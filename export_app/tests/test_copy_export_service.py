@@ -0,0 +1,110 @@
+import csv
+import io
+
+import pytest
+
+from export_app.service.copy_export_service_impl import CopyExportServiceImpl
+from export_app.service.export_backends import get_export_service
+from export_app.service.export_service_impl import ExportServiceImpl
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.fixture
+def transactions(user):
+    return [
+        Transaction.objects.create(amount=100.00, date='2024-01-01', transaction_type='income',
+                                   category='salary', user=user),
+        Transaction.objects.create(amount=50.50, date='2024-01-02', transaction_type='expense',
+                                   category='food, drinks', user=user),
+    ]
+
+
+def read_csv(chunks):
+    return list(csv.reader(io.StringIO(b''.join(chunks).decode('utf-8'))))
+
+
+@pytest.mark.django_db
+def test_copy_export_matches_orm_export(transactions):
+    """Test that the COPY backend produces the same header and rows as the ORM backend.
+
+    This test exports the same transactions with both backends and compares the parsed CSV.
+    """
+    copy_rows = read_csv(CopyExportServiceImpl.stream_transactions_csv(Transaction.objects.all()))
+    orm_rows = read_csv(ExportServiceImpl.stream_transactions_csv(Transaction.objects.all()))
+
+    assert copy_rows[0] == ['Id', 'amount', 'date', 'transaction_type', 'category', 'user_id']
+    assert copy_rows[0] == orm_rows[0]
+    assert sorted(copy_rows[1:]) == sorted(orm_rows[1:])
+    assert len(copy_rows) == len(transactions) + 1
+
+
+@pytest.mark.django_db
+def test_copy_export_reports_header():
+    """Test that the COPY backend keeps the report CSV header of the ORM backend."""
+    TransactionReport.objects.create(total_income=10, total_expense=5, net_income=5,
+                                     start_date='2024-01-01', end_date='2024-01-31')
+
+    rows = read_csv(CopyExportServiceImpl.stream_reports_csv(TransactionReport.objects.all()))
+
+    assert rows[0] == ['id', 'start_date', 'end_Date', 'total_income', 'total_expense', 'net_income']
+    assert rows[1][1:] == ['2024-01-01', '2024-01-31', '10.00', '5.00', '5.00']
+
+
+@pytest.mark.django_db
+def test_copy_export_uses_large_buffers(transactions, settings):
+    """Test that COPY output is coalesced into buffers of at least EXPORT_COPY_BUFFER_SIZE bytes.
+
+    With a tiny buffer every row becomes its own chunk, the last chunk may be shorter.
+    """
+    settings.EXPORT_COPY_BUFFER_SIZE = 1
+    chunks = list(CopyExportServiceImpl.stream_transactions_csv(Transaction.objects.all()))
+    assert len(chunks) == len(transactions) + 1
+
+    settings.EXPORT_COPY_BUFFER_SIZE = 1024 * 1024
+    chunks = list(CopyExportServiceImpl.stream_transactions_csv(Transaction.objects.all()))
+    assert len(chunks) == 1
+
+
+@pytest.mark.django_db
+def test_copy_export_applies_queryset_filters(transactions, user):
+    """Test that filters of the queryset are compiled into the COPY statement."""
+    queryset = Transaction.objects.filter(category='food, drinks', user=user)
+
+    rows = read_csv(CopyExportServiceImpl.stream_transactions_csv(queryset))
+
+    assert len(rows) == 2
+    assert rows[1][0] == str(transactions[1].id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_export_closed_early_leaves_connection_usable(transactions, settings):
+    """Test that abandoning a COPY stream cancels the query and keeps the connection usable."""
+    settings.EXPORT_COPY_BUFFER_SIZE = 1
+    stream = CopyExportServiceImpl.stream_transactions_csv(Transaction.objects.all())
+    next(stream)
+    stream.close()
+
+    assert Transaction.objects.count() == len(transactions)
+
+
+def test_get_export_service(settings):
+    """Test that the export backend is selected from settings with the ORM writer as fallback."""
+    settings.EXPORT_BACKEND = 'orm'
+    assert get_export_service() is ExportServiceImpl
+
+    settings.EXPORT_BACKEND = 'copy'
+    assert get_export_service() is CopyExportServiceImpl
+
+    settings.EXPORT_BACKEND = 'auto'
+    assert get_export_service() is CopyExportServiceImpl
+
+    settings.EXPORT_BACKEND = 'unknown'
+    with pytest.raises(ValueError):
+        get_export_service()
@@ -0,0 +1,119 @@
+import uuid
+
+import pytest
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from export_app.service.export_cache import EXPORT_CACHE_ALIAS
+from transactions_app.models import Transaction
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+
+
+@pytest.fixture(autouse=True)
+def export_cache():
+    cache = caches[EXPORT_CACHE_ALIAS]
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(id=uuid.uuid4(), first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.fixture
+def transactions(user, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        return [TransactionServiceImpl.create_transaction(user.id, 10 + i, 'income', 'salary', '2024-01-01')
+                for i in range(3)]
+
+
+@pytest.mark.django_db
+def test_unchanged_export_is_not_modified(api_client, transactions, django_assert_num_queries):
+    """Test polling with the ETag of an unchanged export returns 304 without querying the transactions."""
+    response = api_client.get(reverse('export-transactions'))
+    b''.join(response.streaming_content)
+    assert response['ETag'].startswith('W/"')
+    assert 'no-cache' in response['Cache-Control']
+
+    with django_assert_num_queries(1):
+        not_modified = api_client.get(reverse('export-transactions'), HTTP_IF_NONE_MATCH=response['ETag'])
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified['ETag'] == response['ETag']
+    assert 'Accept-Encoding' in not_modified['Vary']
+
+
+@pytest.mark.django_db
+def test_unchanged_export_is_served_from_cache(api_client, transactions, django_assert_num_queries):
+    """Test a repeated export is answered with the cached bytes, compressed per request."""
+    body = b''.join(api_client.get(reverse('export-transactions')).streaming_content)
+
+    with django_assert_num_queries(1):
+        response = api_client.get(reverse('export-transactions'))
+        cached = b''.join(response.streaming_content)
+    assert cached == body
+
+    with django_assert_num_queries(1):
+        compressed = api_client.get(reverse('export-transactions'), {'compression': 'gzip'})
+    assert compressed['Content-Disposition'] == 'attachment; filename="transactions.csv.gz"'
+    assert compressed['ETag'] == response['ETag']
+
+
+@pytest.mark.django_db
+def test_write_invalidates_export(api_client, transactions, user, django_capture_on_commit_callbacks):
+    """Test a write through the service layer changes the ETag and regenerates the export."""
+    response = api_client.get(reverse('export-transactions'))
+    b''.join(response.streaming_content)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        new_transaction = TransactionServiceImpl.create_transaction(user.id, 99, 'expense', 'food', '2024-01-02')
+    refreshed = api_client.get(reverse('export-transactions'), HTTP_IF_NONE_MATCH=response['ETag'])
+
+    assert refreshed.status_code == status.HTTP_200_OK
+    assert refreshed['ETag'] != response['ETag']
+    assert str(new_transaction.id).encode() in b''.join(refreshed.streaming_content)
+
+
+@pytest.mark.django_db
+def test_etag_depends_on_filters_and_format(api_client, transactions):
+    """Test different filter sets and formats get different ETags."""
+    all_rows = api_client.get(reverse('export-transactions'))
+    filtered = api_client.get(reverse('export-transactions'), {'category': 'salary'})
+    resumed = api_client.get(reverse('export-transactions'), {'after': str(transactions[0].id)})
+
+    assert len({all_rows['ETag'], filtered['ETag'], resumed['ETag']}) == 3
+
+
+@pytest.mark.django_db
+def test_partial_and_large_exports_are_not_cached(api_client, transactions, export_cache, settings):
+    """Test aborted downloads and exports above EXPORT_CACHE_MAX_BYTES never reach the cache."""
+    settings.EXPORT_CHUNK_SIZE = 1
+    settings.EXPORT_BACKEND = 'orm'
+    response = api_client.get(reverse('export-transactions'))
+    next(iter(response.streaming_content))
+    assert not export_cache._cache
+
+    settings.EXPORT_CACHE_MAX_BYTES = 10
+    b''.join(api_client.get(reverse('export-transactions')).streaming_content)
+    assert not export_cache._cache
+
+
+@pytest.mark.django_db
+def test_unchanged_reports_export_is_not_modified(api_client):
+    """Test report exports are versioned by the report table."""
+    response = api_client.get(reverse('export-reports'))
+    b''.join(response.streaming_content)
+
+    not_modified = api_client.get(reverse('export-reports'), HTTP_IF_NONE_MATCH=f'"x", {response["ETag"]}')
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,137 @@
+import gzip
+import uuid
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from export_app.service import export_compression
+from export_app.service.export_compression import compress_stream, negotiate_codec
+from transactions_app.models import Transaction
+from users_app.models import User
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+requires_zstandard = pytest.mark.skipif(zstandard is None, reason="zstandard is not installed")
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def transactions():
+    user = User.objects.create(id=uuid.uuid4(), first_name="John", last_name="Doe", email="john@example.com")
+    return [Transaction.objects.create(amount=10 + i, date='2024-01-01', transaction_type='income',
+                                       category='salary', user=user) for i in range(3)]
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ('', None),
+    ('gzip', 'gzip'),
+    ('gzip, deflate, br, zstd', 'zstd'),
+    ('zstd;q=0.5, gzip', 'gzip'),
+    ('gzip;q=0, zstd;q=0', None),
+    ('*', 'zstd'),
+    ('br', None),
+])
+def test_negotiate_codec(accept_encoding, expected, monkeypatch):
+    """Test Accept-Encoding negotiation honours quality values and the server preference."""
+    monkeypatch.setattr(export_compression, 'zstandard', zstandard or mock.Mock())
+    assert negotiate_codec(accept_encoding) == expected
+
+
+def test_negotiate_codec_without_zstandard(monkeypatch):
+    """Test zstd is never negotiated when the zstandard package is missing."""
+    monkeypatch.setattr(export_compression, 'zstandard', None)
+    assert negotiate_codec('zstd, gzip;q=0.1') == 'gzip'
+
+
+@requires_zstandard
+def test_compress_stream_is_incremental():
+    """Test chunks are compressed one by one and round-trip to the original data."""
+    chunks = [f'{i},row\n'.encode() * 1000 for i in range(20)]
+
+    gzip_output = list(compress_stream(iter(chunks), 'gzip', 1))
+    zstd_output = list(compress_stream(iter(chunks), 'zstd', 1))
+
+    assert len(gzip_output) > 1
+    assert gzip.decompress(b''.join(gzip_output)) == b''.join(chunks)
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(b''.join(zstd_output)) == b''.join(chunks)
+
+
+@pytest.mark.django_db
+def test_export_transactions_accept_encoding(api_client, transactions):
+    """
+    Test case: Export transactions to a client that accepts gzip.
+
+    Expected Result:
+    - The CSV is sent with Content-Encoding gzip and varies on Accept-Encoding.
+    """
+    response = api_client.get(reverse('export-transactions'), HTTP_ACCEPT_ENCODING='gzip')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'text/csv'
+    assert response['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response['Vary']
+    csv_content = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8').splitlines()
+    assert len(csv_content) == len(transactions) + 1
+
+
+@requires_zstandard
+@pytest.mark.django_db
+def test_export_reports_compression_parameter(api_client):
+    """
+    Test case: Download the reports export as a zstd file through the compression parameter.
+
+    Expected Result:
+    - The response is a .csv.zst attachment without Content-Encoding.
+    """
+    response = api_client.get(reverse('export-reports'), {'compression': 'zstd', 'compression_level': 19})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/zstd'
+    assert response['Content-Disposition'] == 'attachment; filename="reports.csv.zst"'
+    assert not response.has_header('Content-Encoding')
+    csv_content = zstandard.ZstdDecompressor().decompressobj().decompress(b''.join(response.streaming_content))
+    assert csv_content.decode('utf-8').startswith('id,start_date,end_Date')
+
+
+@pytest.mark.django_db
+def test_export_transactions_identity_overrides_accept_encoding(api_client, transactions):
+    """
+    Test case: Ask for an uncompressed export although the client accepts gzip.
+
+    Expected Result:
+    - The CSV is sent without Content-Encoding.
+    """
+    response = api_client.get(reverse('export-transactions'), {'compression': 'identity'},
+                              HTTP_ACCEPT_ENCODING='gzip')
+
+    assert not response.has_header('Content-Encoding')
+    assert b''.join(response.streaming_content).decode('utf-8').startswith('Id,amount')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params, field", [
+    ({'compression': 'brotli'}, 'compression'),
+    ({'compression': 'gzip', 'compression_level': 12}, 'compression_level'),
+    ({'compression_level': 3}, 'compression_level'),
+])
+def test_export_transactions_invalid_compression(api_client, params, field):
+    """
+    Test case: Attempt to export with an unknown codec or an out-of-range level.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request) with an error for the offending parameter.
+    """
+    response = api_client.get(reverse('export-transactions'), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.data
@@ -34,7 +34,32 @@ def test_export_transactions_csv(api_client):
     assert response['Content-Type'] == 'text/csv'
     assert response['Content-Disposition'] == 'attachment; filename="reports.csv"'
 
-    csv_content = response.content.decode('utf-8').splitlines()
+    csv_content = b''.join(response.streaming_content).decode('utf-8').splitlines()
     assert csv_content[0] == 'id,start_date,end_Date,total_income,total_expense,net_income'
-    assert csv_content[1].split(",")[0] == str(transaction_report1.id)
-    assert csv_content[2].split(",")[0] == str(transaction_report2.id)
+    # Rows are exported in primary key order.
+    assert [line.split(",")[0] for line in csv_content[1:]] == sorted([str(transaction_report1.id), str(transaction_report2.id)])
+
+
+@pytest.mark.django_db
+def test_export_reports_csv_filtered_by_dates(api_client):
+    TransactionReport.objects.create(total_income=1500.0, total_expense=500.0, net_income=1000,
+                                     start_date=datetime(year=2023, month=3, day=1).date(),
+                                     end_date=datetime(year=2023, month=4, day=1).date())
+    april_report = TransactionReport.objects.create(total_income=2500.0, total_expense=500.0, net_income=2000,
+                                                    start_date=datetime(year=2023, month=4, day=1).date(),
+                                                    end_date=datetime(year=2023, month=5, day=1).date())
+
+    response = api_client.get(reverse('export-reports'), {'start_date': '2023-04-01', 'end_date': '2023-05-31'})
+    assert response.status_code == status.HTTP_200_OK
+
+    csv_content = b''.join(response.streaming_content).decode('utf-8').splitlines()
+    assert len(csv_content) == 2
+    assert csv_content[1].split(",")[0] == str(april_report.id)
+
+
+@pytest.mark.django_db
+def test_export_reports_csv_invalid_dates(api_client):
+    response = api_client.get(reverse('export-reports'), {'start_date': 'invalid'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'start_date' in response.data
@@ -0,0 +1,96 @@
+import csv
+import io
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from export_app.service.copy_export_service_impl import CopyExportServiceImpl
+from export_app.service.export_querysets import get_transactions_for_export
+from export_app.service.export_service import TRANSACTION_CSV_COLUMNS
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def transactions():
+    user = User.objects.create(id=uuid.uuid4(), first_name="John", last_name="Doe", email="john@example.com")
+    return [Transaction.objects.create(amount=10 + i, date=f'2024-01-{i + 1:02d}', transaction_type='income',
+                                       category='salary', user=user) for i in range(6)]
+
+
+def read_csv(response):
+    return list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("backend", ['copy', 'orm'])
+def test_resume_transactions_export(api_client, transactions, settings, backend):
+    """Test an export resumed after the last received id yields exactly the remaining rows, in id order."""
+    settings.EXPORT_BACKEND = backend
+    full = read_csv(api_client.get(reverse('export-transactions')))
+    assert [row[0] for row in full[1:]] == sorted(str(t.id) for t in transactions)
+
+    received = full[:4]
+    response = api_client.get(reverse('export-transactions'), {'after': received[-1][0]})
+    assert response.status_code == status.HTTP_200_OK
+    assert response['X-Export-Resume-Column'] == 'Id'
+
+    assert received + read_csv(response) == full
+
+
+@pytest.mark.django_db
+def test_resume_reports_export(api_client):
+    """Test report exports can be resumed after a report id."""
+    for month in range(1, 4):
+        TransactionReport.objects.create(start_date=f'2024-{month:02d}-01', end_date=f'2024-{month:02d}-28',
+                                         total_income=10, total_expense=5, net_income=5)
+    full = read_csv(api_client.get(reverse('export-reports')))
+
+    response = api_client.get(reverse('export-reports'), {'after': full[1][0]})
+
+    assert response['X-Export-Resume-Column'] == 'id'
+    assert full[:2] + read_csv(response) == full
+
+
+@pytest.mark.django_db
+def test_resume_uses_keyset_condition(transactions):
+    """Test resuming filters on the primary key instead of skipping rows with OFFSET."""
+    after = min(t.id for t in transactions)
+    queryset = get_transactions_for_export({}, after)
+
+    with CaptureQueriesContext(connection) as queries:
+        list(queryset.values_list('id', flat=True))
+    sql = queries.captured_queries[0]['sql']
+
+    assert '"id" >' in sql
+    assert 'OFFSET' not in sql
+    assert 'ORDER BY' in sql
+
+
+@pytest.mark.django_db
+def test_copy_sql_repeats_ordering_outside_subquery():
+    """Test the COPY statement orders the outer query and leaves out the header when asked to."""
+    sql = CopyExportServiceImpl.build_copy_sql(Transaction.objects.order_by('pk'), TRANSACTION_CSV_COLUMNS,
+                                               header=False)
+
+    assert sql.endswith('AS export ORDER BY "id") TO STDOUT WITH CSV')
+
+
+@pytest.mark.django_db
+def test_resume_with_invalid_token(api_client):
+    """Test a malformed resume token is rejected."""
+    response = api_client.get(reverse('export-transactions'), {'after': 'not-a-uuid'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'after' in response.json()
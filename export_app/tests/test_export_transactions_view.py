@@ -8,6 +8,7 @@ from rest_framework.test import APIClient
 from transactions_app.models import Transaction
 from transactions_app.tests.test_transaction_list_view import transaction
 from users_app.models import User
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
 
 
 @pytest.fixture
@@ -29,7 +30,66 @@ def test_export_transactions_csv(api_client, user):
     assert response['Content-Type'] == 'text/csv'
     assert response['Content-Disposition'] == 'attachment; filename="transactions.csv"'
 
-    csv_content = response.content.decode('utf-8').splitlines()
+    csv_content = b''.join(response.streaming_content).decode('utf-8').splitlines()
     assert csv_content[0] == 'Id,amount,date,transaction_type,category,user_id'
-    assert csv_content[1].split(",")[0] == str(transaction1.id)
-    assert csv_content[2].split(",")[0] == str(transaction2.id)
+    # Rows are exported in primary key order.
+    assert [line.split(",")[0] for line in csv_content[1:]] == sorted([str(transaction1.id), str(transaction2.id)])
+
+
+@pytest.mark.django_db
+def test_export_transactions_csv_streams_in_chunks(api_client, user, settings, django_assert_num_queries):
+    settings.EXPORT_BACKEND = 'orm'
+    settings.EXPORT_CHUNK_SIZE = 2
+    transactions = [Transaction.objects.create(amount=10 + i, date='2024-01-01', transaction_type='income',
+                                               category='salary', user=user) for i in range(5)]
+    DataVersionServiceImpl.get_version(Transaction)
+
+    # One query reads the data version, one streams the rows.
+    with django_assert_num_queries(2):
+        response = api_client.get(reverse('export-transactions'))
+        chunks = list(response.streaming_content)
+
+    assert response.streaming
+    assert len(chunks) == 3
+    csv_content = b''.join(chunks).decode('utf-8').splitlines()
+    assert len(csv_content) == len(transactions) + 1
+    assert {line.split(",")[0] for line in csv_content[1:]} == {str(t.id) for t in transactions}
+    assert all(line.split(",")[5] == str(user.id) for line in csv_content[1:])
+
+
+@pytest.mark.django_db
+def test_export_transactions_csv_filtered(api_client, user):
+    other_user = User.objects.create(first_name="Jane", last_name="Doe", email="jane@example.com")
+    january_salary = Transaction.objects.create(amount=100.00, date='2024-01-15', transaction_type='income',
+                                                category='salary', user=user)
+    Transaction.objects.create(amount=50.00, date='2024-01-20', transaction_type='expense', category='food',
+                               user=user)
+    Transaction.objects.create(amount=70.00, date='2024-02-01', transaction_type='income', category='salary',
+                               user=user)
+    Transaction.objects.create(amount=80.00, date='2024-01-10', transaction_type='income', category='salary',
+                               user=other_user)
+
+    response = api_client.get(reverse('export-transactions'), {
+        'start_date': '2024-01-01',
+        'end_date': '2024-01-31',
+        'user': str(user.id),
+        'category': 'salary',
+        'transaction_type': 'income',
+    })
+    assert response.status_code == status.HTTP_200_OK
+
+    csv_content = b''.join(response.streaming_content).decode('utf-8').splitlines()
+    assert len(csv_content) == 2
+    assert csv_content[1].split(",")[0] == str(january_salary.id)
+
+
+@pytest.mark.django_db
+def test_export_transactions_csv_invalid_filters(api_client):
+    response = api_client.get(reverse('export-transactions'), {
+        'start_date': '2024-02-01',
+        'end_date': '2024-01-01',
+        'transaction_type': 'invalid',
+    })
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'transaction_type' in response.data
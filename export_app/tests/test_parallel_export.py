@@ -0,0 +1,84 @@
+import time
+import uuid
+
+import pytest
+
+from export_app.service.export_backends import EXPORT_BACKENDS
+from export_app.service.export_querysets import get_reports_for_export, get_transactions_for_export
+from export_app.service.parallel_export_service_impl import ParallelExportServiceImpl
+from reports_app.models import TransactionReport
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def parallel_settings(settings, tmp_path):
+    settings.EXPORT_PARALLEL_WORKERS = 2
+    settings.EXPORT_PARALLEL_PARTITIONS_PER_WORKER = 3
+    settings.EXPORT_PARALLEL_TMP_DIR = str(tmp_path)
+    return settings
+
+
+@pytest.fixture
+def transactions():
+    user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+    return Transaction.objects.bulk_create([
+        Transaction(amount=i, date='2024-01-01', transaction_type='income' if i % 3 else 'expense',
+                    category='food, drinks' if i % 2 else 'salary', user=user)
+        for i in range(60)
+    ])
+
+
+def test_partition_bounds_cover_key_space():
+    """Test the key ranges are contiguous, open at both ends and of equal width."""
+    bounds = ParallelExportServiceImpl.partition_bounds(4)
+
+    assert bounds == [
+        (None, uuid.UUID('40000000-0000-0000-0000-000000000000')),
+        (uuid.UUID('40000000-0000-0000-0000-000000000000'), uuid.UUID('80000000-0000-0000-0000-000000000000')),
+        (uuid.UUID('80000000-0000-0000-0000-000000000000'), uuid.UUID('c0000000-0000-0000-0000-000000000000')),
+        (uuid.UUID('c0000000-0000-0000-0000-000000000000'), None),
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("backend", ['copy', 'orm'])
+def test_parallel_export_matches_single_connection_export(transactions, parallel_settings, tmp_path, backend):
+    """Test the stitched output of the workers equals an ordered single-connection export, byte for byte."""
+    parallel_settings.EXPORT_PARALLEL_BACKEND = backend
+    filters = {'category': 'salary'}
+
+    parallel = b''.join(ParallelExportServiceImpl.stream_transactions_csv(get_transactions_for_export(filters)))
+    single = b''.join(EXPORT_BACKENDS[backend].stream_transactions_csv(get_transactions_for_export(filters)))
+
+    assert parallel == single
+    assert parallel.count(b'\n') == 31
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_export_resumed_reports(parallel_settings):
+    """Test resumed exports leave out the header in the parallel backend too."""
+    reports = [TransactionReport.objects.create(start_date='2024-01-01', end_date='2024-01-31', total_income=i,
+                                                total_expense=0, net_income=i) for i in range(5)]
+    after = min(report.id for report in reports)
+
+    parallel = b''.join(ParallelExportServiceImpl.stream_reports_csv(get_reports_for_export({}, after),
+                                                                     header=False))
+
+    assert not parallel.startswith(b'id,')
+    assert parallel.count(b'\n') == 4
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_export_cleans_up_when_abandoned(transactions, parallel_settings, tmp_path):
+    """Test the spooled partitions are removed when the client goes away mid-export."""
+    parallel_settings.EXPORT_COPY_BUFFER_SIZE = 16
+    stream = ParallelExportServiceImpl.stream_transactions_csv(get_transactions_for_export({}))
+    next(stream)
+    stream.close()
+
+    deadline = time.monotonic() + 10
+    while list(tmp_path.iterdir()) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert list(tmp_path.iterdir()) == []
@@ -1,86 +1,263 @@
-import csv
-from django.http import HttpResponse
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+from django.conf import settings
+from django.http import HttpResponseBase, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer
 from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
-from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from export_app.serializers import ExportOptionsSerializer
+from export_app.service.export_cache import cache_export, export_etag, get_cached_export
+from export_app.service.columnar_export_service_impl import ColumnarExportServiceImpl, columnar_formats_available
+from export_app.service.content_negotiation import (ARROW, CSV, FORMAT_FILE_EXTENSIONS, FORMAT_MEDIA_TYPES, PARQUET,
+                                                    negotiate_format)
+from export_app.service.export_backends import get_export_service
+from export_app.service.export_compression import (CODEC_CONTENT_TYPES, CODEC_FILE_EXTENSIONS, IDENTITY,
+                                                   compress_stream, negotiate_codec)
+from export_app.service.export_service import REPORT_CSV_COLUMNS, TRANSACTION_CSV_COLUMNS
+from export_app.service.export_querysets import get_reports_for_export, get_transactions_for_export
+from reports_app.models import TransactionReport
+from reports_app.serializers import ReportFilterSerializer
+from transactions_app.models import Transaction
+from transactions_app.serializers import TransactionFilterSerializer
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+EXPORT_QUERY_PARAMETERS = [
+    openapi.Parameter('export_format', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=[CSV, ARROW, PARQUET]),
+    openapi.Parameter('compression', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=['gzip', 'zstd', 'identity']),
+    openapi.Parameter('compression_level', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter('after', openapi.IN_QUERY, type=openapi.TYPE_STRING, format=openapi.FORMAT_UUID,
+                      description="Resume an interrupted export after the row with this id"),
+]
+
+# Column holding the resume token of each row: its primary key, in the order rows are exported.
+EXPORT_RESUME_COLUMNS = {
+    'transactions': TRANSACTION_CSV_COLUMNS[0][0],
+    'reports': REPORT_CSV_COLUMNS[0][0],
+}
+
+
+def select_export_format(request: Request, options: Mapping[str, Any]) -> str:
+    """
+    Return the export format given by the ``export_format`` option, or negotiated from the ``Accept`` header.
+    """
+    if 'export_format' in options:
+        return options['export_format']
+    formats = (CSV, ARROW, PARQUET) if columnar_formats_available() else (CSV,)
+    return negotiate_format(request.META.get('HTTP_ACCEPT', ''), formats)
+
+
+def build_export_response(request: Request, options: Mapping[str, Any], export_format: str,
+                          chunks: Iterator[bytes], basename: str) -> StreamingHttpResponse:
+    """
+    Wrap the chunks of an export into a streaming response, compressing them on the fly if asked to.
+
+    An explicit ``compression`` option turns the download into a compressed file (e.g. ``transactions.csv.gz``).
+    Otherwise the codec is negotiated from ``Accept-Encoding`` and applied as a transparent ``Content-Encoding``;
+    Parquet files are left alone in that case, since their columns are already compressed.
+    """
+    content_type = FORMAT_MEDIA_TYPES[export_format]
+    filename = f'{basename}.{FORMAT_FILE_EXTENSIONS[export_format]}'
+    codec = options.get('compression')
+    explicit = codec is not None
+    if not explicit and export_format != PARQUET:
+        codec = negotiate_codec(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+
+    if codec is None or codec == IDENTITY:
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+    else:
+        level = options.get('compression_level', settings.EXPORT_COMPRESSION_LEVELS[codec])
+        compressed = compress_stream(chunks, codec, level)
+        if explicit:
+            response = StreamingHttpResponse(compressed, content_type=CODEC_CONTENT_TYPES[codec])
+            filename = f'{filename}.{CODEC_FILE_EXTENSIONS[codec]}'
+        else:
+            response = StreamingHttpResponse(compressed, content_type=content_type)
+            response['Content-Encoding'] = codec
+
+    patch_export_vary_headers(response, options)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['X-Export-Resume-Column'] = EXPORT_RESUME_COLUMNS[basename]
+    return response
+
+
+def build_conditional_export_response(request: Request, kind: str, version: str, filters: Mapping[str, Any],
+                                      options: Mapping[str, Any], export_format: str,
+                                      generate: Callable[[], Iterator[bytes]]) -> HttpResponseBase:
+    """
+    Answer an export request from the client's or the server's cache when the exported data has not changed.
+
+    The ETag is derived from the data version of the exported table, so a client that polls with
+    ``If-None-Match`` gets a 304, and any other client is served the cached body, without touching the table.
+    Only on a miss is the export generated, and cached on its way out.
+    """
+    etag = export_etag(kind, version, export_format, filters, options)
+    client_etags = {tag.removeprefix('W/') for tag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))}
+    if etag.removeprefix('W/') in client_etags or '*' in client_etags:
+        response: HttpResponseBase = HttpResponseNotModified()
+        patch_export_vary_headers(response, options)
+    else:
+        cached = get_cached_export(etag)
+        chunks = iter([cached]) if cached is not None else cache_export(etag, generate())
+        response = build_export_response(request, options, export_format, chunks, kind)
+    response['ETag'] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def patch_export_vary_headers(response: HttpResponseBase, options: Mapping[str, Any]) -> None:
+    if 'export_format' not in options:
+        patch_vary_headers(response, ['Accept'])
+    if 'compression' not in options:
+        patch_vary_headers(response, ['Accept-Encoding'])
+
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    """
+    Renderer negotiation of the export views.
+
+    The export format is negotiated by the views themselves and renderers only render error responses, so
+    export media types in ``Accept`` fall back to the first renderer instead of being rejected with a 406.
+    """
+
+    def select_renderer(self, request: Request, renderers: list[BaseRenderer],
+                        format_suffix: Optional[str] = None) -> tuple[BaseRenderer, str]:
+        try:
+            return super().select_renderer(request, renderers, format_suffix)
+        except NotAcceptable:
+            return renderers[0], renderers[0].media_type
+
+
+class BaseExportView(APIView):
+    """
+    Base class of the export views.
+    """
+    content_negotiation_class = ExportContentNegotiation
 
 
-class ExportTransactionsCSVView(APIView):
+class ExportTransactionsCSVView(BaseExportView):
     """
-    API view for exporting all transactions in CSV format.
+    API view for exporting transactions in CSV, Apache Arrow IPC stream or Parquet format.
 
     GET:
-    Returns a CSV file with all transaction data.
+    Returns a file with the transactions matching the optional query filters
+    (start_date, end_date, user, category, transaction_type), or all transactions if none are given.
+    The format is chosen with the `export_format` parameter or the `Accept` header and defaults to CSV.
+    The file is streamed in chunks, so memory usage does not depend on the number of rows.
+    It is compressed with gzip or zstd when requested through `compression` or `Accept-Encoding`.
+    Rows are ordered by id; an interrupted download is resumed by passing the `Id` of the last
+    complete row as `after`, in which case the CSV header is left out so the parts can be concatenated.
+    Responses carry an ETag tied to the data version of the exported table: polling with `If-None-Match`
+    returns 304 until the data changes, and unchanged exports are served from the cache.
     """
 
     @swagger_auto_schema(
-        operation_description="Export all transactions as a CSV file",
+        operation_description="Export transactions as a CSV, Arrow IPC stream or Parquet file",
+        query_serializer=TransactionFilterSerializer,
+        manual_parameters=EXPORT_QUERY_PARAMETERS,
         responses={
-            200: openapi.Response('CSV file with all transaction data')
+            200: openapi.Response('File with transaction data'),
+            304: 'Not Modified',
+            400: 'Bad Request'
         }
     )
-    def get(self, request: Request) -> HttpResponse:
+    def get(self, request: Request) -> HttpResponseBase:
         """
-        Handle GET requests to export all transactions in CSV format.
+        Handle GET requests to export transactions.
 
-        This method retrieves all transactions from the database using `TransactionServiceImpl`
-        and returns them as a downloadable CSV file. The CSV includes transaction details such as ID,
-        amount, date, transaction type, category, and user ID.
+        This method validates the query filters using the `TransactionFilterSerializer` and the export options
+        using the `ExportOptionsSerializer`, retrieves the matching transactions from `TransactionServiceImpl`
+        and streams them as a downloadable file. CSV files are produced by the configured export backend,
+        columnar files by `ColumnarExportServiceImpl`. The file includes transaction details such as ID, amount,
+        date, transaction type, category, and user ID. Unchanged exports are answered with 304 or from the
+        cache. If the filters or options are invalid, it returns the validation errors.
         """
-        transactions = TransactionServiceImpl.get_all_transactions()
+        filter_serializer = TransactionFilterSerializer(data=request.query_params)
+        options_serializer = ExportOptionsSerializer(data=request.query_params)
+        filters_valid = filter_serializer.is_valid()
+        options_valid = options_serializer.is_valid()
+        if not (filters_valid and options_valid):
+            return Response({**filter_serializer.errors, **options_serializer.errors},
+                            status=status.HTTP_400_BAD_REQUEST)
 
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="transactions.csv"'
+        filters = filter_serializer.validated_data
+        options = options_serializer.validated_data
+        export_format = select_export_format(request, options)
+        version = DataVersionServiceImpl.get_version(Transaction)
 
-        writer = csv.writer(response)
-        writer.writerow(['Id', 'amount', 'date', 'transaction_type', 'category', 'user_id'])
-        for transaction in transactions:
-            writer.writerow([transaction.id,
-                             transaction.amount,
-                             transaction.date,
-                             transaction.transaction_type,
-                             transaction.category,
-                             transaction.user.id,
-                             ])
+        def generate() -> Iterator[bytes]:
+            transactions = get_transactions_for_export(filters, options.get('after'))
+            if export_format == CSV:
+                return get_export_service().stream_transactions_csv(transactions, header='after' not in options)
+            return ColumnarExportServiceImpl.stream_transactions(transactions, export_format)
 
-        return response
+        return build_conditional_export_response(request, 'transactions', version, filters, options,
+                                                 export_format, generate)
 
 
-class ExportReportsCSVView(APIView):
+class ExportReportsCSVView(BaseExportView):
     """
-    API view for exporting all reports in CSV format.
+    API view for exporting reports in CSV, Apache Arrow IPC stream or Parquet format.
 
     GET:
-    Returns a CSV file with all report data.
+    Returns a file with the reports whose period lies within the optional start_date and end_date
+    query filters, or all reports if none are given.
+    The format is chosen with the `export_format` parameter or the `Accept` header and defaults to CSV.
+    The file is streamed in chunks, so memory usage does not depend on the number of rows.
+    It is compressed with gzip or zstd when requested through `compression` or `Accept-Encoding`.
+    Rows are ordered by id; an interrupted download is resumed by passing the `id` of the last
+    complete row as `after`, in which case the CSV header is left out so the parts can be concatenated.
+    Responses carry an ETag tied to the data version of the exported table: polling with `If-None-Match`
+    returns 304 until the data changes, and unchanged exports are served from the cache.
     """
 
     @swagger_auto_schema(
-        operation_description="Export all reports as a CSV file",
+        operation_description="Export reports as a CSV, Arrow IPC stream or Parquet file",
+        query_serializer=ReportFilterSerializer,
+        manual_parameters=EXPORT_QUERY_PARAMETERS,
         responses={
-            200: openapi.Response('CSV file with all report data')
+            200: openapi.Response('File with report data'),
+            304: 'Not Modified',
+            400: 'Bad Request'
         }
     )
-    def get(self, request: Request) -> HttpResponse:
+    def get(self, request: Request) -> HttpResponseBase:
         """
-        Handle GET requests to export all reports in CSV format.
+        Handle GET requests to export reports.
 
-        This method retrieves all transaction reports from the database using `TransactionReportServiceImpl`
-        and returns them as a downloadable CSV file. The CSV includes report details such as ID,
-        start date, end date, total income, total expense, and net income.
+        This method validates the query filters using the `ReportFilterSerializer` and the export options
+        using the `ExportOptionsSerializer`, retrieves the matching transaction reports using
+        `TransactionReportServiceImpl` and streams them as a downloadable file. CSV files are produced by the
+        configured export backend, columnar files by `ColumnarExportServiceImpl`. The file includes report details
+        such as ID, start date, end date, total income, total expense, and net income. Unchanged exports are
+        answered with 304 or from the cache. If the filters or options are invalid, it returns the validation errors.
         """
-        reports = TransactionReportServiceImpl.get_all_reports()
+        filter_serializer = ReportFilterSerializer(data=request.query_params)
+        options_serializer = ExportOptionsSerializer(data=request.query_params)
+        filters_valid = filter_serializer.is_valid()
+        options_valid = options_serializer.is_valid()
+        if not (filters_valid and options_valid):
+            return Response({**filter_serializer.errors, **options_serializer.errors},
+                            status=status.HTTP_400_BAD_REQUEST)
 
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="reports.csv"'
+        filters = filter_serializer.validated_data
+        options = options_serializer.validated_data
+        export_format = select_export_format(request, options)
+        version = DataVersionServiceImpl.get_version(TransactionReport)
 
-        writer = csv.writer(response)
-        writer.writerow(['id', 'start_date', 'end_Date', 'total_income', 'total_expense', 'net_income'])
-        for report in reports:
-            writer.writerow([report.id, report.start_date, report.end_date, report.total_income, report.total_expense,
-                             report.net_income])
+        def generate() -> Iterator[bytes]:
+            reports = get_reports_for_export(filters, options.get('after'))
+            if export_format == CSV:
+                return get_export_service().stream_reports_csv(reports, header='after' not in options)
+            return ColumnarExportServiceImpl.stream_reports(reports, export_format)
 
-        return response
+        return build_conditional_export_response(request, 'reports', version, filters, options, export_format,
+                                                 generate)
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ExportJobsAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'export_jobs_app'
@@ -0,0 +1,17 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from export_jobs_app.service.export_job_service_impl import ExportJobServiceImpl
+
+
+class Command(BaseCommand):
+    help = ("Delete the artifacts of export jobs whose expiry time has passed and mark interrupted jobs as failed. "
+            "Meant to be run on a schedule (cron).")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        failed = ExportJobServiceImpl.fail_stale_jobs()
+        if failed:
+            self.stdout.write(self.style.WARNING(f"Marked {failed} interrupted export job(s) as failed"))
+        expired = ExportJobServiceImpl.expire_jobs()
+        self.stdout.write(self.style.SUCCESS(f"Expired {expired} export job(s)"))
@@ -0,0 +1,39 @@
+import uuid
+from django.db import models
+from django.utils import timezone
+
+
+class ExportKind(models.TextChoices):
+    TRANSACTIONS = 'transactions', 'Transactions'
+    REPORTS = 'reports', 'Reports'
+
+
+class ExportJobStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    FINISHED = 'finished', 'Finished'
+    FAILED = 'failed', 'Failed'
+    EXPIRED = 'expired', 'Expired'
+
+
+class ExportJob(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=12, choices=ExportKind.choices)
+    filters = models.JSONField(default=dict)
+    status = models.CharField(max_length=8, choices=ExportJobStatus.choices, default=ExportJobStatus.PENDING)
+    rows_total = models.BigIntegerField(null=True)
+    rows_written = models.BigIntegerField(default=0)
+    file_path = models.CharField(max_length=255, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Refreshed with the progress of a running job; pending and running jobs whose heartbeat is older than
+    # EXPORT_JOBS_STALE_SECONDS were lost with the process that owned them.
+    heartbeat_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(null=True)
+    expires_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'expires_at'], name='export_job_expiry_idx'),
+            models.Index(fields=['status', 'heartbeat_at'], name='export_job_heartbeat_idx'),
+        ]
@@ -0,0 +1,30 @@
+from typing import Any
+
+from rest_framework import serializers
+
+from export_jobs_app.models import ExportJob, ExportKind
+from reports_app.serializers import ReportFilterSerializer
+from transactions_app.serializers import TransactionFilterSerializer
+
+FILTER_SERIALIZERS: dict[str, type[serializers.Serializer]] = {
+    ExportKind.TRANSACTIONS: TransactionFilterSerializer,
+    ExportKind.REPORTS: ReportFilterSerializer,
+}
+
+
+class ExportJobRequestSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=ExportKind.choices)
+    filters = serializers.DictField(required=False, default=dict)
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        filter_serializer = FILTER_SERIALIZERS[data['kind']](data=data['filters'])
+        if not filter_serializer.is_valid():
+            raise serializers.ValidationError({'filters': filter_serializer.errors})
+        data['filters'] = filter_serializer.data
+        return data
+
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ExportJob
+        exclude = ['file_path']
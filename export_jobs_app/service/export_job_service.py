@@ -0,0 +1,71 @@
+import datetime
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from export_jobs_app.models import ExportJob
+
+
+class ExportJobService(ABC):
+    """
+    Abstract class that defines the interface for asynchronous export jobs.
+    This includes creating jobs, generating their CSV artifacts in the background,
+    retrieving their status and expiring finished artifacts.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def create_job(kind: str, filters: dict[str, Any]) -> ExportJob:
+        """
+        Create a new export job and schedule its CSV generation on the background worker pool.
+
+        :param kind: What to export (e.g., 'transactions', 'reports').
+        :param filters: The validated filters of the export, in their serialized form.
+        :return: The created ExportJob instance in the pending state.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def run_job(job_id: uuid.UUID) -> None:
+        """
+        Generate the CSV artifact of a pending export job on disk, recording the progress on the job
+        at most every EXPORT_JOBS_PROGRESS_INTERVAL_SECONDS.
+
+        :param job_id: The ID of the job to run.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def get_job_by_id(job_id: uuid.UUID) -> ExportJob:
+        """
+        Retrieve an export job by its unique ID.
+
+        :param job_id: The ID of the job to retrieve.
+        :return: The ExportJob instance that matches the given ID.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def expire_jobs(now: Optional[datetime.datetime] = None) -> int:
+        """
+        Delete the artifacts of finished jobs whose expiry time has passed and mark the jobs as expired.
+
+        :param now: The reference time, defaults to the current time.
+        :return: The number of expired jobs.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def fail_stale_jobs(now: Optional[datetime.datetime] = None) -> int:
+        """
+        Mark as failed the pending and running jobs without a heartbeat for EXPORT_JOBS_STALE_SECONDS, whose
+        process-local worker is gone, e.g. after a restart. They are not run again once marked.
+
+        :param now: The reference time, defaults to the current time.
+        :return: The number of jobs marked as failed.
+        """
+        pass
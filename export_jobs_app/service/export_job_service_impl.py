@@ -0,0 +1,141 @@
+import datetime
+import logging
+import os
+import time
+import uuid
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from core_app.background import submit_background_task
+from export_app.service.export_backends import get_export_service
+from export_app.service.export_querysets import get_reports_for_export, get_transactions_for_export
+from export_jobs_app.models import ExportJob, ExportJobStatus, ExportKind
+from export_jobs_app.serializers import FILTER_SERIALIZERS
+from export_jobs_app.service.export_job_service import ExportJobService
+
+
+class ExportJobServiceImpl(ExportJobService):
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def create_job(kind: str, filters: dict[str, Any]) -> ExportJob:
+        ExportJobServiceImpl.logger.info(f"Creating a new {kind} export job")
+        job = ExportJob(kind=kind, filters=filters)
+        job.save()
+        submit_background_task(ExportJobServiceImpl.run_job, job.id)
+        return job
+
+    @staticmethod
+    def run_job(job_id: uuid.UUID) -> None:
+        ExportJobServiceImpl.logger.info(f"Running export job with id: {job_id}")
+        jobs = ExportJob.objects.filter(id=job_id)
+        # Claiming the pending job guards against running it after it was marked failed as stale.
+        if not jobs.filter(status=ExportJobStatus.PENDING).update(status=ExportJobStatus.RUNNING,
+                                                                  heartbeat_at=timezone.now()):
+            ExportJobServiceImpl.logger.warning(f"Export job {job_id} is no longer pending, not running it")
+            return
+        job = jobs.get()
+        os.makedirs(settings.EXPORT_JOBS_DIR, exist_ok=True)
+        file_path = os.path.join(settings.EXPORT_JOBS_DIR, f'{job.id}.csv')
+        partial_path = f'{file_path}.part'
+
+        try:
+            queryset = ExportJobServiceImpl._build_queryset(job)
+            jobs.update(rows_total=queryset.count())
+
+            records = _CsvRecordCounter()
+            reported_at = time.monotonic()
+            with open(partial_path, 'wb') as artifact:
+                for chunk in ExportJobServiceImpl._stream_csv(job, queryset):
+                    artifact.write(chunk)
+                    records.feed(chunk)
+                    if time.monotonic() - reported_at >= settings.EXPORT_JOBS_PROGRESS_INTERVAL_SECONDS:
+                        jobs.update(rows_written=records.rows, heartbeat_at=timezone.now())
+                        reported_at = time.monotonic()
+            os.replace(partial_path, file_path)
+        except Exception as exc:
+            ExportJobServiceImpl.logger.exception(f"Export job {job_id} failed")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            jobs.update(status=ExportJobStatus.FAILED, error=str(exc), finished_at=timezone.now())
+            return
+
+        finished_at = timezone.now()
+        jobs.update(status=ExportJobStatus.FINISHED,
+                    rows_written=records.rows,
+                    file_path=file_path,
+                    heartbeat_at=finished_at,
+                    finished_at=finished_at,
+                    expires_at=finished_at + datetime.timedelta(seconds=settings.EXPORT_JOBS_TTL_SECONDS))
+
+    @staticmethod
+    def get_job_by_id(job_id: uuid.UUID) -> ExportJob:
+        ExportJobServiceImpl.logger.info(f"Retrieving export job with id: {job_id}")
+        job = ExportJob.objects.get(id=job_id)
+        return job
+
+    @staticmethod
+    def expire_jobs(now: Optional[datetime.datetime] = None) -> int:
+        now = now or timezone.now()
+        expired_jobs = ExportJob.objects.filter(status=ExportJobStatus.FINISHED, expires_at__lte=now)
+        expired = 0
+        for job in expired_jobs.only('id', 'file_path'):
+            ExportJobServiceImpl.logger.info(f"Expiring export job with id: {job.id}")
+            if job.file_path and os.path.exists(job.file_path):
+                os.remove(job.file_path)
+            expired += ExportJob.objects.filter(id=job.id).update(status=ExportJobStatus.EXPIRED, file_path='')
+        return expired
+
+    @staticmethod
+    def fail_stale_jobs(now: Optional[datetime.datetime] = None) -> int:
+        now = now or timezone.now()
+        stale_before = now - datetime.timedelta(seconds=settings.EXPORT_JOBS_STALE_SECONDS)
+        failed = ExportJob.objects.filter(
+            status__in=[ExportJobStatus.PENDING, ExportJobStatus.RUNNING], heartbeat_at__lt=stale_before,
+        ).update(status=ExportJobStatus.FAILED, error='The export was interrupted, please start a new one',
+                 finished_at=now)
+        if failed:
+            ExportJobServiceImpl.logger.warning(f"Marked {failed} interrupted export job(s) as failed")
+        return failed
+
+    @staticmethod
+    def _build_queryset(job: ExportJob) -> QuerySet:
+        filter_serializer = FILTER_SERIALIZERS[job.kind](data=job.filters)
+        filter_serializer.is_valid(raise_exception=True)
+        if job.kind == ExportKind.TRANSACTIONS:
+            return get_transactions_for_export(filter_serializer.validated_data)
+        return get_reports_for_export(filter_serializer.validated_data)
+
+    @staticmethod
+    def _stream_csv(job: ExportJob, queryset: QuerySet) -> Iterator[bytes]:
+        if job.kind == ExportKind.TRANSACTIONS:
+            return get_export_service().stream_transactions_csv(queryset)
+        return get_export_service().stream_reports_csv(queryset)
+
+
+class _CsvRecordCounter:
+    """
+    Count the data rows of a CSV stream as it is written, whichever backend encoded it.
+
+    Line breaks only end a record outside of quoted fields; quotes inside fields are doubled, so the quoting
+    state flips with every quote character and survives chunk boundaries.
+    """
+
+    def __init__(self, header: bool = True) -> None:
+        self.records = 0
+        self.in_quotes = False
+        self.header = header
+
+    def feed(self, chunk: bytes) -> None:
+        for index, part in enumerate(chunk.split(b'"')):
+            if index:
+                self.in_quotes = not self.in_quotes
+            if not self.in_quotes:
+                self.records += part.count(b'\n')
+
+    @property
+    def rows(self) -> int:
+        return max(self.records - self.header, 0)
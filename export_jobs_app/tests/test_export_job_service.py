@@ -0,0 +1,140 @@
+import datetime
+import os
+import uuid
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from export_jobs_app.models import ExportJob, ExportJobStatus
+from export_jobs_app.service.export_job_service_impl import ExportJobServiceImpl
+from reports_app.models import TransactionReport
+
+
+@pytest.fixture(autouse=True)
+def export_jobs_settings(settings, tmp_path):
+    settings.EXPORT_JOBS_DIR = str(tmp_path)
+    return settings
+
+
+@mock.patch("export_jobs_app.service.export_job_service_impl.submit_background_task")
+@mock.patch.object(ExportJob, "save")
+def test_create_job(mock_job_save: MagicMock, mock_submit: MagicMock):
+    """Test creating an export job schedules it on the worker pool.
+
+    This test mocks the save method of the ExportJob model and the task submission, and asserts
+    that the job is saved and submitted exactly once.
+    """
+    job = ExportJobServiceImpl.create_job('transactions', {'category': 'salary'})
+
+    mock_job_save.assert_called_once()
+    mock_submit.assert_called_once_with(ExportJobServiceImpl.run_job, job.id)
+    assert job.status == ExportJobStatus.PENDING
+
+
+@pytest.mark.django_db
+def test_run_job(tmp_path):
+    """Test running an export job writes the artifact and records the progress."""
+    TransactionReport.objects.create(total_income=10, total_expense=5, net_income=5,
+                                     start_date='2024-01-01', end_date='2024-01-31')
+    job = ExportJob.objects.create(kind='reports')
+
+    ExportJobServiceImpl.run_job(job.id)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FINISHED
+    assert job.rows_total == 1
+    assert job.rows_written == 1
+    assert job.file_path == os.path.join(tmp_path, f'{job.id}.csv')
+    assert job.expires_at > job.finished_at
+    assert not os.path.exists(f'{job.file_path}.part')
+    with open(job.file_path, 'rb') as artifact:
+        assert artifact.read().startswith(b'id,start_date,end_Date')
+
+
+@pytest.mark.django_db
+def test_run_job_fail(tmp_path):
+    """Test a failing export job is marked as failed and leaves no partial artifact."""
+    job = ExportJob.objects.create(kind='transactions')
+
+    with mock.patch("export_jobs_app.service.export_job_service_impl.get_export_service") as mock_backend:
+        mock_backend.return_value.stream_transactions_csv.side_effect = Exception("Database error")
+        ExportJobServiceImpl.run_job(job.id)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FAILED
+    assert job.error == "Database error"
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.django_db
+def test_expire_jobs(tmp_path):
+    """Test expiring jobs deletes only the artifacts whose expiry time has passed."""
+    now = timezone.now()
+    expired_path = tmp_path / 'expired.csv'
+    fresh_path = tmp_path / 'fresh.csv'
+    expired_path.write_bytes(b'id\n')
+    fresh_path.write_bytes(b'id\n')
+    expired_job = ExportJob.objects.create(kind='reports', status=ExportJobStatus.FINISHED,
+                                           file_path=str(expired_path), expires_at=now - datetime.timedelta(minutes=1))
+    fresh_job = ExportJob.objects.create(kind='reports', status=ExportJobStatus.FINISHED,
+                                         file_path=str(fresh_path), expires_at=now + datetime.timedelta(hours=1))
+
+    call_command('expire_export_jobs')
+
+    expired_job.refresh_from_db()
+    fresh_job.refresh_from_db()
+    assert expired_job.status == ExportJobStatus.EXPIRED
+    assert not expired_path.exists()
+    assert fresh_job.status == ExportJobStatus.FINISHED
+    assert fresh_path.exists()
+
+
+@pytest.mark.django_db
+def test_run_job_counts_rows_with_embedded_newlines(settings, django_assert_max_num_queries):
+    """Test the progress counts CSV rows rather than lines, and is recorded at most once per interval."""
+    settings.EXPORT_JOBS_PROGRESS_INTERVAL_SECONDS = 60
+    job = ExportJob.objects.create(kind='reports')
+    chunks = [b'id,name\n1,"multi\nline', b' ""quoted""\n"\n2,plain\n', b'3,"a,b"\n']
+
+    with mock.patch("export_jobs_app.service.export_job_service_impl.get_export_service") as mock_backend, \
+            django_assert_max_num_queries(5):
+        mock_backend.return_value.stream_reports_csv.return_value = iter(chunks)
+        ExportJobServiceImpl.run_job(job.id)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FINISHED
+    assert job.rows_written == 3
+
+
+@pytest.mark.django_db
+def test_fail_stale_jobs():
+    """Test interrupted pending and running jobs are marked failed and are not run afterwards."""
+    now = timezone.now()
+    stale_at = now - datetime.timedelta(hours=1)
+    pending = ExportJob.objects.create(kind='reports', heartbeat_at=stale_at)
+    running = ExportJob.objects.create(kind='reports', status=ExportJobStatus.RUNNING, heartbeat_at=stale_at)
+    alive = ExportJob.objects.create(kind='reports', status=ExportJobStatus.RUNNING, heartbeat_at=now)
+
+    call_command('expire_export_jobs')
+    ExportJobServiceImpl.run_job(pending.id)
+
+    for job in (pending, running, alive):
+        job.refresh_from_db()
+    assert pending.status == running.status == ExportJobStatus.FAILED
+    assert pending.file_path == ''
+    assert alive.status == ExportJobStatus.RUNNING
+
+
+@mock.patch.object(ExportJob, "objects")
+def test_get_job_by_id(mock_job_objects: MagicMock):
+    """Test retrieving an export job by ID."""
+    job = ExportJob(id=uuid.uuid4(), kind='reports')
+    mock_job_objects.get.return_value = job
+
+    result = ExportJobServiceImpl.get_job_by_id(job.id)
+
+    mock_job_objects.get.assert_called_once_with(id=job.id)
+    assert result == job
@@ -0,0 +1,194 @@
+import uuid
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from export_jobs_app.models import ExportJob, ExportJobStatus
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def export_jobs_settings(settings, tmp_path):
+    settings.BACKGROUND_TASKS_EAGER = True
+    settings.EXPORT_JOBS_DIR = str(tmp_path)
+    settings.EXPORT_JOBS_SENDFILE_HEADER = ''
+    return settings
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.fixture
+def transactions(user):
+    return [
+        Transaction.objects.create(amount=100.00, date='2024-01-01', transaction_type='income', category='salary',
+                                   user=user),
+        Transaction.objects.create(amount=50.00, date='2024-02-01', transaction_type='expense', category='food',
+                                   user=user),
+    ]
+
+
+@pytest.mark.django_db
+def test_create_export_job(api_client, transactions, django_capture_on_commit_callbacks):
+    """
+    Test case: Start an asynchronous transactions export and poll it until it is finished.
+
+    Scenario:
+    - Send a POST request to create an export job filtered to January.
+    - Let the background task run and poll the status endpoint.
+
+    Expected Result:
+    - The POST returns 202 (Accepted) with the job ID and a Location header.
+    - The job is finished and reports one exported row.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(reverse('export-jobs'),
+                                   {'kind': 'transactions', 'filters': {'end_date': '2024-01-31'}},
+                                   format='json')
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data['status'] == ExportJobStatus.PENDING
+    assert response['Location'] == reverse('export-job-detail', args=[response.data['id']])
+
+    status_response = api_client.get(response['Location'])
+    assert status_response.status_code == status.HTTP_200_OK
+    assert status_response.data['status'] == ExportJobStatus.FINISHED
+    assert status_response.data['rows_total'] == 1
+    assert status_response.data['rows_written'] == 1
+    assert 'file_path' not in status_response.data
+
+
+@pytest.mark.django_db
+def test_create_export_job_invalid_filters(api_client):
+    """
+    Test case: Attempt to start an export job with invalid filters.
+
+    Scenario:
+    - Send a POST request with an unknown transaction type filter.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request).
+    - No job is created.
+    """
+    response = api_client.post(reverse('export-jobs'),
+                               {'kind': 'transactions', 'filters': {'transaction_type': 'invalid'}},
+                               format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'filters' in response.data
+    assert ExportJob.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_get_export_job_not_found(api_client):
+    """
+    Test case: Poll the status of a job that does not exist.
+
+    Expected Result:
+    - The response status code is 404 (Not Found).
+    """
+    response = api_client.get(reverse('export-job-detail', args=[uuid.uuid4()]))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.data['error'] == 'Export job not found'
+
+
+@pytest.mark.django_db
+def test_download_export_job(api_client, transactions, django_capture_on_commit_callbacks):
+    """
+    Test case: Download the artifact of a finished export job.
+
+    Scenario:
+    - Create an export job for all transactions and let it run.
+    - Send a GET request to the download endpoint.
+
+    Expected Result:
+    - The response status code is 200 (OK) and the file is served as a CSV attachment.
+    - The CSV contains the header and one line per transaction.
+    """
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(reverse('export-jobs'), {'kind': 'transactions'}, format='json')
+
+    download = api_client.get(reverse('export-job-download', args=[response.data['id']]))
+
+    assert download.status_code == status.HTTP_200_OK
+    assert download['Content-Disposition'] == 'attachment; filename="transactions.csv"'
+    csv_content = b''.join(download.streaming_content).decode('utf-8').splitlines()
+    assert csv_content[0] == 'Id,amount,date,transaction_type,category,user_id'
+    assert len(csv_content) == len(transactions) + 1
+
+
+@pytest.mark.django_db
+def test_download_export_job_with_sendfile_header(api_client, transactions, export_jobs_settings,
+                                                  django_capture_on_commit_callbacks):
+    """
+    Test case: Download an artifact when the transfer is handed off to the web server.
+
+    Expected Result:
+    - The response carries the configured sendfile header pointing at the artifact and no body.
+    """
+    export_jobs_settings.EXPORT_JOBS_SENDFILE_HEADER = 'X-Accel-Redirect'
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(reverse('export-jobs'), {'kind': 'reports'}, format='json')
+
+    download = api_client.get(reverse('export-job-download', args=[response.data['id']]))
+
+    assert download.status_code == status.HTTP_200_OK
+    assert download['X-Accel-Redirect'] == f"/protected-exports/{response.data['id']}.csv"
+    assert download.content == b''
+
+
+@pytest.mark.django_db
+def test_download_export_job_not_finished(api_client):
+    """
+    Test case: Attempt to download the artifact of a job that is still pending.
+
+    Expected Result:
+    - The response status code is 409 (Conflict).
+    """
+    job = ExportJob.objects.create(kind='transactions')
+
+    response = api_client.get(reverse('export-job-download', args=[job.id]))
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.django_db
+def test_download_export_job_expired(api_client):
+    """
+    Test case: Attempt to download the artifact of an expired job.
+
+    Expected Result:
+    - The response status code is 410 (Gone).
+    """
+    job = ExportJob.objects.create(kind='transactions', status=ExportJobStatus.EXPIRED)
+
+    response = api_client.get(reverse('export-job-download', args=[job.id]))
+
+    assert response.status_code == status.HTTP_410_GONE
+
+
+@pytest.mark.django_db
+def test_download_export_job_missing_artifact(api_client, tmp_path):
+    """
+    Test case: Attempt to download a finished job whose artifact was deleted from disk.
+
+    Expected Result:
+    - The response status code is 410 (Gone).
+    """
+    job = ExportJob.objects.create(kind='transactions', status=ExportJobStatus.FINISHED,
+                                   file_path=str(tmp_path / 'missing.csv'))
+
+    response = api_client.get(reverse('export-job-download', args=[job.id]))
+
+    assert response.status_code == status.HTTP_410_GONE
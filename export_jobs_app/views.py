@@ -0,0 +1,132 @@
+import os
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import FileResponse, HttpResponse
+from django.urls import reverse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from export_jobs_app.models import ExportJobStatus
+from export_jobs_app.serializers import ExportJobRequestSerializer, ExportJobSerializer
+from export_jobs_app.service.export_job_service_impl import ExportJobServiceImpl
+
+
+class ExportJobListView(APIView):
+    """
+    API view to start an asynchronous export.
+
+    POST:
+    Create an export job for transactions or reports with optional filters.
+    The CSV is generated in the background; poll the job status and download the file once it is finished.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Start an asynchronous CSV export",
+        request_body=ExportJobRequestSerializer,
+        responses={
+            202: openapi.Response('Export job accepted', ExportJobSerializer),
+            400: 'Bad Request'
+        }
+    )
+    def post(self, request: Request) -> Response:
+        """
+        Handle POST requests to create a new export job.
+
+        This method validates the job data using the `ExportJobRequestSerializer` and, if valid, creates
+        the job through the `ExportJobServiceImpl`, which schedules the CSV generation on the worker pool.
+        The response points to the status endpoint of the job.
+        """
+        serializer = ExportJobRequestSerializer(data=request.data)
+        if serializer.is_valid():
+            job = ExportJobServiceImpl.create_job(kind=serializer.validated_data['kind'],
+                                                  filters=serializer.validated_data['filters'])
+            return Response(ExportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED,
+                            headers={'Location': reverse('export-job-detail', args=[job.id])})
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ExportJobDetailsView(APIView):
+    """
+    API view to poll the status of an export job.
+
+    GET:
+    Retrieve the status and progress of an export job by its ID.
+    If the job is not found, return a 404 error.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Retrieve the status of an export job",
+        responses={
+            200: ExportJobSerializer(),
+            404: openapi.Response('Export job not found')
+        }
+    )
+    def get(self, request: Request, id: uuid.UUID) -> Response:
+        """
+        Handle GET requests to retrieve the status of an export job by ID.
+
+        This method retrieves the job via the `ExportJobServiceImpl` and returns its status together with
+        the number of rows written so far and the total number of rows to export.
+        """
+        try:
+            job = ExportJobServiceImpl.get_job_by_id(id)
+            return Response(ExportJobSerializer(job).data)
+        except ObjectDoesNotExist:
+            return Response({'error': 'Export job not found'}, status=status.HTTP_404_NOT_FOUND)
+
+
+class ExportJobDownloadView(APIView):
+    """
+    API view to download the artifact of a finished export job.
+
+    GET:
+    Return the generated CSV file of an export job.
+    If the job is not found, return a 404 error; if it is not finished yet, return a 409 error;
+    if its artifact has expired or is missing, return a 410 error.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Download the CSV file of a finished export job",
+        responses={
+            200: openapi.Response('CSV file'),
+            404: 'Export job not found',
+            409: 'Export job is not finished',
+            410: 'Export artifact has expired or is no longer available'
+        }
+    )
+    def get(self, request: Request, id: uuid.UUID) -> HttpResponse | Response:
+        """
+        Handle GET requests to download the CSV file of an export job by ID.
+
+        The file is served with `FileResponse`, which lets the WSGI server send it with zero-copy `sendfile`.
+        If `EXPORT_JOBS_SENDFILE_HEADER` is configured, the transfer is handed off to the front web server instead.
+        """
+        try:
+            job = ExportJobServiceImpl.get_job_by_id(id)
+        except ObjectDoesNotExist:
+            return Response({'error': 'Export job not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        if job.status == ExportJobStatus.EXPIRED:
+            return Response({'error': 'Export artifact has expired'}, status=status.HTTP_410_GONE)
+        if job.status != ExportJobStatus.FINISHED:
+            return Response({'error': 'Export job is not finished'}, status=status.HTTP_409_CONFLICT)
+
+        filename = f'{job.kind}.csv'
+        if settings.EXPORT_JOBS_SENDFILE_HEADER:
+            response = HttpResponse(content_type='text/csv')
+            response[settings.EXPORT_JOBS_SENDFILE_HEADER] = (settings.EXPORT_JOBS_SENDFILE_PREFIX
+                                                              + os.path.basename(job.file_path))
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
+        try:
+            artifact = open(job.file_path, 'rb')
+        except OSError:
+            # Deleted behind the job's back, or written on another host.
+            return Response({'error': 'Export artifact is no longer available'}, status=status.HTTP_410_GONE)
+        return FileResponse(artifact, as_attachment=True, filename=filename, content_type='text/csv')
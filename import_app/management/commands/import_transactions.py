@@ -0,0 +1,29 @@
+import csv
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from import_app.service.import_service_impl import ImportServiceImpl
+
+
+class Command(BaseCommand):
+    help = "Import transactions from a CSV file with the columns amount, date, transaction_type, category and user_id."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help="Path of the CSV file")
+        parser.add_argument('--batch-size', type=int, help="Rows validated and loaded at a time")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as csv_file:
+                report = ImportServiceImpl.import_transactions_csv(csv_file, batch_size=options['batch_size'])
+        except (OSError, ValueError, csv.Error) as exc:
+            raise CommandError(str(exc))
+
+        for error in report['errors']:
+            messages = '; '.join(f"{field}: {' '.join(problems)}" for field, problems in error['errors'].items())
+            self.stderr.write(f"Line {error['row']}: {messages}")
+        if report['failed'] > len(report['errors']):
+            self.stderr.write(f"... and {report['failed'] - len(report['errors'])} more failed row(s)")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['imported']} transaction(s), {report['failed']} row(s) failed"))
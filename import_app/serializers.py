@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+
+class TransactionImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+
+
+class ImportRowErrorSerializer(serializers.Serializer):
+    row = serializers.IntegerField()
+    errors = serializers.DictField(child=serializers.ListField(child=serializers.CharField()))
+
+
+class ImportReportSerializer(serializers.Serializer):
+    imported = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    errors = ImportRowErrorSerializer(many=True)
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Optional
+
+
+class ImportService(ABC):
+    """
+    Abstract class that defines the interface for bulk imports.
+    Implementations read a CSV file as a stream, validate it in batches and load the valid rows in bulk,
+    reporting the invalid rows instead of failing the whole file.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def import_transactions_csv(lines: Iterable[str], batch_size: Optional[int] = None) -> dict[str, Any]:
+        """
+        Import transactions from a CSV file with the columns amount, date, transaction_type, category and user_id.
+
+        Other columns, such as the Id column of an export, are ignored; every imported row gets a new ID.
+
+        :param lines: The lines of the CSV file, starting with the header row.
+        :param batch_size: The number of rows validated and loaded at a time, defaults to ``IMPORT_BATCH_SIZE``.
+        :return: A report with the number of imported and failed rows and the errors of the failed rows.
+        :raises ValueError: If the header row lacks a required column or the file cannot be decoded.
+        :raises csv.Error: If the file is not valid CSV, e.g. it contains NUL bytes.
+        """
+        pass
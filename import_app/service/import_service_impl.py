@@ -0,0 +1,132 @@
+import csv
+import io
+import itertools
+import logging
+import uuid
+from typing import Any, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.db.backends.utils import CursorWrapper
+
+from import_app.service.import_service import ImportService
+from transactions_app.models import Transaction
+from transactions_app.service.transaction_batch_validator import validate_transaction_rows
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+# CSV columns of a transaction import and the validator fields they feed; user_id matches the export header.
+TRANSACTION_IMPORT_COLUMNS = {
+    'amount': 'amount',
+    'date': 'date',
+    'transaction_type': 'transaction_type',
+    'category': 'category',
+    'user_id': 'user',
+}
+
+# Staged columns, in the order they are written by COPY.
+_STAGED_FIELDS = ('id', 'amount', 'date', 'transaction_type', 'category', 'user_id')
+
+
+class ImportServiceImpl(ImportService):
+    """
+    Bulk import backend.
+
+    On PostgreSQL, valid rows are streamed with ``COPY ... FROM STDIN`` into a temporary staging table that has
+    neither indexes nor constraints, then moved into the transactions table with a single ``INSERT ... SELECT``.
+    Other databases, which have neither, get each batch of valid rows with one ``bulk_create``.
+    The whole import runs in one transaction, so it either loads every valid row or none.
+    """
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def import_transactions_csv(lines: Iterable[str], batch_size: Optional[int] = None) -> dict[str, Any]:
+        batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        reader = csv.DictReader(lines)
+        missing = [column for column in TRANSACTION_IMPORT_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Missing CSV column(s): {', '.join(missing)}.")
+
+        ImportServiceImpl.logger.info("Importing transactions from CSV")
+        connection = connections[Transaction.objects.db]
+        report: dict[str, Any] = {'imported': 0, 'failed': 0, 'errors': []}
+        batches = ImportServiceImpl._validated_batches(reader, batch_size, report)
+        with transaction.atomic(using=connection.alias):
+            if connection.vendor == 'postgresql':
+                report['imported'] = ImportServiceImpl._copy_batches(connection, batches)
+            else:
+                for rows in batches:
+                    report['imported'] += len(Transaction.objects.using(connection.alias).bulk_create(
+                        Transaction(**row) for row in rows))
+            if report['imported']:
+                DataVersionServiceImpl.bump_version(Transaction)
+
+        ImportServiceImpl.logger.info(f"Imported {report['imported']} transaction(s), "
+                                      f"{report['failed']} row(s) failed")
+        return report
+
+    @staticmethod
+    def _validated_batches(reader: csv.DictReader, batch_size: int,
+                           report: dict[str, Any]) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield the cleaned values of the valid rows of each batch, counting the invalid rows in the report and
+        listing their errors up to IMPORT_MAX_REPORTED_ERRORS.
+        """
+        for batch in ImportServiceImpl._read_batches(reader, batch_size):
+            valid, invalid = validate_transaction_rows(batch)
+            report['failed'] += len(invalid)
+            room = settings.IMPORT_MAX_REPORTED_ERRORS - len(report['errors'])
+            report['errors'].extend({'row': number, 'errors': row_errors} for number, row_errors in invalid[:room])
+            yield [row for _, row in valid]
+
+    @staticmethod
+    def _copy_batches(connection: BaseDatabaseWrapper, batches: Iterable[list[dict[str, Any]]]) -> int:
+        """
+        Load the batches through a staging table, within the caller's transaction.
+
+        :return: The number of imported rows.
+        """
+        quote = connection.ops.quote_name
+        meta = Transaction._meta
+        staging = quote(f'{meta.db_table}_import')
+        columns = ', '.join(quote(meta.get_field(field).column) for field in _STAGED_FIELDS)
+        with connection.cursor() as cursor:
+            cursor.execute(f'CREATE TEMPORARY TABLE {staging} (LIKE {quote(meta.db_table)} INCLUDING DEFAULTS) '
+                           f'ON COMMIT DROP')
+            for rows in batches:
+                ImportServiceImpl._copy_rows(cursor, f'COPY {staging} ({columns}) FROM STDIN WITH CSV',
+                                             ImportServiceImpl._encode_rows(rows))
+            cursor.execute(f'INSERT INTO {quote(meta.db_table)} ({columns}) SELECT {columns} FROM {staging}')
+            imported = cursor.rowcount
+            cursor.execute(f'DROP TABLE {staging}')
+        return imported
+
+    @staticmethod
+    def _read_batches(reader: csv.DictReader, batch_size: int) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+        """
+        Yield the data rows in batches, numbered by the line they end on so errors point into the file.
+        """
+        rows = ((reader.line_num, {field: values.get(column) for column, field in TRANSACTION_IMPORT_COLUMNS.items()})
+                for values in reader)
+        while batch := list(itertools.islice(rows, batch_size)):
+            yield batch
+
+    @staticmethod
+    def _encode_rows(rows: Iterable[dict[str, Any]]) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([uuid.uuid4(), row['amount'], row['date'].isoformat(), row['transaction_type'],
+                             row['category'], row['user_id']])
+        return buffer.getvalue()
+
+    @staticmethod
+    def _copy_rows(cursor: CursorWrapper, sql: str, data: str) -> None:
+        if not data:
+            return
+        if is_psycopg3:
+            with cursor.cursor.copy(sql) as copy:
+                copy.write(data)
+        else:
+            cursor.cursor.copy_expert(sql, io.StringIO(data))
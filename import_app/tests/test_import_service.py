@@ -0,0 +1,146 @@
+import io
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import QuerySet
+
+from import_app.service.import_service_impl import ImportServiceImpl
+from transactions_app.models import Transaction
+from users_app.models import User
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def csv_lines(*rows, header='amount,date,transaction_type,category,user_id'):
+    return io.StringIO('\n'.join((header,) + rows) + '\n')
+
+
+@pytest.mark.django_db
+def test_import_transactions_csv(user, django_capture_on_commit_callbacks):
+    """Test valid rows are loaded across batches and invalid rows are reported by line."""
+    lines = csv_lines(
+        f'10.00,2024-01-01,income,salary,{user.id}',
+        f'-5,2024-01-02,expense,food,{user.id}',
+        f'20.50,2024-01-03,expense,"food, drinks",{user.id}',
+        f'30,2024-01-04,income,salary,{uuid.uuid4()}',
+        f'40,2024-01-05,income,bonus,{user.id}',
+    )
+    version = DataVersionServiceImpl.get_version(Transaction)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        report = ImportServiceImpl.import_transactions_csv(lines, batch_size=2)
+
+    assert report['imported'] == 3
+    assert report['failed'] == 2
+    assert [error['row'] for error in report['errors']] == [3, 5]
+    assert report['errors'][0]['errors'] == {'amount': ['Amount must be non-negative.']}
+    assert sorted(Transaction.objects.values_list('category', flat=True)) == ['bonus', 'food, drinks', 'salary']
+    assert DataVersionServiceImpl.get_version(Transaction) != version
+
+
+@pytest.mark.django_db
+def test_import_transactions_csv_trims_strings(user):
+    """Test padded categories are trimmed and blank ones rejected, and padded types rejected like the serializer."""
+    lines = csv_lines(f'10.00,2024-01-01,income,"  salary ",{user.id}',
+                      f'5.00,2024-01-02,expense,"   ",{user.id}',
+                      f'5.00,2024-01-03, income ,salary,{user.id}')
+
+    report = ImportServiceImpl.import_transactions_csv(lines)
+
+    assert report['imported'] == 1
+    assert report['errors'] == [{'row': 3, 'errors': {'category': ['This field may not be blank.']}},
+                                {'row': 4, 'errors': {'transaction_type': ['" income " is not a valid choice.']}}]
+    assert list(Transaction.objects.values_list('transaction_type', 'category')) == [('income', 'salary')]
+
+
+@pytest.mark.django_db
+def test_import_transactions_csv_extra_fields(user):
+    """Test a row with more fields than the header, which csv gives as a list, is imported from its named fields."""
+    lines = csv_lines(f'10.00,2024-01-01,income,salary,{user.id},unexpected,["income"]')
+
+    report = ImportServiceImpl.import_transactions_csv(lines)
+
+    assert report == {'imported': 1, 'failed': 0, 'errors': []}
+
+
+@pytest.mark.django_db
+def test_import_transactions_csv_accepts_exports(user):
+    """Test a CSV export can be imported again, with new ids."""
+    existing = Transaction.objects.create(amount=10, date='2024-01-01', transaction_type='income',
+                                          category='salary', user=user)
+    lines = csv_lines(f'{existing.id},10.00,2024-01-01,income,salary,{user.id}',
+                      header='Id,amount,date,transaction_type,category,user_id')
+
+    report = ImportServiceImpl.import_transactions_csv(lines)
+
+    assert report == {'imported': 1, 'failed': 0, 'errors': []}
+    assert Transaction.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_import_transactions_csv_limits_reported_errors(user, settings):
+    """Test the error list is capped while the failed count covers every row."""
+    settings.IMPORT_MAX_REPORTED_ERRORS = 2
+    lines = csv_lines(*[f'bad,2024-01-01,income,salary,{user.id}'] * 5)
+
+    report = ImportServiceImpl.import_transactions_csv(lines)
+
+    assert report['failed'] == 5
+    assert len(report['errors']) == 2
+
+
+def test_import_transactions_csv_missing_column():
+    """Test a file without the required columns is rejected before touching the database."""
+    with pytest.raises(ValueError, match='user_id'):
+        ImportServiceImpl.import_transactions_csv(csv_lines(header='amount,date,transaction_type,category'))
+
+
+@pytest.mark.django_db
+def test_import_transactions_command(user, tmp_path, capsys):
+    """Test the management command imports a file and prints the failed lines."""
+    path = tmp_path / 'transactions.csv'
+    path.write_text(csv_lines(f'10,2024-01-01,income,salary,{user.id}',
+                              f'10,2024-01-01,gift,salary,{user.id}').getvalue())
+
+    call_command('import_transactions', str(path), batch_size=1)
+
+    output = capsys.readouterr()
+    assert 'Imported 1 transaction(s), 1 row(s) failed' in output.out
+    assert 'Line 3: transaction_type: "gift" is not a valid choice.' in output.err
+    assert Transaction.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_import_transactions_command_malformed_file(user, tmp_path):
+    """Test the management command fails with a command error on a file the csv module cannot parse."""
+    path = tmp_path / 'transactions.csv'
+    path.write_text(csv_lines(f'10,2024-01-01,income,{"x" * 200000},{user.id}').getvalue())
+
+    with pytest.raises(CommandError, match='field larger than field limit'):
+        call_command('import_transactions', str(path))
+    assert not Transaction.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_transactions_csv_without_copy(user):
+    """Test databases other than PostgreSQL get each batch of valid rows with one bulk INSERT."""
+    lines = csv_lines(f'10.00,2024-01-01,income,salary,{user.id}',
+                      f'5.00,2024-01-02,gift,food,{user.id}',
+                      f'7.00,2024-01-03,expense,food,{user.id}')
+
+    with mock.patch.object(connection, 'vendor', 'sqlite'), \
+            mock.patch.object(QuerySet, 'bulk_create', autospec=True, side_effect=QuerySet.bulk_create) as bulk_create:
+        report = ImportServiceImpl.import_transactions_csv(lines, batch_size=2)
+
+    assert report['imported'] == 2
+    assert report['failed'] == 1
+    assert bulk_create.call_count == 2
+    assert sorted(Transaction.objects.values_list('amount', flat=True)) == [Decimal('7.00'), Decimal('10.00')]
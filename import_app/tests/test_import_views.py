@@ -0,0 +1,82 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def upload(content):
+    return SimpleUploadedFile('transactions.csv', content.encode('utf-8-sig'), content_type='text/csv')
+
+
+@pytest.mark.django_db
+def test_import_transactions(api_client, user):
+    """Test uploading a CSV imports the valid rows and reports the invalid ones."""
+    content = (f'amount,date,transaction_type,category,user_id\n'
+               f'10.00,2024-01-01,income,salary,{user.id}\n'
+               f'10.00,2024-13-01,income,salary,{user.id}\n')
+
+    response = api_client.post(reverse('import-transactions'), {'file': upload(content)}, format='multipart')
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == {
+        'imported': 1,
+        'failed': 1,
+        'errors': [{'row': 3, 'errors': {
+            'date': ['Date has wrong format. Use one of these formats instead: YYYY-MM-DD.']}}],
+    }
+    assert Transaction.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_import_transactions_nothing_imported(api_client, user):
+    """Test a file whose rows all fail returns 400 with the report."""
+    content = f'amount,date,transaction_type,category,user_id\n-1,2024-01-01,income,salary,{user.id}\n'
+
+    response = api_client.post(reverse('import-transactions'), {'file': upload(content)}, format='multipart')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()['failed'] == 1
+
+
+@pytest.mark.django_db
+def test_import_transactions_invalid_file(api_client):
+    """Test missing uploads and files without the required columns are rejected."""
+    missing = api_client.post(reverse('import-transactions'), {}, format='multipart')
+    wrong_header = api_client.post(reverse('import-transactions'), {'file': upload('a,b\n1,2\n')},
+                                   format='multipart')
+
+    assert missing.status_code == status.HTTP_400_BAD_REQUEST
+    assert wrong_header.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'Missing CSV column(s)' in wrong_header.json()['file'][0]
+
+
+@pytest.mark.django_db
+def test_import_transactions_malformed_file(api_client, user):
+    """Test a file the csv module cannot parse is rejected, and NUL characters are reported as row errors."""
+    oversized = upload(f'amount,date,transaction_type,category,user_id\n10.00,2024-01-01,income,{"x" * 200000},'
+                       f'{user.id}\n')
+    with_nul = upload(f'amount,date,transaction_type,category,user_id\n10.00,2024-01-01,income,sal\x00ary,{user.id}\n')
+
+    oversized_response = api_client.post(reverse('import-transactions'), {'file': oversized}, format='multipart')
+    with_nul_response = api_client.post(reverse('import-transactions'), {'file': with_nul}, format='multipart')
+
+    assert oversized_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'field larger than field limit' in oversized_response.json()['file'][0]
+    assert with_nul_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert with_nul_response.json()['errors'] == [{'row': 2, 'errors': {
+        'category': ['Null characters are not allowed.']}}]
+    assert not Transaction.objects.exists()
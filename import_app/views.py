@@ -0,0 +1,56 @@
+import csv
+import io
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from import_app.serializers import ImportReportSerializer, TransactionImportSerializer
+from import_app.service.import_service_impl import ImportServiceImpl
+
+
+class ImportTransactionsView(APIView):
+    """
+    API view for importing transactions in bulk from a CSV file.
+
+    POST:
+    Upload a CSV file (multipart field `file`) with the columns amount, date, transaction_type, category and
+    user_id. The file is read as a stream and validated in batches; valid rows are imported and invalid rows
+    are reported with their line number and errors.
+    """
+    parser_classes = [MultiPartParser]
+
+    @swagger_auto_schema(
+        operation_description="Import transactions from a CSV file",
+        manual_parameters=[openapi.Parameter('file', openapi.IN_FORM, type=openapi.TYPE_FILE, required=True)],
+        responses={
+            201: openapi.Response('Transactions imported', ImportReportSerializer),
+            400: openapi.Response('Bad Request or no row could be imported', ImportReportSerializer)
+        }
+    )
+    def post(self, request: Request) -> Response:
+        """
+        Handle POST requests to import transactions.
+
+        This method validates the upload using the `TransactionImportSerializer` and imports the file through
+        the `ImportServiceImpl`. It returns the import report, with status 400 if the file has rows but none
+        of them could be imported, or if the file itself is not a valid transactions CSV.
+        """
+        serializer = TransactionImportSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = serializer.validated_data['file']
+        lines = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = ImportServiceImpl.import_transactions_csv(lines)
+        except (ValueError, csv.Error) as exc:
+            return Response({'file': [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+
+        if report['failed'] and not report['imported']:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_201_CREATED)
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transactionreport',
+            index=models.Index(fields=['start_date', 'end_date'], name='report_period_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports_app', '0002_transactionreport_period_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transactionreport',
+            name='expense_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='transactionreport',
+            name='income_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:57
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports_app', '0003_transactionreport_counts'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transactionreport',
+            name='report_period_idx',
+        ),
+        migrations.AddField(
+            model_name='transactionreport',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='transactionreport',
+            index=models.Index(fields=['start_date', 'end_date', 'created_at'], name='report_period_created_idx'),
+        ),
+    ]
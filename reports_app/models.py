@@ -7,5 +7,15 @@ class TransactionReport(models.Model):
     total_income = models.DecimalField(max_digits=10, decimal_places=2)
     total_expense = models.DecimalField(max_digits=10, decimal_places=2)
     net_income = models.DecimalField(max_digits=10, decimal_places=2)
+    income_count = models.PositiveIntegerField(default=0)
+    expense_count = models.PositiveIntegerField(default=0)
     start_date = models.DateField()
     end_date = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Also finds the latest report of a period, which workers waiting for it share (see
+            # reports_app.service.report_flights).
+            models.Index(fields=['start_date', 'end_date', 'created_at'], name='report_period_created_idx'),
+        ]
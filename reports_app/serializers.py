@@ -2,6 +2,7 @@ import datetime
 
 from rest_framework import serializers
 
+from core_app.compiled_serializers import CompiledSerializer
 from reports_app.models import TransactionReport
 
 
@@ -15,7 +16,21 @@ class ReportRequestSerializer(serializers.Serializer):
         return data
 
 
+class ReportFilterSerializer(serializers.Serializer):
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+
+    def validate(self, data: dict[str, datetime.date]) -> dict[str, datetime.date]:
+        if 'start_date' in data and 'end_date' in data and data['end_date'] < data['start_date']:
+            raise serializers.ValidationError("End date must be after start date.")
+        return data
+
+
 class ReportResponseSerializer(serializers.ModelSerializer):
     class Meta:
         model = TransactionReport
         fields = '__all__'
+
+
+# Read path of the report list, with the same output as ReportResponseSerializer(many=True).
+REPORT_LIST_SERIALIZER = CompiledSerializer(ReportResponseSerializer)
@@ -0,0 +1,267 @@
+import datetime
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Iterator, NamedTuple, Optional
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from transactions_app.models import TransactionType
+from transactions_app.service import daily_totals
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b'RNGIDX02'
+# Magic, write sequence, database oid, first day (ordinal), number of days, watermark, synced at.
+_HEADER = struct.Struct('<8sqqqqqd')
+_SEQUENCE = struct.Struct('<q')
+_SEQUENCE_OFFSET = 8
+# Sums kept for each day, in this order: income and expense amounts in cents, income and expense counts.
+_FIELDS = 4
+# Reads overlapping this many writes in a row give up, and the period is summed from the daily totals instead.
+_MAX_READ_ATTEMPTS = 1000
+
+# Both queries read the xmin of their own snapshot along with the totals, which becomes the new watermark.
+_SETTLED = 'pg_snapshot_xmin(pg_current_snapshot())::text::bigint'
+_ALL_DAYS = (f"SELECT {_SETTLED}, (SELECT coalesce(json_agg(json_build_array(date, transaction_type, "
+             f"(total * 100)::bigint, count)), '[]') "
+             f"FROM {daily_totals.DAILY_TOTALS_TABLE} WHERE user_id IS NULL)")
+# Days without totals any more come back with NULL types, amounts and counts.
+_CHANGED_DAYS = (f"SELECT {_SETTLED}, (SELECT coalesce(json_agg(json_build_array(changed.date, "
+                 f"totals.transaction_type, (totals.total * 100)::bigint, totals.count)), '[]') "
+                 f"FROM (SELECT DISTINCT date FROM {daily_totals.DAILY_TOTAL_CHANGES_TABLE} WHERE xid >= %s) "
+                 f"AS changed LEFT JOIN {daily_totals.DAILY_TOTALS_TABLE} AS totals "
+                 f"ON totals.date = changed.date AND totals.user_id IS NULL)")
+
+_indexes: dict[tuple, Optional['RangeIndex']] = {}
+_indexes_lock = threading.Lock()
+
+
+class _Header(NamedTuple):
+    magic: bytes
+    sequence: int
+    database: int
+    first_day: int
+    days: int
+    watermark: int
+    synced_at: float
+
+
+class RangeIndex:
+    """
+    Prefix sums of the daily totals over all users and categories, as a Fenwick tree in a memory-mapped file.
+
+    Slot i of the tree holds the sums of the days i - lowbit(i) + 1 to i, counted from first_day, so the sums up to
+    a day add up at most log2(days) slots, those of a period are the difference of two such lookups, and a day is
+    changed through as many slots. Every process of a host maps the same file: reads take no lock and are retried
+    when they overlap a write, detected by a sequence number in the header that is odd while a write is under way;
+    writes are serialized by an exclusive flock on the file.
+
+    The header records the database the index was built from and a watermark, the xmin of the snapshot it last
+    caught up at: transactions with a lower id were settled then. Catching up re-reads the totals of the days
+    logged by the other transactions (see DailyTotalChange) and sets the days to them, so days read twice are
+    harmless. A file of another database or layout, or one that has not caught up within the retention of the
+    change log, is rebuilt from all daily totals the first time a process uses it.
+    """
+
+    def __init__(self, path: str, first_day: datetime.date, days: int):
+        self.path = path
+        self.first_day = first_day
+        self.days = days
+        self._lock = threading.Lock()
+        self._databases: dict[str, int] = {}
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = _HEADER.size + (days + 1) * _FIELDS * _SEQUENCE.size
+        try:
+            with self._exclusive():
+                if os.fstat(self._fd).st_size != size:
+                    os.ftruncate(self._fd, 0)
+                    os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._tree = memoryview(self._map)[_HEADER.size:].cast('q')
+
+    def totals(self, connection: BaseDatabaseWrapper, start_date: datetime.date,
+               end_date: datetime.date) -> Optional[dict[str, Any]]:
+        """
+        Sum up the daily totals between the given dates, both included, after catching up with the writes
+        committed so far (or within REPORT_RANGE_INDEX_MAX_LAG_SECONDS).
+
+        :return: The total_income, total_expense, income_count and expense_count of the period, or None if it
+                 is not covered by the index.
+        """
+        first, last = self._slot(start_date), self._slot(end_date)
+        if first < 1 or last > self.days:
+            return None
+        self.catch_up(connection)
+        sums = self._range_sums(first - 1, max(last, first - 1))
+        if sums is None:
+            return None
+        income, expense, income_count, expense_count = sums
+        return {'total_income': Decimal(income).scaleb(-2), 'total_expense': Decimal(expense).scaleb(-2),
+                'income_count': income_count, 'expense_count': expense_count}
+
+    def catch_up(self, connection: BaseDatabaseWrapper) -> None:
+        """
+        Apply the daily totals written since the index last caught up, or rebuild it if it cannot catch up.
+        """
+        database = self._database(connection)
+        header = self._header()
+        max_lag = settings.REPORT_RANGE_INDEX_MAX_LAG_SECONDS
+        if self._is_current(header, database) and time.time() - header.synced_at <= max_lag:
+            return
+        with self._exclusive():
+            header = self._header()
+            lag = time.time() - header.synced_at
+            if not self._is_current(header, database) or lag > settings.REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS:
+                self._rebuild(connection)
+            elif lag > max_lag:
+                self._apply_changes(connection, header)
+
+    def _rebuild(self, connection: BaseDatabaseWrapper) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(_ALL_DAYS)
+            watermark, rows = cursor.fetchone()
+        sums = [0] * ((self.days + 1) * _FIELDS)
+        for day, transaction_type, cents, count in rows:
+            slot = self._slot(datetime.date.fromisoformat(day))
+            if 1 <= slot <= self.days:
+                self._set_fields(sums, slot * _FIELDS, transaction_type, cents, count)
+        # Each slot adds its sums to the next slot covering it, which builds the tree in one pass.
+        for slot in range(1, self.days + 1):
+            parent = slot + (slot & -slot)
+            if parent <= self.days:
+                for field in range(_FIELDS):
+                    sums[parent * _FIELDS + field] += sums[slot * _FIELDS + field]
+        with self._writing():
+            self._tree[:] = array('q', sums)
+            self._write_header(self._database(connection), watermark, time.time())
+        logger.info(f"Rebuilt the range index {self.path} from {len(rows)} daily total(s)")
+
+    def _apply_changes(self, connection: BaseDatabaseWrapper, header: _Header) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(_CHANGED_DAYS, [header.watermark])
+            watermark, rows = cursor.fetchone()
+        days: dict[int, list[int]] = {}
+        for day, transaction_type, cents, count in rows:
+            slot = self._slot(datetime.date.fromisoformat(day))
+            if 1 <= slot <= self.days:
+                self._set_fields(days.setdefault(slot, [0] * _FIELDS), 0, transaction_type, cents, count)
+        with self._writing():
+            for slot, values in days.items():
+                current = [a - b for a, b in zip(self._prefix(slot), self._prefix(slot - 1))]
+                self._add(slot, [value - old for value, old in zip(values, current)])
+            self._write_header(header.database, watermark, time.time())
+
+    @staticmethod
+    def _set_fields(sums: list[int], offset: int, transaction_type: Optional[str], cents: Optional[int],
+                    count: Optional[int]) -> None:
+        if transaction_type == TransactionType.INCOME:
+            sums[offset], sums[offset + 2] = cents, count
+        elif transaction_type == TransactionType.EXPENSE:
+            sums[offset + 1], sums[offset + 3] = cents, count
+
+    def _slot(self, day: datetime.date) -> int:
+        return day.toordinal() - self.first_day.toordinal() + 1
+
+    def _prefix(self, slot: int) -> list[int]:
+        tree = self._tree
+        sums = [0] * _FIELDS
+        while slot > 0:
+            offset = slot * _FIELDS
+            for field in range(_FIELDS):
+                sums[field] += tree[offset + field]
+            slot &= slot - 1
+        return sums
+
+    def _add(self, slot: int, deltas: list[int]) -> None:
+        tree = self._tree
+        while slot <= self.days:
+            offset = slot * _FIELDS
+            for field, delta in enumerate(deltas):
+                tree[offset + field] += delta
+            slot += slot & -slot
+
+    def _range_sums(self, before: int, last: int) -> Optional[list[int]]:
+        for _ in range(_MAX_READ_ATTEMPTS):
+            sequence = self._sequence()
+            if sequence % 2 == 0:
+                sums = [a - b for a, b in zip(self._prefix(last), self._prefix(before))]
+                if self._sequence() == sequence:
+                    return sums
+            time.sleep(0)
+        logger.warning(f"Gave up reading the range index {self.path} during writes")
+        return None
+
+    def _is_current(self, header: _Header, database: int) -> bool:
+        # An odd sequence outside the lock is left by a process that died while writing.
+        return (header.magic == _MAGIC and header.sequence % 2 == 0 and header.database == database
+                and header.first_day == self.first_day.toordinal() and header.days == self.days)
+
+    def _database(self, connection: BaseDatabaseWrapper) -> int:
+        if connection.alias not in self._databases:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT oid::bigint FROM pg_database WHERE datname = current_database()')
+                self._databases[connection.alias] = cursor.fetchone()[0]
+        return self._databases[connection.alias]
+
+    def _header(self) -> _Header:
+        return _Header._make(_HEADER.unpack_from(self._map))
+
+    def _sequence(self) -> int:
+        return _SEQUENCE.unpack_from(self._map, _SEQUENCE_OFFSET)[0]
+
+    def _write_header(self, database: int, watermark: int, synced_at: float) -> None:
+        _HEADER.pack_into(self._map, 0, _MAGIC, self._sequence(), database, self.first_day.toordinal(), self.days,
+                          watermark, synced_at)
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        sequence = self._sequence() | 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, sequence)
+        try:
+            yield
+        finally:
+            _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, sequence + 1)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+def get_range_index(connection: BaseDatabaseWrapper) -> Optional[RangeIndex]:
+    """
+    Return the range index of the connection's database as mapped by this process, opening it on first use.
+
+    :return: None if the index is turned off or cannot be opened, or the daily totals are not maintained.
+    """
+    if not settings.REPORT_RANGE_INDEX_DIR or not daily_totals.is_maintained(connection):
+        return None
+    path = os.path.join(settings.REPORT_RANGE_INDEX_DIR, f"{connection.settings_dict['NAME']}.idx")
+    first_day, days = settings.REPORT_RANGE_INDEX_FIRST_DAY, settings.REPORT_RANGE_INDEX_DAYS
+    # Keyed by process as well: a forked worker opens its own file description, which flock tells apart.
+    key = (os.getpid(), path, first_day, days)
+    with _indexes_lock:
+        if key not in _indexes:
+            try:
+                os.makedirs(settings.REPORT_RANGE_INDEX_DIR, exist_ok=True)
+                _indexes[key] = RangeIndex(path, first_day, days)
+            except OSError:
+                logger.exception(f"Cannot open the range index {path}; periods are summed from the daily totals")
+                _indexes[key] = None
+        return _indexes[key]
@@ -0,0 +1,80 @@
+import datetime
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from transactions_app.service import daily_totals
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_ALIAS = 'reports'
+HITS = 'hits'
+MISSES = 'misses'
+
+# Reads the xmin of the current snapshot, and whether transactions at or after a watermark wrote daily totals
+# within a period (false for a NULL watermark).
+_VALIDATE = (f"SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint, EXISTS ("
+             f"SELECT 1 FROM {daily_totals.DAILY_TOTAL_CHANGES_TABLE} WHERE xid >= %s AND date BETWEEN %s AND %s)")
+
+
+def cached_totals(connection: BaseDatabaseWrapper, start_date: datetime.date, end_date: datetime.date,
+                  compute: Callable[[datetime.date, datetime.date], dict[str, Any]]) -> dict[str, Any]:
+    """
+    Return the totals of a period from the report cache, computing and caching them on a miss.
+
+    Each entry records the xmin of a snapshot taken before its totals were read, so transactions with a lower
+    id are included in them. An entry is only served if no other transaction has written a day of its period
+    since, according to the change log of the daily totals, which covers the old and new date of moved
+    transactions alike; writes to other days leave it alone. Entries that were not checked within the retention
+    of the change log are recomputed. Outside of PostgreSQL and inside database transactions, whose own
+    uncommitted writes are not settled, the totals are always computed.
+    """
+    if not daily_totals.is_maintained(connection) or connection.in_atomic_block:
+        return compute(start_date, end_date)
+    daily_totals.prune_expired_changes(connection)
+    cache = caches[REPORT_CACHE_ALIAS]
+    key = _cache_key(start_date, end_date)
+    entry: Optional[dict[str, Any]] = cache.get(key)
+    if entry is not None and time.time() - entry['checked_at'] > settings.REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS:
+        entry = None
+    with connection.cursor() as cursor:
+        cursor.execute(_VALIDATE, [entry['watermark'] if entry else None, start_date, end_date])
+        watermark, changed = cursor.fetchone()
+    if entry is not None and not changed:
+        _count(HITS)
+        totals = entry['totals']
+    else:
+        _count(MISSES)
+        totals = compute(start_date, end_date)
+    cache.set(key, {'totals': totals, 'watermark': watermark, 'checked_at': time.time()})
+    return totals
+
+
+def get_cache_stats() -> dict[str, int]:
+    """
+    Return the numbers of report cache hits and misses counted by all processes sharing the cache.
+    """
+    counters = caches[REPORT_CACHE_ALIAS].get_many([_counter_key(HITS), _counter_key(MISSES)])
+    return {name: counters.get(_counter_key(name), 0) for name in (HITS, MISSES)}
+
+
+def _count(name: str) -> None:
+    cache = caches[REPORT_CACHE_ALIAS]
+    # add() creates the counter atomically where missing, so concurrent first increments are not lost.
+    cache.add(_counter_key(name), 0, timeout=None)
+    try:
+        cache.incr(_counter_key(name))
+    except ValueError:
+        logger.warning(f"Report cache counter {name} was evicted while counting")
+
+
+def _counter_key(name: str) -> str:
+    return f'report-totals-stats:{name}'
+
+
+def _cache_key(start_date: datetime.date, end_date: datetime.date) -> str:
+    return f'report-totals:{start_date.isoformat()}:{end_date.isoformat()}'
@@ -0,0 +1,136 @@
+import datetime
+import hashlib
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from reports_app.models import TransactionReport
+
+logger = logging.getLogger(__name__)
+
+# Pause between attempts to take the advisory lock of a period held by another worker.
+_LOCK_POLL_SECONDS = 0.05
+
+
+class _Flight:
+    """
+    A report being created, which concurrent callers for the same period wait for.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.report: Optional[TransactionReport] = None
+        self.error: Optional[BaseException] = None
+
+
+_flights: dict[tuple[str, datetime.date, datetime.date], _Flight] = {}
+_flights_lock = threading.Lock()
+
+
+def coalesce_report(connection: BaseDatabaseWrapper, start_date: datetime.date, end_date: datetime.date,
+                    create: Callable[[], TransactionReport]) -> TransactionReport:
+    """
+    Create a report of a period once for all concurrent callers asking for the same period.
+
+    Within a process, the first caller runs ``create`` and the others wait for it and get the same report, or
+    its exception. Across worker processes, callers take turns on a PostgreSQL advisory lock of the period; one
+    that had to wait for it and finds in the database a report of the period saved meanwhile returns that report
+    instead, so no cache shared by the workers is needed. Callers arriving after a report was completed create a
+    new one. A caller that has waited for REPORT_FLIGHT_TIMEOUT_SECONDS, in this process or on the lock, stops
+    waiting and creates its own report.
+    """
+    key = (connection.alias, start_date, end_date)
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+    if not leader:
+        if not flight.done.wait(settings.REPORT_FLIGHT_TIMEOUT_SECONDS):
+            logger.warning(f"Gave up waiting for the report of {start_date} - {end_date}, creating another one")
+            return create()
+        if flight.error is not None:
+            raise flight.error
+        return flight.report
+    try:
+        flight.report = _create_across_workers(connection, start_date, end_date, create)
+        return flight.report
+    except BaseException as error:
+        flight.error = error
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+
+
+def _create_across_workers(connection: BaseDatabaseWrapper, start_date: datetime.date, end_date: datetime.date,
+                           create: Callable[[], TransactionReport]) -> TransactionReport:
+    if connection.vendor != 'postgresql':
+        return create()
+    # Outside of a database transaction, a session lock rather than a transaction one, so the report is still
+    # created outside of a transaction and can use the report cache and the range index. Inside one, the lock is
+    # released when it ends, and a session lock would outlive it if the transaction failed.
+    transactional = connection.in_atomic_block
+    lock_id = _lock_id(start_date, end_date)
+    seen: Optional[TransactionReport] = None
+    waited = not _try_lock(connection, lock_id, transactional, timeout=0)
+    if waited:
+        # The last report of the period saved before this caller started waiting. One saved between the first
+        # attempt and this read is missed, so the caller creates its own report then.
+        seen = _latest_report(connection, start_date, end_date)
+        if not _try_lock(connection, lock_id, transactional, settings.REPORT_FLIGHT_TIMEOUT_SECONDS):
+            logger.warning(f"Gave up waiting for the report lock of {start_date} - {end_date}, creating another one")
+            return create()
+    try:
+        if waited:
+            completed = _latest_report(connection, start_date, end_date)
+            if completed is not None and (seen is None or completed.id != seen.id):
+                logger.info(f"Sharing report {completed.id} completed by another worker for {start_date} - {end_date}")
+                return completed
+        return create()
+    finally:
+        if not transactional:
+            _unlock(connection, lock_id)
+
+
+def _latest_report(connection: BaseDatabaseWrapper, start_date: datetime.date,
+                   end_date: datetime.date) -> Optional[TransactionReport]:
+    return (TransactionReport.objects.using(connection.alias).filter(start_date=start_date, end_date=end_date)
+            .order_by('-created_at').first())
+
+
+def _try_lock(connection: BaseDatabaseWrapper, lock_id: int, transactional: bool, timeout: float) -> bool:
+    """
+    Take an advisory lock, polling for up to ``timeout`` seconds rather than blocking in ``pg_advisory_lock``,
+    which would wait for as long as the holder takes. A timeout of 0 makes a single attempt.
+    """
+    function = 'pg_try_advisory_xact_lock' if transactional else 'pg_try_advisory_lock'
+    deadline = time.monotonic() + timeout
+    with connection.cursor() as cursor:
+        while True:
+            cursor.execute(f'SELECT {function}(%s)', [lock_id])
+            if cursor.fetchone()[0]:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(_LOCK_POLL_SECONDS)
+
+
+def _unlock(connection: BaseDatabaseWrapper, lock_id: int) -> None:
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_unlock(%s)', [lock_id])
+    except Exception:
+        # Raising here would hide the error of the report, if any. Closing the session releases the lock instead.
+        logger.exception("Could not release the advisory lock of a report, closing the database connection")
+        connection.close()
+
+
+def _lock_id(start_date: datetime.date, end_date: datetime.date) -> int:
+    digest = hashlib.blake2b(f'report:{start_date.isoformat()}:{end_date.isoformat()}'.encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), 'big', signed=True)
@@ -1,7 +1,9 @@
 import datetime
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Optional
+
+from django.db.models import QuerySet
 
 from reports_app.models import TransactionReport
 
@@ -25,6 +27,19 @@ class TransactionReportService(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def compute_totals(start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
+        """
+        Sum up the transactions between the given start and end dates, both included, in a single query.
+
+        :param start_date: The first day of the period.
+        :param end_date: The last day of the period.
+        :return: The total_income, total_expense and net_income amounts and the income_count and expense_count
+                 of the period; amounts and counts are zero for a period without transactions.
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def get_report_by_id(id: uuid.UUID) -> TransactionReport:
@@ -45,3 +60,16 @@ class TransactionReportService(ABC):
         :return: A list of all TransactionReport instances.
         """
         pass
+
+    @staticmethod
+    @abstractmethod
+    def filter_reports(start_date: Optional[datetime.date] = None,
+                       end_date: Optional[datetime.date] = None) -> QuerySet[TransactionReport]:
+        """
+        Retrieve the financial reports whose period lies within the given dates. Dates left as None are not applied.
+
+        :param start_date: The earliest report start date to include.
+        :param end_date: The latest report end date to include.
+        :return: A lazy queryset of the matching TransactionReport instances.
+        """
+        pass
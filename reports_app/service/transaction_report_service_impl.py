@@ -1,38 +1,82 @@
 import datetime
 import uuid
-from typing import List
+from decimal import Decimal
+from typing import Any, List, Optional
 
-from django.db.models import Sum
+from django.db import connections
+from django.db.models import Count, DecimalField, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
 
 from reports_app.models import TransactionReport
+from reports_app.service.range_index import get_range_index
+from reports_app.service.report_cache import cached_totals
+from reports_app.service.report_flights import coalesce_report
 from reports_app.service.transaction_report_service import TransactionReportService
-from transactions_app.models import Transaction
+from transactions_app.models import DailyTotal, Transaction, TransactionType
+from transactions_app.service import daily_totals
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+_INCOME = Q(transaction_type=TransactionType.INCOME)
+_EXPENSE = Q(transaction_type=TransactionType.EXPENSE)
+_ZERO = Value(Decimal('0.00'), output_field=DecimalField(max_digits=10, decimal_places=2))
+
+# Conditional aggregates of a report period; sums of a type without transactions are zero instead of NULL.
+_TOTALS = {
+    'total_income': Coalesce(Sum('amount', filter=_INCOME), _ZERO),
+    'total_expense': Coalesce(Sum('amount', filter=_EXPENSE), _ZERO),
+    'income_count': Count('pk', filter=_INCOME),
+    'expense_count': Count('pk', filter=_EXPENSE),
+}
+
+# The same aggregates over the daily totals of all users and categories.
+_DAILY_TOTALS = {
+    'total_income': Coalesce(Sum('total', filter=_INCOME), _ZERO),
+    'total_expense': Coalesce(Sum('total', filter=_EXPENSE), _ZERO),
+    'income_count': Coalesce(Sum('count', filter=_INCOME), 0),
+    'expense_count': Coalesce(Sum('count', filter=_EXPENSE), 0),
+}
 
 
 class TransactionReportServiceImpl(TransactionReportService):
     @staticmethod
     def create_report(start_date: datetime.date, end_date: datetime.date) -> TransactionReport:
-        transactions = Transaction.objects.filter(date__range=[start_date, end_date])
-
-        if not transactions.exists():
-            transaction_report = TransactionReport(start_date=start_date,
-                                                   end_date=end_date,
-                                                   total_income=0.0,
-                                                   total_expense=0.0,
-                                                   net_income=0.0)
-        else:
-            total_income = transactions.filter(transaction_type='income').aggregate(Sum('amount'))
-            total_expense = transactions.filter(transaction_type='expense').aggregate(Sum('amount'))
-
-            transaction_report = TransactionReport(start_date=start_date,
-                                                   end_date=end_date,
-                                                   total_income=total_income['amount__sum'],
-                                                   total_expense=total_expense['amount__sum'],
-                                                   net_income=total_income['amount__sum'] - total_expense[
-                                                       'amount__sum'])
-
-        transaction_report.save()
-        return transaction_report
+        """
+        Create a report from the cached totals of its period, which are computed on a miss and whenever a
+        transaction dated within the period was written since they were cached. Concurrent calls for the same
+        period are coalesced into one report, shared by all of them.
+        """
+        def create() -> TransactionReport:
+            totals = cached_totals(connections[DailyTotal.objects.db], start_date, end_date,
+                                   TransactionReportServiceImpl.compute_totals)
+            transaction_report = TransactionReport.objects.create(start_date=start_date, end_date=end_date, **totals)
+            DataVersionServiceImpl.bump_version(TransactionReport)
+            return transaction_report
+
+        return coalesce_report(connections[TransactionReport.objects.db], start_date, end_date, create)
+
+    @staticmethod
+    def compute_totals(start_date: datetime.date, end_date: datetime.date) -> dict[str, Any]:
+        """
+        Compute all totals in one query with conditional aggregates, which PostgreSQL runs as
+        ``SUM(total) FILTER (WHERE transaction_type = 'income')`` and so on.
+
+        The totals are read from the daily rollup of all users and categories, at most two rows per day, so the
+        cost depends on the number of days rather than on the number of transactions. Where the rollup is not
+        maintained, the transactions of the period are scanned instead.
+
+        Outside of database transactions, whose uncommitted writes must not reach the other processes, periods
+        covered by the shared range index are answered from two of its prefix sums instead of the rollup.
+        """
+        connection = connections[DailyTotal.objects.db]
+        index = None if connection.in_atomic_block else get_range_index(connection)
+        totals = index.totals(connection, start_date, end_date) if index is not None else None
+        if totals is None and daily_totals.is_maintained(connection):
+            totals = DailyTotal.objects.filter(date__range=[start_date, end_date], user_id=None,
+                                               category=None).aggregate(**_DAILY_TOTALS)
+        elif totals is None:
+            totals = Transaction.objects.filter(date__range=[start_date, end_date]).aggregate(**_TOTALS)
+        totals['net_income'] = totals['total_income'] - totals['total_expense']
+        return totals
 
     @staticmethod
     def get_report_by_id(id: uuid.UUID) -> TransactionReport:
@@ -43,3 +87,13 @@ class TransactionReportServiceImpl(TransactionReportService):
     def get_all_reports() -> List[TransactionReport]:
         transaction_report_list = TransactionReport.objects.all()
         return transaction_report_list
+
+    @staticmethod
+    def filter_reports(start_date: Optional[datetime.date] = None,
+                       end_date: Optional[datetime.date] = None) -> QuerySet[TransactionReport]:
+        transaction_reports = TransactionReport.objects.all()
+        if start_date is not None:
+            transaction_reports = transaction_reports.filter(start_date__gte=start_date)
+        if end_date is not None:
+            transaction_reports = transaction_reports.filter(end_date__lte=end_date)
+        return transaction_reports
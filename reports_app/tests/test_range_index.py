@@ -0,0 +1,174 @@
+import datetime
+import random
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.db import connection, transaction
+
+from reports_app.service import range_index
+from reports_app.service.range_index import RangeIndex, get_range_index
+from reports_app.service.transaction_report_service_impl import _DAILY_TOTALS, TransactionReportServiceImpl
+from transactions_app.models import DailyTotal
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+
+JAN_1 = datetime.date(2024, 1, 1)
+JAN_2 = datetime.date(2024, 1, 2)
+JAN_31 = datetime.date(2024, 1, 31)
+
+
+@pytest.fixture(autouse=True)
+def index_dir(settings, tmp_path):
+    settings.REPORT_RANGE_INDEX_DIR = str(tmp_path)
+    settings.REPORT_RANGE_INDEX_FIRST_DAY = datetime.date(2023, 1, 1)
+    settings.REPORT_RANGE_INDEX_DAYS = 3 * 366
+    settings.REPORT_RANGE_INDEX_MAX_LAG_SECONDS = 0
+    return tmp_path
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def create(user, amount, transaction_type, date):
+    return TransactionServiceImpl.create_transaction(user.id, Decimal(amount), transaction_type, 'misc', date)
+
+
+def rollup_totals(start_date, end_date):
+    totals = DailyTotal.objects.filter(date__range=[start_date, end_date], user_id=None,
+                                       category=None).aggregate(**_DAILY_TOTALS)
+    totals['net_income'] = totals['total_income'] - totals['total_expense']
+    return totals
+
+
+@pytest.mark.django_db(transaction=True)
+def test_range_totals_match_daily_totals(user, index_dir):
+    """
+    Test case: Compute the totals of random periods over transactions spread across three months.
+
+    Expected Result:
+    - The totals read from the shared index file equal the sums of the daily totals, including empty periods
+      and periods ending before they start.
+    """
+    rng = random.Random(7)
+    for _ in range(40):
+        create(user, f'{rng.randint(1, 50000) / 100:.2f}', rng.choice(['income', 'expense']),
+               JAN_1 + datetime.timedelta(days=rng.randrange(90)))
+
+    for _ in range(50):
+        start_date = JAN_1 + datetime.timedelta(days=rng.randrange(-10, 100))
+        end_date = start_date + datetime.timedelta(days=rng.randrange(-2, 60))
+        assert TransactionReportServiceImpl.compute_totals(start_date, end_date) == rollup_totals(start_date,
+                                                                                                  end_date)
+    assert (index_dir / f"{connection.settings_dict['NAME']}.idx").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_index_catches_up_with_writes(user, django_assert_num_queries):
+    """
+    Test case: Compute a period, then create, update and delete transactions through every write path and
+    compute it again, also from a second mapping of the file such as another worker process has.
+
+    Expected Result:
+    - The index is built once; afterwards one query reads the days written since, and the totals follow them.
+    """
+    create(user, '10.00', 'income', JAN_1)
+    TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)
+
+    with mock.patch.object(RangeIndex, '_rebuild', autospec=True, side_effect=RangeIndex._rebuild) as rebuild:
+        created = create(user, '5.00', 'expense', JAN_2)
+        TransactionServiceImpl.update_transactions({'transaction_type': 'income'}, amount=Decimal('20.00'))
+        TransactionServiceImpl.update_transaction(created.id, date=datetime.date(2024, 1, 20))
+        create(user, '1.00', 'income', datetime.date(2024, 2, 1))
+
+        with django_assert_num_queries(1):
+            totals = TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)
+
+        other = RangeIndex(get_range_index(connection).path, datetime.date(2023, 1, 1), 3 * 366)
+        TransactionServiceImpl.delete_transaction(created.id)
+        other_totals = other.totals(connection, JAN_1, JAN_31)
+
+    rebuild.assert_not_called()
+    assert totals == {'total_income': Decimal('20.00'), 'total_expense': Decimal('5.00'),
+                      'net_income': Decimal('15.00'), 'income_count': 1, 'expense_count': 1}
+    assert other_totals == {'total_income': Decimal('20.00'), 'total_expense': Decimal('0.00'),
+                            'income_count': 1, 'expense_count': 0}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_index_within_max_lag_is_not_caught_up(user, settings, django_assert_num_queries):
+    """
+    Test case: Allow the index to lag behind, write a transaction and compute a period.
+
+    Expected Result:
+    - The period is answered without querying the database, without the new transaction.
+    """
+    create(user, '10.00', 'income', JAN_1)
+    TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)
+    settings.REPORT_RANGE_INDEX_MAX_LAG_SECONDS = 60
+    create(user, '5.00', 'income', JAN_1)
+
+    with django_assert_num_queries(0):
+        totals = TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)
+
+    assert totals['total_income'] == Decimal('10.00')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_index_is_rebuilt_after_change_log_retention(user, settings):
+    """
+    Test case: Compute a period with an index that has not caught up within the retention of the change log.
+
+    Expected Result:
+    - The index is rebuilt from the daily totals.
+    """
+    create(user, '10.00', 'income', JAN_1)
+    TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)
+    settings.REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS = 0
+    create(user, '5.00', 'income', JAN_1)
+
+    with mock.patch.object(RangeIndex, '_rebuild', autospec=True, side_effect=RangeIndex._rebuild) as rebuild:
+        totals = TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)
+
+    rebuild.assert_called_once()
+    assert totals['total_income'] == Decimal('15.00')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_periods_outside_index_and_open_transactions_use_daily_totals(user):
+    """
+    Test case: Compute a period reaching past the days covered by the index, and one inside a database
+    transaction holding an uncommitted write.
+
+    Expected Result:
+    - Both are summed from the daily totals; the uncommitted write never reaches the index file.
+    """
+    create(user, '10.00', 'income', JAN_1)
+    late = datetime.date(2023, 1, 1) + datetime.timedelta(days=3 * 366)
+    create(user, '3.00', 'expense', late)
+
+    assert TransactionReportServiceImpl.compute_totals(JAN_1, late) == rollup_totals(JAN_1, late)
+
+    with transaction.atomic(), mock.patch.object(RangeIndex, 'catch_up') as catch_up:
+        create(user, '5.00', 'income', JAN_1)
+        assert TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)['total_income'] == Decimal('15.00')
+        transaction.set_rollback(True)
+
+    catch_up.assert_not_called()
+    assert TransactionReportServiceImpl.compute_totals(JAN_1, JAN_31)['total_income'] == Decimal('10.00')
+
+
+def test_index_cannot_be_opened(settings, tmp_path):
+    """
+    Test case: Point the index at a path where no directory can be created.
+
+    Expected Result:
+    - No index is returned, so periods are summed from the daily totals.
+    """
+    (tmp_path / 'file').write_text('')
+    settings.REPORT_RANGE_INDEX_DIR = str(tmp_path / 'file' / 'index')
+
+    with mock.patch.object(range_index, '_indexes', {}):
+        assert get_range_index(connection) is None
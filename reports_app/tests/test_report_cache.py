@@ -0,0 +1,149 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.db import connection, transaction
+
+from reports_app.service.report_cache import REPORT_CACHE_ALIAS, cached_totals, get_cache_stats
+from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+
+JANUARY = (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+FEBRUARY = (datetime.date(2024, 2, 1), datetime.date(2024, 2, 29))
+MARCH = (datetime.date(2024, 3, 1), datetime.date(2024, 3, 31))
+YEAR_TO_DATE = (datetime.date(2024, 1, 1), datetime.date(2024, 3, 31))
+
+
+@pytest.fixture(autouse=True)
+def report_cache(settings):
+    settings.REPORT_RANGE_INDEX_DIR = ''
+    cache = caches[REPORT_CACHE_ALIAS]
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.fixture
+def compute_totals():
+    with mock.patch.object(TransactionReportServiceImpl, 'compute_totals',
+                           side_effect=TransactionReportServiceImpl.compute_totals) as compute_totals:
+        yield compute_totals
+
+
+def create(user, amount, transaction_type, date):
+    return TransactionServiceImpl.create_transaction(user.id, Decimal(amount), transaction_type, 'misc', date)
+
+
+def computed_periods(compute_totals):
+    return [call.args for call in compute_totals.call_args_list]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_repeated_report_reuses_cached_totals(user, compute_totals, django_assert_num_queries):
+    """
+    Test case: Create two reports of the same period without writes in between.
+
+    Expected Result:
+    - The totals are computed once; the second report checks the change log with one query, reuses them and
+      is counted as a hit. Both reports are saved, each with its data version bump, under the advisory lock
+      of the period.
+    """
+    create(user, '10.00', 'income', datetime.date(2024, 1, 5))
+    first = TransactionReportServiceImpl.create_report(*JANUARY)
+
+    with django_assert_num_queries(5) as queries:
+        second = TransactionReportServiceImpl.create_report(*JANUARY)
+
+    assert computed_periods(compute_totals) == [JANUARY]
+    assert 'EXISTS' in queries.captured_queries[1]['sql']
+    assert (second.total_income, second.income_count) == (first.total_income, first.income_count) == (10, 1)
+    assert first.id != second.id
+    assert get_cache_stats() == {'hits': 1, 'misses': 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_write_invalidates_only_periods_containing_its_date(user, compute_totals):
+    """
+    Test case: Cache January, February and the year to date, then create a transaction in February.
+
+    Expected Result:
+    - February and the year to date are computed again with the new transaction; January is served from the cache.
+    """
+    for period in (JANUARY, FEBRUARY, YEAR_TO_DATE):
+        TransactionReportServiceImpl.create_report(*period)
+    compute_totals.reset_mock()
+
+    create(user, '7.50', 'expense', datetime.date(2024, 2, 10))
+    reports = [TransactionReportServiceImpl.create_report(*period) for period in (JANUARY, FEBRUARY, YEAR_TO_DATE)]
+
+    assert computed_periods(compute_totals) == [FEBRUARY, YEAR_TO_DATE]
+    assert [report.total_expense for report in reports] == [0, Decimal('7.50'), Decimal('7.50')]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_moving_transaction_invalidates_old_and_new_date(user, compute_totals):
+    """
+    Test case: Cache January, February and March, then move a transaction from January to February.
+
+    Expected Result:
+    - January, its old date, and February, its new date, are computed again; March is served from the cache.
+    """
+    moved = create(user, '3.00', 'income', datetime.date(2024, 1, 15))
+    for period in (JANUARY, FEBRUARY, MARCH):
+        TransactionReportServiceImpl.create_report(*period)
+    compute_totals.reset_mock()
+
+    TransactionServiceImpl.update_transaction(moved.id, date=datetime.date(2024, 2, 15))
+    reports = [TransactionReportServiceImpl.create_report(*period) for period in (JANUARY, FEBRUARY, MARCH)]
+
+    assert computed_periods(compute_totals) == [JANUARY, FEBRUARY]
+    assert [report.income_count for report in reports] == [0, 1, 0]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_least_recently_used_periods_are_evicted(report_cache):
+    """
+    Test case: Limit the cache, cache more periods than fit, reading the first period again in between.
+
+    Expected Result:
+    - The least recently used period is evicted and computed again, while the first period is still cached.
+    """
+    compute = mock.Mock(side_effect=TransactionReportServiceImpl.compute_totals)
+    days = [(datetime.date(2024, 1, day), datetime.date(2024, 1, day)) for day in range(1, 6)]
+    with mock.patch.object(report_cache, '_max_entries', 5), mock.patch.object(report_cache, '_cull_frequency', 5):
+        for period in days[:3]:
+            cached_totals(connection, *period, compute)
+        cached_totals(connection, *days[0], compute)
+        for period in days[3:]:
+            cached_totals(connection, *period, compute)
+        compute.reset_mock()
+
+        cached_totals(connection, *days[0], compute)
+        cached_totals(connection, *days[1], compute)
+
+    assert computed_periods(compute) == [days[1]]
+
+
+@pytest.mark.django_db
+def test_reports_inside_transactions_bypass_cache(user, compute_totals):
+    """
+    Test case: Create the same report twice inside a database transaction.
+
+    Expected Result:
+    - The totals are computed both times, as the transaction's own writes are not settled, and nothing is cached.
+    """
+    with transaction.atomic():
+        create(user, '10.00', 'income', datetime.date(2024, 1, 5))
+        TransactionReportServiceImpl.create_report(*JANUARY)
+        TransactionReportServiceImpl.create_report(*JANUARY)
+
+    assert computed_periods(compute_totals) == [JANUARY, JANUARY]
+    assert get_cache_stats() == {'hits': 0, 'misses': 0}
@@ -0,0 +1,280 @@
+import datetime
+import threading
+import time
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.db import OperationalError, connection, connections
+from django.db.backends.utils import CursorWrapper
+
+from reports_app.models import TransactionReport
+from reports_app.service.report_cache import REPORT_CACHE_ALIAS
+from reports_app.service.report_flights import _create_across_workers, _lock_id, _try_lock
+from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+
+JANUARY = (datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+# Time given to the waiting callers to reach their lock or event before the first caller is let go.
+SETTLE_SECONDS = 0.3
+
+
+@pytest.fixture(autouse=True)
+def report_cache(settings):
+    settings.REPORT_RANGE_INDEX_DIR = ''
+    cache = caches[REPORT_CACHE_ALIAS]
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def run_in_thread(target, results, index):
+    def run():
+        try:
+            results[index] = target()
+        except Exception as error:
+            results[index] = error
+        finally:
+            connections.close_all()
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def blocking(side_effect=None):
+    """Return a compute_totals stand-in that blocks until released, with its entered and release events."""
+    entered, release = threading.Event(), threading.Event()
+    compute_totals = TransactionReportServiceImpl.compute_totals
+
+    def compute(start_date, end_date):
+        entered.set()
+        release.wait(5)
+        if side_effect is not None:
+            raise side_effect
+        return compute_totals(start_date, end_date)
+    return mock.Mock(side_effect=compute), entered, release
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_identical_reports_are_coalesced(user):
+    """
+    Test case: Create the same report from five threads while the first one is still computing it.
+
+    Expected Result:
+    - The totals are computed once, a single report is saved, and every caller gets that report.
+    """
+    TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JANUARY[0])
+    compute, entered, release = blocking()
+    results = [None] * 5
+
+    with mock.patch.object(TransactionReportServiceImpl, 'compute_totals', compute):
+        threads = [run_in_thread(lambda: TransactionReportServiceImpl.create_report(*JANUARY), results, 0)]
+        assert entered.wait(5)
+        threads += [run_in_thread(lambda: TransactionReportServiceImpl.create_report(*JANUARY), results, index)
+                    for index in range(1, 5)]
+        time.sleep(SETTLE_SECONDS)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+    assert compute.call_count == 1
+    assert TransactionReport.objects.count() == 1
+    assert {report.id for report in results} == {TransactionReport.objects.get().id}
+    assert results[0].total_income == Decimal('10.00')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failure_is_shared_and_not_remembered():
+    """
+    Test case: Create the same report from two threads while the computation of the first one fails, then again.
+
+    Expected Result:
+    - Both callers get the error and no report is saved; the next call computes the report anew.
+    """
+    compute, entered, release = blocking(side_effect=ValueError('aggregation failed'))
+    results = [None] * 2
+
+    with mock.patch.object(TransactionReportServiceImpl, 'compute_totals', compute):
+        threads = [run_in_thread(lambda: TransactionReportServiceImpl.create_report(*JANUARY), results, 0)]
+        assert entered.wait(5)
+        threads.append(run_in_thread(lambda: TransactionReportServiceImpl.create_report(*JANUARY), results, 1))
+        time.sleep(SETTLE_SECONDS)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not TransactionReport.objects.exists()
+    assert TransactionReportServiceImpl.create_report(*JANUARY).total_income == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sequential_reports_are_not_coalesced():
+    """
+    Test case: Create the same report twice, one call after the other.
+
+    Expected Result:
+    - Each call saves its own report.
+    """
+    first = TransactionReportServiceImpl.create_report(*JANUARY)
+    second = TransactionReportServiceImpl.create_report(*JANUARY)
+
+    assert first.id != second.id
+    assert TransactionReport.objects.count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_waiting_on_advisory_lock_shares_report():
+    """
+    Test case: Create the same report from two workers, each with its own database session, the second one
+    asking while the first holds the advisory lock of the period.
+
+    Expected Result:
+    - The second worker waits for the lock, then returns the report of the first instead of creating its own.
+    """
+    entered, release = threading.Event(), threading.Event()
+
+    def create_first():
+        entered.set()
+        release.wait(5)
+        return TransactionReport.objects.create(start_date=JANUARY[0], end_date=JANUARY[1], total_income=1,
+                                                total_expense=0, net_income=1)
+    create_second = mock.Mock()
+    results = [None] * 2
+
+    threads = [run_in_thread(lambda: _create_across_workers(connection, *JANUARY, create_first), results, 0)]
+    assert entered.wait(5)
+    threads.append(run_in_thread(lambda: _create_across_workers(connection, *JANUARY, create_second), results, 1))
+    time.sleep(SETTLE_SECONDS)
+    release.set()
+    for thread in threads:
+        thread.join(10)
+
+    create_second.assert_not_called()
+    assert results[0].id == results[1].id == TransactionReport.objects.get().id
+
+
+@pytest.mark.django_db(transaction=True)
+def test_waiting_callers_give_up_after_timeout(settings):
+    """
+    Test case: Create the same report from two threads while the first one is stuck computing it, with a short
+    REPORT_FLIGHT_TIMEOUT_SECONDS.
+
+    Expected Result:
+    - The second caller stops waiting and computes its own report while the first one is still stuck; both
+      complete.
+    """
+    settings.REPORT_FLIGHT_TIMEOUT_SECONDS = SETTLE_SECONDS
+    compute, entered, release = blocking()
+    results = [None] * 2
+
+    with mock.patch.object(TransactionReportServiceImpl, 'compute_totals', compute):
+        threads = [run_in_thread(lambda: TransactionReportServiceImpl.create_report(*JANUARY), results, 0)]
+        assert entered.wait(5)
+        threads.append(run_in_thread(lambda: TransactionReportServiceImpl.create_report(*JANUARY), results, 1))
+        time.sleep(3 * SETTLE_SECONDS)
+        computing = compute.call_count
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+    assert computing == 2
+    assert results[0].id != results[1].id
+    assert TransactionReport.objects.count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_gives_up_on_held_advisory_lock(settings):
+    """
+    Test case: Create a report while another database session holds the advisory lock of the period for longer
+    than REPORT_FLIGHT_TIMEOUT_SECONDS.
+
+    Expected Result:
+    - The lock is polled until the timeout, then the report is created without it.
+    """
+    settings.REPORT_FLIGHT_TIMEOUT_SECONDS = SETTLE_SECONDS
+    locked, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_lock(%s)', [_lock_id(*JANUARY)])
+        locked.set()
+        release.wait(5)
+    holder = run_in_thread(hold_lock, [None], 0)
+    assert locked.wait(5)
+    create = mock.Mock(side_effect=lambda: TransactionReport.objects.create(
+        start_date=JANUARY[0], end_date=JANUARY[1], total_income=1, total_expense=0, net_income=1))
+
+    try:
+        report = _create_across_workers(connection, *JANUARY, create)
+    finally:
+        release.set()
+        holder.join(10)
+
+    create.assert_called_once()
+    assert report.id == TransactionReport.objects.get().id
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_unlock_does_not_hide_report_error():
+    """
+    Test case: Fail to create a report, and then to release the advisory lock of the period.
+
+    Expected Result:
+    - The error of the report is raised rather than the one of the unlock, and the lock is released by closing
+      the database session.
+    """
+    execute = CursorWrapper.execute
+
+    def execute_failing_unlock(self, sql, params=None):
+        if 'pg_advisory_unlock' in sql:
+            raise OperationalError('server closed the connection unexpectedly')
+        return execute(self, sql, params)
+
+    with mock.patch.object(CursorWrapper, 'execute', execute_failing_unlock), \
+            pytest.raises(ValueError, match='aggregation failed'):
+        _create_across_workers(connection, *JANUARY, mock.Mock(side_effect=ValueError('aggregation failed')))
+
+    acquired = [None]
+    run_in_thread(lambda: _try_lock(connection, _lock_id(*JANUARY), False, 0), acquired, 0).join(10)
+    assert acquired == [True]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_does_not_share_report_saved_before_waiting():
+    """
+    Test case: Save a report of a period, then create it while another database session holds the advisory lock
+    of the period, which it releases without saving a report.
+
+    Expected Result:
+    - The report saved before the worker started waiting is not shared; the worker creates its own.
+    """
+    older = TransactionReport.objects.create(start_date=JANUARY[0], end_date=JANUARY[1], total_income=1,
+                                             total_expense=0, net_income=1)
+    locked, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_lock(%s)', [_lock_id(*JANUARY)])
+            locked.set()
+            release.wait(5)
+            cursor.execute('SELECT pg_advisory_unlock(%s)', [_lock_id(*JANUARY)])
+    holder = run_in_thread(hold_lock, [None], 0)
+    assert locked.wait(5)
+    create = mock.Mock(side_effect=lambda: TransactionReport.objects.create(
+        start_date=JANUARY[0], end_date=JANUARY[1], total_income=2, total_expense=0, net_income=2))
+    threading.Timer(SETTLE_SECONDS, release.set).start()
+
+    report = _create_across_workers(connection, *JANUARY, create)
+    holder.join(10)
+
+    create.assert_called_once()
+    assert report.id != older.id
+    assert TransactionReport.objects.count() == 2
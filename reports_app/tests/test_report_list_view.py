@@ -39,7 +39,8 @@ def test_create_report_success(api_client, report_request, user):
 
     Expected Result:
     - The response status code is 201 (Created).
-    - The response contains the report data including total_income, total_expense, and net_income.
+    - The response contains the report data including total_income, total_expense, net_income and the counts
+      of income and expense transactions.
     """
     Transaction.objects.create(
         user=user,
@@ -72,6 +73,7 @@ def test_create_report_success(api_client, report_request, user):
     assert Decimal(response.data['total_income']) == 3000.0
     assert Decimal(response.data['total_expense']) == 500.0
     assert Decimal(response.data['net_income']) == 2500.0
+    assert (response.data['income_count'], response.data['expense_count']) == (2, 1)
 
 
 @pytest.mark.django_db
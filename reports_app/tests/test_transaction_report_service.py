@@ -1,5 +1,6 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 from unittest import mock
 
 import pytest
@@ -8,7 +9,16 @@ from django.core.exceptions import ObjectDoesNotExist
 
 from reports_app.models import TransactionReport
 from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
-from transactions_app.models import Transaction
+from transactions_app.models import DailyTotal, Transaction
+from users_app.models import User
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+
+@pytest.fixture(autouse=True)
+def mock_bump_version():
+    """The data version lives in the database, which these tests do not use."""
+    with mock.patch.object(DataVersionServiceImpl, "bump_version") as bump_version:
+        yield bump_version
 
 
 @pytest.fixture
@@ -40,30 +50,93 @@ def transactions_mock():
 
 
 @mock.patch.object(TransactionReport, "save")
-@mock.patch.object(Transaction, "objects")
-def test_create_report(mock_transaction_objects: MagicMock,
+@mock.patch.object(DailyTotal, "objects")
+@mock.patch("reports_app.service.transaction_report_service_impl.cached_totals",
+            side_effect=lambda connection, start_date, end_date, compute: compute(start_date, end_date))
+@mock.patch("reports_app.service.transaction_report_service_impl.coalesce_report",
+            side_effect=lambda connection, start_date, end_date, create: create())
+def test_create_report(mock_coalesce_report: MagicMock,
+                       mock_cached_totals: MagicMock,
+                       mock_daily_total_objects: MagicMock,
                        mock_report_save: MagicMock,
                        transaction_data,
-                       transaction_report_entity):
+                       transaction_report_entity,
+                       settings):
     """Test creating a transaction report successfully.
 
-    This test mocks the Transaction model's filter and aggregate methods, as well as
-    the TransactionReport's save method, to ensure the report is created correctly.
+    This test mocks the DailyTotal model's filter and aggregate methods, as well as
+    the TransactionReport's save method, to ensure the report is created from a single
+    aggregate query over the daily totals of all users and categories, with the report cache and the
+    coalescing of concurrent calls bypassed and the range index turned off.
     """
-    mock_transaction_objects.filter.return_value.filter.return_value.aggregate.side_effect = [
-        {'amount__sum': 5000},  # total_income
-        {'amount__sum': 3000}   # total_expense
-    ]
+    settings.REPORT_RANGE_INDEX_DIR = ''
+    mock_daily_total_objects.db = 'default'
+    mock_daily_total_objects.filter.return_value.aggregate.return_value = {
+        'total_income': Decimal(5000), 'total_expense': Decimal(3000), 'income_count': 2, 'expense_count': 1,
+    }
 
     report = TransactionReportServiceImpl.create_report(
         start_date=transaction_data["start_date"],
         end_date=transaction_data["end_date"]
     )
 
+    mock_daily_total_objects.filter.assert_called_once_with(
+        date__range=[transaction_data["start_date"], transaction_data["end_date"]], user_id=None, category=None)
+    mock_daily_total_objects.filter.return_value.aggregate.assert_called_once()
     mock_report_save.assert_called_once()
+    mock_cached_totals.assert_called_once()
+    mock_coalesce_report.assert_called_once()
     assert report.total_income == 5000
     assert report.total_expense == 3000
     assert report.net_income == 2000
+    assert (report.income_count, report.expense_count) == (2, 1)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('types, expected', [
+    ((), (Decimal('0.00'), Decimal('0.00'), Decimal('0.00'), 0, 0)),
+    (('income', 'income'), (Decimal('30.50'), Decimal('0.00'), Decimal('30.50'), 2, 0)),
+    (('expense',), (Decimal('0.00'), Decimal('10.25'), Decimal('-10.25'), 0, 1)),
+    (('income', 'expense', 'expense'), (Decimal('10.25'), Decimal('40.75'), Decimal('-30.50'), 1, 2)),
+])
+def test_compute_totals(mock_bump_version, types, expected):
+    """
+    Test case: Compute the totals of periods with no transactions, only one type, and both types.
+
+    Expected Result:
+    - Amounts and counts match the transactions of the period; missing types count as zero instead of failing.
+    - Transactions outside the period are left out.
+    """
+    user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+    amounts = iter(('10.25', '20.25', '20.50'))
+    for transaction_type in types:
+        Transaction.objects.create(user=user, amount=next(amounts), transaction_type=transaction_type,
+                                   category="misc", date=date(2024, 1, 15))
+    Transaction.objects.create(user=user, amount="999.00", transaction_type="income", category="misc",
+                               date=date(2024, 2, 1))
+
+    totals = TransactionReportServiceImpl.compute_totals(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert (totals['total_income'], totals['total_expense'], totals['net_income'],
+            totals['income_count'], totals['expense_count']) == expected
+
+
+@pytest.mark.django_db
+def test_create_report_runs_one_aggregate_query(mock_bump_version, django_assert_num_queries):
+    """
+    Test case: Create a report and inspect the queries it runs.
+
+    Expected Result:
+    - The transactions are read by a single query using FILTER clauses, followed by the report INSERT, both
+      after taking the advisory lock of the period, which is released with the test's database transaction.
+    """
+    with django_assert_num_queries(3) as queries:
+        report = TransactionReportServiceImpl.create_report(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert 'pg_try_advisory_xact_lock' in queries.captured_queries[0]['sql']
+    aggregate = queries.captured_queries[1]['sql']
+    assert aggregate.count('FILTER (WHERE') == 4
+    assert report.total_income == 0 and report.income_count == 0
 
 
 @mock.patch.object(TransactionReport, "objects")
@@ -1,6 +1,7 @@
 import uuid
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponseBase
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -8,7 +9,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from reports_app.serializers import ReportRequestSerializer, ReportResponseSerializer
+from core_app.streaming import STREAM_QUERY_PARAMETERS, get_stream_format, stream_records
+from reports_app.serializers import REPORT_LIST_SERIALIZER, ReportRequestSerializer, ReportResponseSerializer
 from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
 
 
@@ -19,6 +21,7 @@ class ReportListView(APIView):
     GET:
     Retrieve a list of all transaction reports.
     If no reports exist, return an empty list.
+    With `stream=1` (or `stream=ndjson`), the reports are streamed as one JSON array (or one JSON object per line).
 
     POST:
     Create a new transaction report for a specified date range.
@@ -52,18 +55,23 @@ class ReportListView(APIView):
 
     @swagger_auto_schema(
         operation_description="Retrieve a list of all transaction reports",
-        responses={200: ReportResponseSerializer(many=True)}
+        manual_parameters=STREAM_QUERY_PARAMETERS,
+        responses={200: ReportResponseSerializer(many=True), 400: 'Invalid stream format'}
     )
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> HttpResponseBase:
         """
         Handle GET requests to return a list of all transaction reports.
 
         This method retrieves all transaction reports from the database via `TransactionReportServiceImpl`,
-        serializes them into JSON, and returns the serialized data in the response.
+        serializes them with the compiled `REPORT_LIST_SERIALIZER`, and returns the serialized data in the response.
+        When streaming is requested, the reports are streamed with `stream_records` instead of being built into
+        one response body.
         """
+        stream_format = get_stream_format(request)
         report_list = TransactionReportServiceImpl.get_all_reports()
-        serializer = ReportResponseSerializer(report_list, many=True)
-        return Response(serializer.data)
+        if stream_format is not None:
+            return stream_records(report_list, REPORT_LIST_SERIALIZER, stream_format)
+        return Response(REPORT_LIST_SERIALIZER.many(REPORT_LIST_SERIALIZER.records(report_list)))
 
 
 class ReportDetailsView(APIView):
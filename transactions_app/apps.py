@@ -1,6 +1,27 @@
+from typing import Any
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.signals import post_migrate
+
+
+def create_upcoming_transaction_partitions(using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """
+    Make sure the partitions of the coming intervals exist after every ``migrate``, so deployments keep them ahead.
+    """
+    from transactions_app.service.transaction_partitioning import create_upcoming_partitions, is_partitioned
+
+    connection = connections[using]
+    table = 'transactions_app_transaction'
+    if is_partitioned(connection, table):
+        create_upcoming_partitions(connection, table, settings.TRANSACTION_PARTITION_INTERVAL,
+                                   settings.TRANSACTION_PARTITIONS_AHEAD)
 
 
 class TransactionsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'transactions_app'
+
+    def ready(self) -> None:
+        post_migrate.connect(create_upcoming_transaction_partitions, sender=self)
@@ -0,0 +1,36 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections, transaction
+
+from transactions_app.models import Transaction
+from transactions_app.service.transaction_partitioning import (create_upcoming_partitions, is_partitioned,
+                                                                split_default_partition)
+
+
+class Command(BaseCommand):
+    help = ("Create the partitions of the transactions table for the coming months (or years), and give the "
+            "transactions parked in the default partition a partition of their own. Meant to be run on a schedule "
+            "(cron).")
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--ahead', type=int, default=settings.TRANSACTION_PARTITIONS_AHEAD,
+                            help="Number of intervals to create partitions for after the current one")
+        parser.add_argument('--skip-default', action='store_true',
+                            help="Do not move rows out of the default partition")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = connections[Transaction.objects.db]
+        table = Transaction._meta.db_table
+        if not is_partitioned(connection, table):
+            raise CommandError(f"{table} is not a partitioned table; apply the migrations on PostgreSQL first.")
+
+        interval = settings.TRANSACTION_PARTITION_INTERVAL
+        with transaction.atomic(using=connection.alias):
+            created = create_upcoming_partitions(connection, table, interval, options['ahead'])
+            if not options['skip_default']:
+                created += split_default_partition(connection, table, interval)
+        for name in created:
+            self.stdout.write(f"Created partition {name}")
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partition(s) of {table}"))
@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from transactions_app.models import DailyTotalChange
+from transactions_app.service import daily_totals
+
+
+class Command(BaseCommand):
+    help = ("Delete the logged daily total changes older than REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS. "
+            "Meant to be run on a schedule (cron).")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = connections[DailyTotalChange.objects.db]
+        if not daily_totals.is_maintained(connection):
+            raise CommandError(f"Daily totals are not maintained on {connection.vendor}.")
+        pruned = daily_totals.prune_expired_changes(connection, force=True)
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} daily total change(s)"))
@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections, transaction
+
+from transactions_app.models import DailyTotal
+from transactions_app.service import daily_totals
+
+
+class Command(BaseCommand):
+    help = ("Recompute the daily transaction totals used by reports from the transactions, or with --verify, "
+            "only compare them and list the differences.")
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--verify', action='store_true', help="Compare the totals without changing them")
+        parser.add_argument('--limit', type=int, default=20, help="Differences to list with --verify")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = connections[DailyTotal.objects.db]
+        if not daily_totals.is_maintained(connection):
+            raise CommandError(f"Daily totals are not maintained on {connection.vendor}.")
+
+        if options['verify']:
+            mismatches = daily_totals.verify(connection, limit=options['limit'])
+            for mismatch in mismatches:
+                scope = f"user {mismatch.user_id}, {mismatch.category}" if mismatch.user_id else "all"
+                self.stderr.write(f"{mismatch.date} {mismatch.transaction_type} ({scope}): expected "
+                                  f"{mismatch.expected_total or 0} in {mismatch.expected_count or 0} transaction(s), "
+                                  f"found {mismatch.actual_total or 0} in {mismatch.actual_count or 0}")
+            if mismatches:
+                raise CommandError("Daily totals differ from the transactions; run rebuild_daily_totals to fix them.")
+            self.stdout.write(self.style.SUCCESS("Daily totals match the transactions"))
+            return
+
+        with transaction.atomic(using=connection.alias):
+            rows = daily_totals.rebuild(connection)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily total(s)"))
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import migrations
+
+from transactions_app.service.transaction_partitioning import convert_to_partitioned, convert_to_plain
+
+TABLE = 'transactions_app_transaction'
+
+
+def partition_transactions(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    convert_to_partitioned(schema_editor.connection, TABLE, settings.TRANSACTION_PARTITION_INTERVAL,
+                           settings.TRANSACTION_PARTITIONS_AHEAD)
+
+
+def unpartition_transactions(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    convert_to_plain(schema_editor.connection, TABLE, ['id'])
+
+
+class Migration(migrations.Migration):
+    """
+    Partition the transactions table by ranges of dates, so date range queries only scan the matching partitions.
+
+    The model is unchanged: the table's primary key becomes (id, date), which Django does not need to know about.
+    Trade-offs: the database no longer enforces the uniqueness of id alone, left to the random UUIDs, and a lookup
+    by id alone probes the index of every partition, unless the date is given too (see the Transaction model).
+    """
+
+    dependencies = [
+        ('transactions_app', '0005_transaction_user_fk_no_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_transactions, unpartition_transactions, elidable=False),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:12
+
+from django.db import migrations, models
+
+from transactions_app.service import daily_totals
+
+
+def install_daily_totals(apps, schema_editor):
+    if daily_totals.is_maintained(schema_editor.connection):
+        daily_totals.install_triggers(schema_editor.connection)
+        daily_totals.rebuild(schema_editor.connection)
+
+
+def drop_daily_totals(apps, schema_editor):
+    if daily_totals.is_maintained(schema_editor.connection):
+        daily_totals.drop_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions_app', '0006_partition_transactions_by_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('transaction_type', models.CharField(choices=[('income', 'Income'), ('expense', 'Expense')], max_length=7)),
+                ('user_id', models.UUIDField(null=True)),
+                ('category', models.CharField(max_length=50, null=True)),
+                ('total', models.DecimalField(decimal_places=2, max_digits=16)),
+                ('count', models.IntegerField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(condition=models.Q(('user_id', None)), fields=('date', 'transaction_type'), include=('total', 'count'), name='daily_total_all_key'), models.UniqueConstraint(condition=models.Q(('user_id__isnull', False)), fields=('date', 'transaction_type', 'user_id', 'category'), name='daily_total_user_key')],
+            },
+        ),
+        migrations.RunPython(install_daily_totals, drop_daily_totals, elidable=False),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:40
+
+from django.db import migrations, models
+
+from transactions_app.service import daily_totals
+
+
+def install_change_log(apps, schema_editor):
+    if daily_totals.is_maintained(schema_editor.connection):
+        daily_totals.install_change_log(schema_editor.connection)
+
+
+def drop_change_log(apps, schema_editor):
+    if daily_totals.is_maintained(schema_editor.connection):
+        daily_totals.drop_change_log(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions_app', '0007_daily_total'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTotalChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('xid', models.BigIntegerField(db_index=True)),
+                ('changed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(install_change_log, drop_change_log, elidable=False),
+    ]
@@ -7,6 +7,14 @@ class TransactionType(models.TextChoices):
     EXPENSE = 'expense', 'Expense'
 
 class Transaction(models.Model):
+    """
+    On PostgreSQL the table is partitioned by date (see transactions_app.service.transaction_partitioning).
+
+    Its primary key is then (id, date), as a partitioned table only enforces unique keys that include the
+    partition key: the database no longer guarantees that ids are unique, which rests on them being random
+    UUIDs. A lookup by id alone probes the primary key index of every partition, so the service methods taking
+    an id also take the date of the transaction where the caller knows it, to read a single partition.
+    """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     date = models.DateField()
@@ -15,4 +23,61 @@ class Transaction(models.Model):
         choices=TransactionType.choices
     )
     category = models.CharField(max_length=50)
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='transactions')
+    # Lookups by user are served by the (user, date, id) index below.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='transactions', db_index=False)
+
+    class Meta:
+        indexes = [
+            # Serves date range filters as well as the keyset pagination order of the list endpoint.
+            models.Index(fields=['date', 'id'], name='transaction_date_id_idx'),
+            # Equality filters followed by the pagination order, so a filtered page is one index range scan.
+            models.Index(fields=['user', 'date', 'id'], name='transaction_user_date_id_idx'),
+            models.Index(fields=['transaction_type', 'date', 'id'], name='transaction_type_date_id_idx'),
+            models.Index(fields=['category', 'date', 'id'], name='transaction_cat_date_id_idx'),
+            models.Index(fields=['amount'], name='transaction_amount_idx'),
+        ]
+
+
+class DailyTotal(models.Model):
+    """
+    Sum and count of the transactions of a day and type, maintained by database triggers on the transactions table.
+
+    Each day and type has a row over all users and categories, where user_id and category are NULL, plus one
+    row per user and category. Reports over a period read the former, at most two rows per day, instead of
+    every transaction of the period. Rows are added and adjusted in the transaction of the write they account
+    for, and removed once their count drops to zero.
+    """
+    date = models.DateField()
+    transaction_type = models.CharField(max_length=7, choices=TransactionType.choices)
+    # Not a foreign key: the rows of a user go away with their transactions, before the user is deleted.
+    user_id = models.UUIDField(null=True)
+    category = models.CharField(max_length=50, null=True)
+    total = models.DecimalField(max_digits=16, decimal_places=2)
+    count = models.IntegerField()
+
+    class Meta:
+        # Two partial keys rather than one over all four columns with nulls_distinct=False, which PostgreSQL only
+        # enforces from version 15 on. The triggers upsert each level of rows against its own key.
+        constraints = [
+            # Also serves index-only scans of the rows over all users and categories, for report periods.
+            models.UniqueConstraint(fields=['date', 'transaction_type'], include=['total', 'count'],
+                                    condition=models.Q(user_id=None), name='daily_total_all_key'),
+            models.UniqueConstraint(fields=['date', 'transaction_type', 'user_id', 'category'],
+                                    condition=models.Q(user_id__isnull=False), name='daily_total_user_key'),
+        ]
+
+
+class DailyTotalChange(models.Model):
+    """
+    Day whose totals over all users and categories were written by a database transaction, logged by triggers
+    on the daily totals.
+
+    Copies of the daily totals kept outside the database (see reports_app.service.range_index) catch up by
+    re-reading the days written by transactions that were not yet settled at their previous read, instead of
+    reading every day again. Rows older than REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS are pruned by the
+    report cache as it reads them, and by the prune_daily_total_changes command.
+    """
+    date = models.DateField()
+    # PostgreSQL id (xid8) of the writing transaction, comparable with the xmin of a snapshot.
+    xid = models.BigIntegerField(db_index=True)
+    changed_at = models.DateTimeField()
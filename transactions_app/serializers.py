@@ -1,6 +1,9 @@
+from typing import Any
+
 from rest_framework import serializers
 
-from transactions_app.models import Transaction
+from core_app.compiled_serializers import CompiledSerializer
+from transactions_app.models import Transaction, TransactionType
 
 
 class TransactionSerializer(serializers.ModelSerializer):
@@ -12,3 +15,52 @@ class TransactionSerializer(serializers.ModelSerializer):
         if value < 0:
             raise serializers.ValidationError("Amount must be non-negative.")
         return value
+
+
+# Read path of the transaction list, with the same output as TransactionSerializer(many=True).
+TRANSACTION_LIST_SERIALIZER = CompiledSerializer(TransactionSerializer)
+
+
+class TransactionFilterSerializer(serializers.Serializer):
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    user = serializers.UUIDField(required=False)
+    category = serializers.CharField(required=False, max_length=50)
+    transaction_type = serializers.ChoiceField(required=False, choices=TransactionType.choices)
+    min_amount = serializers.DecimalField(required=False, max_digits=10, decimal_places=2)
+    max_amount = serializers.DecimalField(required=False, max_digits=10, decimal_places=2)
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        if 'start_date' in data and 'end_date' in data and data['end_date'] < data['start_date']:
+            raise serializers.ValidationError("End date must be after start date.")
+        if 'min_amount' in data and 'max_amount' in data and data['max_amount'] < data['min_amount']:
+            raise serializers.ValidationError("Maximum amount must not be below minimum amount.")
+        return data
+
+    def get_service_filters(self) -> dict[str, Any]:
+        """
+        Return the validated filters as keyword arguments of `TransactionService.filter_transactions`.
+        """
+        return {'user_id' if name == 'user' else name: value for name, value in self.validated_data.items()}
+
+
+class TransactionLookupSerializer(serializers.Serializer):
+    """
+    The date a transaction is stored under, if the client knows it, so looking it up by ID reads one partition.
+    """
+    date = serializers.DateField(required=False)
+
+
+class TransactionBulkUpdateSerializer(serializers.ModelSerializer):
+    """
+    The fields set on every transaction matched by a bulk update; at least one is required.
+    """
+    class Meta:
+        model = Transaction
+        fields = ('date', 'transaction_type', 'category', 'user')
+        extra_kwargs = {field: {'required': False} for field in fields}
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        if not data:
+            raise serializers.ValidationError("Provide at least one field to update.")
+        return data
@@ -0,0 +1,242 @@
+import datetime
+import logging
+import time
+import uuid
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+TRANSACTIONS_TABLE = 'transactions_app_transaction'
+DAILY_TOTALS_TABLE = 'transactions_app_dailytotal'
+DAILY_TOTAL_CHANGES_TABLE = 'transactions_app_dailytotalchange'
+
+# Levels of the rollup: every user and category of a day and type, and all of them together.
+_GROUPING_SETS = 'GROUPING SETS ((date, transaction_type, user_id, category), (date, transaction_type))'
+
+# Rows seen by the trigger of each kind of statement, as signed amounts and counts.
+_CHANGES = {
+    'insert': 'SELECT date, transaction_type, user_id, category, amount, 1 AS n FROM new_rows',
+    'update': 'SELECT date, transaction_type, user_id, category, amount, 1 AS n FROM new_rows UNION ALL '
+              'SELECT date, transaction_type, user_id, category, -amount, -1 FROM old_rows',
+    'delete': 'SELECT date, transaction_type, user_id, category, -amount AS amount, -1 AS n FROM old_rows',
+}
+
+# How often a process reading the change log prunes it, and when each database was last pruned (monotonic).
+_PRUNE_INTERVAL_SECONDS = 10 * 60
+_pruned_at: dict[str, float] = {}
+
+_TRANSITION_TABLES = {
+    'insert': 'NEW TABLE AS new_rows',
+    'update': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'delete': 'OLD TABLE AS old_rows',
+}
+
+# Levels of the rows upserted by the triggers, each with its grouping, the key and user_id and category
+# columns of its rows, and the predicate of its partial unique key on the daily totals. The rows over all
+# users and categories are upserted first, so concurrent statements lock them in the same order.
+_LEVELS = (
+    ('date, transaction_type', 'NULL::uuid, NULL::varchar', 'user_id IS NULL'),
+    ('date, transaction_type, user_id, category', 'user_id, category', 'user_id IS NOT NULL'),
+)
+
+_UPSERT = """
+    WITH upserted AS (
+        INSERT INTO {totals} AS totals (date, transaction_type, user_id, category, total, count)
+        SELECT date, transaction_type, {columns}, sum(amount), sum(n)::integer
+        FROM ({changes}) AS changes
+        GROUP BY {key}
+        HAVING sum(n) <> 0 OR sum(amount) <> 0
+        ORDER BY {key}
+        ON CONFLICT ({key}) WHERE {predicate} DO UPDATE
+            SET total = totals.total + excluded.total, count = totals.count + excluded.count
+        RETURNING totals.id, totals.count
+    )
+    SELECT emptied || array_agg(id) INTO emptied FROM upserted WHERE count = 0;"""
+
+_FUNCTION = """
+CREATE OR REPLACE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    emptied bigint[];
+BEGIN{upserts}
+    IF emptied IS NOT NULL THEN
+        DELETE FROM {totals} WHERE id = ANY(emptied);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+_TRIGGER = ('CREATE TRIGGER {function} AFTER {operation} ON {table} REFERENCING {transition_tables} '
+            'FOR EACH STATEMENT EXECUTE FUNCTION {function}()')
+
+# Days of the rows over all users and categories written by each kind of statement on the daily totals.
+_CHANGED_DAYS = {
+    'insert': 'SELECT date FROM new_rows WHERE user_id IS NULL',
+    'update': 'SELECT date FROM new_rows WHERE user_id IS NULL UNION SELECT date FROM old_rows WHERE user_id IS NULL',
+    'delete': 'SELECT date FROM old_rows WHERE user_id IS NULL',
+}
+
+_CHANGE_LOG_FUNCTION = """
+CREATE OR REPLACE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO {changes} (date, xid, changed_at)
+    SELECT DISTINCT date, pg_current_xact_id()::text::bigint, now() FROM ({changed_days}) AS changed_days;
+    RETURN NULL;
+END
+$$
+"""
+
+_EXPECTED_TOTALS = (f'SELECT date, transaction_type, user_id, category, sum(amount) AS total, count(*) AS count '
+                    f'FROM {TRANSACTIONS_TABLE} GROUP BY {_GROUPING_SETS}')
+
+
+class Mismatch(NamedTuple):
+    date: datetime.date
+    transaction_type: str
+    user_id: Optional[uuid.UUID]
+    category: Optional[str]
+    expected_total: Optional[Decimal]
+    expected_count: Optional[int]
+    actual_total: Optional[Decimal]
+    actual_count: Optional[int]
+
+
+def is_maintained(connection: BaseDatabaseWrapper) -> bool:
+    """
+    Tell whether the daily totals are kept up to date on the database, which is done by PostgreSQL triggers.
+    """
+    return connection.vendor == 'postgresql'
+
+
+def install_triggers(connection: BaseDatabaseWrapper) -> None:
+    """
+    Create the statement-level triggers that apply every INSERT, UPDATE and DELETE on the transactions table
+    to the daily totals.
+
+    Each trigger aggregates the rows changed by the statement from its transition tables, so a bulk statement
+    adjusts each affected total once, and upserts the differences in the statement's own transaction. This covers
+    every write path alike: service methods, bulk updates and deletes, COPY imports and cascades.
+    """
+    with connection.cursor() as cursor:
+        for operation, changes in _CHANGES.items():
+            function = _function_name(operation)
+            upserts = ''.join(_UPSERT.format(totals=DAILY_TOTALS_TABLE, columns=columns, changes=changes, key=key,
+                                             predicate=predicate) for key, columns, predicate in _LEVELS)
+            cursor.execute(_FUNCTION.format(function=function, upserts=upserts, totals=DAILY_TOTALS_TABLE))
+            cursor.execute(_TRIGGER.format(function=function, operation=operation.upper(),
+                                           table=TRANSACTIONS_TABLE,
+                                           transition_tables=_TRANSITION_TABLES[operation]))
+
+
+def drop_triggers(connection: BaseDatabaseWrapper) -> None:
+    with connection.cursor() as cursor:
+        for operation in _CHANGES:
+            function = _function_name(operation)
+            cursor.execute(f'DROP TRIGGER IF EXISTS {function} ON {TRANSACTIONS_TABLE}')
+            cursor.execute(f'DROP FUNCTION IF EXISTS {function}()')
+
+
+def install_change_log(connection: BaseDatabaseWrapper) -> None:
+    """
+    Create the statement-level triggers that log, for every statement writing daily totals over all users and
+    categories, the days it wrote along with the id of its transaction.
+    """
+    with connection.cursor() as cursor:
+        for operation, changed_days in _CHANGED_DAYS.items():
+            function = _change_log_function_name(operation)
+            cursor.execute(_CHANGE_LOG_FUNCTION.format(function=function, changes=DAILY_TOTAL_CHANGES_TABLE,
+                                                       changed_days=changed_days))
+            cursor.execute(_TRIGGER.format(function=function, operation=operation.upper(),
+                                           table=DAILY_TOTALS_TABLE,
+                                           transition_tables=_TRANSITION_TABLES[operation]))
+
+
+def drop_change_log(connection: BaseDatabaseWrapper) -> None:
+    with connection.cursor() as cursor:
+        for operation in _CHANGED_DAYS:
+            function = _change_log_function_name(operation)
+            cursor.execute(f'DROP TRIGGER IF EXISTS {function} ON {DAILY_TOTALS_TABLE}')
+            cursor.execute(f'DROP FUNCTION IF EXISTS {function}()')
+
+
+def prune_change_log(connection: BaseDatabaseWrapper, before: datetime.datetime) -> int:
+    """
+    Delete the logged changes of transactions started before the given time.
+
+    :return: The number of deleted changes.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {DAILY_TOTAL_CHANGES_TABLE} WHERE changed_at < %s', [before])
+        return cursor.rowcount
+
+
+def prune_expired_changes(connection: BaseDatabaseWrapper, force: bool = False) -> int:
+    """
+    Delete the logged changes older than REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS.
+
+    Unless forced, a process prunes each database at most once per _PRUNE_INTERVAL_SECONDS, counted from its
+    first call, so readers of the change log may call this on every read.
+
+    :return: The number of deleted changes.
+    """
+    now = time.monotonic()
+    if not force and now - _pruned_at.setdefault(connection.alias, now) < _PRUNE_INTERVAL_SECONDS:
+        return 0
+    _pruned_at[connection.alias] = now
+    retention = datetime.timedelta(seconds=settings.REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS)
+    pruned = prune_change_log(connection, timezone.now() - retention)
+    logger.info(f"Pruned {pruned} daily total change(s)")
+    return pruned
+
+
+def rebuild(connection: BaseDatabaseWrapper) -> int:
+    """
+    Recompute all daily totals from the transactions. Writes to the transactions are blocked meanwhile,
+    reads are not. Meant to run inside a transaction.
+
+    :return: The number of daily total rows.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE {TRANSACTIONS_TABLE} IN SHARE MODE')
+        cursor.execute(f'DELETE FROM {DAILY_TOTALS_TABLE}')
+        cursor.execute(f'INSERT INTO {DAILY_TOTALS_TABLE} (date, transaction_type, user_id, category, total, count) '
+                       f'{_EXPECTED_TOTALS}')
+        rows = cursor.rowcount
+    logger.info(f"Rebuilt {rows} daily total(s)")
+    return rows
+
+
+def verify(connection: BaseDatabaseWrapper, limit: int = 100) -> list[Mismatch]:
+    """
+    Compare the daily totals with the totals computed from the transactions.
+
+    :param limit: The largest number of mismatches to return.
+    :return: The totals that are missing, superfluous or different, ordered by date.
+    """
+    # Both sides are stacked and grouped by their key rather than joined, as grouping treats NULL keys as equal.
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT date, transaction_type, user_id, category, sum(expected_total), sum(expected_count), '
+                       f'sum(actual_total), sum(actual_count) FROM ('
+                       f'SELECT date, transaction_type, user_id, category, total AS expected_total, '
+                       f'count AS expected_count, NULL::numeric AS actual_total, NULL::integer AS actual_count '
+                       f'FROM ({_EXPECTED_TOTALS}) AS expected UNION ALL '
+                       f'SELECT date, transaction_type, user_id, category, NULL, NULL, total, count '
+                       f'FROM {DAILY_TOTALS_TABLE}) AS totals '
+                       f'GROUP BY date, transaction_type, user_id, category '
+                       f'HAVING sum(expected_total) IS DISTINCT FROM sum(actual_total) '
+                       f'OR sum(expected_count) IS DISTINCT FROM sum(actual_count) '
+                       f'ORDER BY date, transaction_type, user_id NULLS FIRST, category NULLS FIRST LIMIT %s', [limit])
+        return [Mismatch(*row) for row in cursor.fetchall()]
+
+
+def _function_name(operation: str) -> str:
+    return f'{DAILY_TOTALS_TABLE}_{operation}'
+
+
+def _change_log_function_name(operation: str) -> str:
+    return f'{DAILY_TOTAL_CHANGES_TABLE}_{operation}'
@@ -0,0 +1,145 @@
+import datetime
+import uuid
+from decimal import Decimal, InvalidOperation
+from typing import Any, Mapping, Sequence
+
+from django.utils.dateparse import parse_date
+
+from transactions_app.models import Transaction, TransactionType
+from users_app.models import User
+
+_TRANSACTION_TYPES = frozenset(TransactionType.values)
+_AMOUNT_FIELD = Transaction._meta.get_field('amount')
+_CATEGORY_MAX_LENGTH = Transaction._meta.get_field('category').max_length
+_AMOUNT_LIMIT = Decimal(10) ** (_AMOUNT_FIELD.max_digits - _AMOUNT_FIELD.decimal_places)
+_AMOUNT_QUANTUM = Decimal(10) ** -_AMOUNT_FIELD.decimal_places
+
+ValidRow = tuple[int, dict[str, Any]]
+RowErrors = tuple[int, dict[str, list[str]]]
+
+
+def validate_transaction_rows(rows: Sequence[tuple[int, Mapping[str, Any]]]) -> tuple[list[ValidRow], list[RowErrors]]:
+    """
+    Validate a batch of transactions with the rules of `TransactionSerializer`, without a query per row.
+
+    Each row is given as ``(row number, raw values)``; values may be strings (e.g. from a CSV file) or
+    JSON values. The field checks run in a single pass over the batch, and the referenced users are
+    checked with one ``IN`` query for the whole batch. Unlike the serializer, empty strings are reported
+    as missing values, as a CSV file has no other way to leave a value out.
+
+    :return: The valid rows with their cleaned values (``user`` becomes ``user_id``), and the
+             errors of the invalid rows in the serializer's error format.
+    """
+    cleaned: list[ValidRow] = []
+    errors: list[RowErrors] = []
+    for number, values in rows:
+        row, row_errors = _clean_row(values)
+        if row_errors:
+            errors.append((number, row_errors))
+        else:
+            cleaned.append((number, row))
+
+    user_ids = {row['user_id'] for _, row in cleaned}
+    existing = set(User.objects.filter(id__in=user_ids).values_list('id', flat=True)) if user_ids else set()
+
+    valid: list[ValidRow] = []
+    for number, row in cleaned:
+        if row['user_id'] in existing:
+            valid.append((number, row))
+        else:
+            errors.append((number, {'user': [f'Invalid pk "{row["user_id"]}" - object does not exist.']}))
+    errors.sort(key=lambda error: error[0])
+    return valid, errors
+
+
+def _clean_row(values: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    row: dict[str, Any] = {}
+    errors: dict[str, list[str]] = {}
+    for name, clean in _FIELD_CLEANERS.items():
+        value = values.get(name)
+        if value is None or value == '':
+            errors[name] = ['This field is required.']
+            continue
+        try:
+            row['user_id' if name == 'user' else name] = clean(value)
+        except ValueError as exc:
+            errors[name] = [str(exc)]
+    return row, errors
+
+
+def _clean_amount(value: Any) -> Decimal:
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError('A valid number is required.')
+    if not amount.is_finite():
+        raise ValueError('A valid number is required.')
+    if amount < 0:
+        raise ValueError('Amount must be non-negative.')
+    if amount >= _AMOUNT_LIMIT:
+        raise ValueError(f'Ensure that there are no more than {_AMOUNT_FIELD.max_digits} digits in total.')
+    if amount != amount.quantize(_AMOUNT_QUANTUM):
+        raise ValueError(f'Ensure that there are no more than {_AMOUNT_FIELD.decimal_places} decimal places.')
+    return amount
+
+
+def _clean_date(value: Any) -> datetime.date:
+    # Like `DateField`, parse strings with Django's parse_date, so both endpoints take the same dates whatever
+    # date.fromisoformat accepts on the running Python version.
+    if isinstance(value, datetime.datetime):
+        raise ValueError('Expected a date but got a datetime.')
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        date = parse_date(value)
+    except (ValueError, TypeError):
+        date = None
+    if date is None:
+        raise ValueError('Date has wrong format. Use one of these formats instead: YYYY-MM-DD.')
+    return date
+
+
+def _clean_transaction_type(value: Any) -> str:
+    # Like `ChoiceField`, compare the value as a string, without trimming it.
+    transaction_type = str(value)
+    if transaction_type not in _TRANSACTION_TYPES:
+        raise ValueError(f'"{value}" is not a valid choice.')
+    return transaction_type
+
+
+def _clean_category(value: Any) -> str:
+    category = _clean_string(value)
+    if len(category) > _CATEGORY_MAX_LENGTH:
+        raise ValueError(f'Ensure this field has no more than {_CATEGORY_MAX_LENGTH} characters.')
+    return category
+
+
+def _clean_string(value: Any) -> str:
+    # Like `CharField`, take strings and numbers only: str() of a list or an object is not a meaningful value.
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError('Not a valid string.')
+    string = str(value).strip()
+    if not string:
+        raise ValueError('This field may not be blank.')
+    # PostgreSQL cannot store NUL characters in text.
+    if '\x00' in string:
+        raise ValueError('Null characters are not allowed.')
+    return string
+
+
+def _clean_user(value: Any) -> uuid.UUID:
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise ValueError('Must be a valid UUID.')
+
+
+_FIELD_CLEANERS = {
+    'amount': _clean_amount,
+    'date': _clean_date,
+    'transaction_type': _clean_transaction_type,
+    'category': _clean_category,
+    'user': _clean_user,
+}
@@ -0,0 +1,274 @@
+import datetime
+import logging
+import re
+from typing import Callable, Iterable, NamedTuple
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.utils import CursorWrapper
+
+logger = logging.getLogger(__name__)
+
+MONTH = 'month'
+YEAR = 'year'
+INTERVALS = (MONTH, YEAR)
+
+# Column the transactions table is partitioned by, and the columns of the primary key of the partitioned table,
+# which has to include the partition key.
+PARTITION_KEY = 'date'
+PARTITIONED_PRIMARY_KEY = ('id', PARTITION_KEY)
+
+DEFAULT_PARTITION_SUFFIX = 'pdefault'
+
+_RANGE_BOUND = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+Quote = Callable[[str], str]
+
+
+class Partition(NamedTuple):
+    name: str
+    start: datetime.date
+    end: datetime.date
+
+
+def partition_range(day: datetime.date, interval: str) -> tuple[datetime.date, datetime.date]:
+    """
+    Return the bounds ``[start, end)`` of the partition holding the given day.
+    """
+    if interval == MONTH:
+        start = day.replace(day=1)
+        return start, (start + datetime.timedelta(days=32)).replace(day=1)
+    if interval == YEAR:
+        start = day.replace(month=1, day=1)
+        return start, start.replace(year=start.year + 1)
+    raise ValueError(f"Unknown partition interval {interval!r}, expected one of {', '.join(INTERVALS)}.")
+
+
+def partition_suffix(start: datetime.date, interval: str) -> str:
+    return f'p{start:%Y_%m}' if interval == MONTH else f'p{start:%Y}'
+
+
+def is_partitioned(connection: BaseDatabaseWrapper, table: str) -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)', [table])
+        return cursor.fetchone() is not None
+
+
+def get_partitions(connection: BaseDatabaseWrapper, table: str) -> list[Partition]:
+    """
+    Return the range partitions of the table ordered by their bounds, leaving out the default partition.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i '
+                       'JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass', [table])
+        partitions = []
+        for name, bound in cursor.fetchall():
+            match = _RANGE_BOUND.search(bound)
+            if match:
+                start, end = (datetime.date.fromisoformat(value) for value in match.groups())
+                partitions.append(Partition(name, start, end))
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def convert_to_partitioned(connection: BaseDatabaseWrapper, table: str, interval: str, ahead: int) -> None:
+    """
+    Turn a plain table into a table partitioned by ranges of its ``date`` column, keeping its rows.
+
+    The primary key becomes ``(id, date)``, since PostgreSQL requires unique constraints of a partitioned table
+    to include the partition key; foreign keys, check constraints and indexes are recreated under their names on
+    the partitioned table. Rows are moved into one partition per interval holding data, partitions are created
+    for the current interval and the ``ahead`` following ones, and a default partition catches all other dates
+    until `split_default_partition` gives them a partition of their own. Meant to run inside a transaction.
+    """
+    quote = connection.ops.quote_name
+    # Run the deferred foreign key checks of earlier writes, which would keep the old table from being dropped.
+    connection.check_constraints()
+    with connection.cursor() as cursor:
+        indexes = _get_index_definitions(cursor, table)
+        constraints = _get_constraint_definitions(cursor, table)
+        primary_key = _get_primary_key_name(cursor, table)
+        old_table = f'{table}_unpartitioned'
+        for name, _, _ in indexes:
+            cursor.execute(f'DROP INDEX {quote(name)}')
+        for name, _ in constraints:
+            cursor.execute(f'ALTER TABLE {quote(table)} DROP CONSTRAINT {quote(name)}')
+        cursor.execute(f'ALTER TABLE {quote(table)} DROP CONSTRAINT {quote(primary_key)}')
+        cursor.execute(f'ALTER TABLE {quote(table)} RENAME TO {quote(old_table)}')
+
+        cursor.execute(f'CREATE TABLE {quote(table)} (LIKE {quote(old_table)} INCLUDING DEFAULTS '
+                       f'INCLUDING CONSTRAINTS) PARTITION BY RANGE ({quote(PARTITION_KEY)})')
+        _add_constraints(cursor, quote, table, primary_key, PARTITIONED_PRIMARY_KEY, constraints, indexes)
+
+        cursor.execute(f"SELECT DISTINCT date_trunc(%s, {quote(PARTITION_KEY)})::date FROM {quote(old_table)}",
+                       [interval])
+        starts = [start for start, in cursor.fetchall()]
+        _create_partitions(cursor, quote, table, interval, starts + _upcoming_starts(interval, ahead))
+        _create_default_partition(cursor, quote, table)
+
+        cursor.execute(f'INSERT INTO {quote(table)} SELECT * FROM {quote(old_table)}')
+        cursor.execute(f'DROP TABLE {quote(old_table)}')
+    logger.info(f"Partitioned {table} by {interval}")
+
+
+def convert_to_plain(connection: BaseDatabaseWrapper, table: str, primary_key_columns: Iterable[str]) -> None:
+    """
+    Turn a partitioned table back into a plain table with the given primary key, keeping its rows.
+    """
+    quote = connection.ops.quote_name
+    connection.check_constraints()
+    with connection.cursor() as cursor:
+        indexes = _get_index_definitions(cursor, table)
+        constraints = _get_constraint_definitions(cursor, table)
+        primary_key = _get_primary_key_name(cursor, table)
+        old_table = f'{table}_partitioned'
+        cursor.execute(f'ALTER TABLE {quote(table)} RENAME TO {quote(old_table)}')
+        cursor.execute(f'CREATE TABLE {quote(table)} (LIKE {quote(old_table)} INCLUDING DEFAULTS '
+                       f'INCLUDING CONSTRAINTS)')
+        cursor.execute(f'INSERT INTO {quote(table)} SELECT * FROM {quote(old_table)}')
+        cursor.execute(f'DROP TABLE {quote(old_table)} CASCADE')
+        _add_constraints(cursor, quote, table, primary_key, primary_key_columns, constraints, indexes)
+    logger.info(f"Converted {table} back to a plain table")
+
+
+def create_partitions(connection: BaseDatabaseWrapper, table: str, interval: str,
+                      first_day: datetime.date, last_day: datetime.date) -> list[str]:
+    """
+    Create the partitions of the intervals between the two days that are not covered by a partition yet.
+
+    Rows of these intervals that landed in the default partition are moved into the new partitions.
+
+    :return: The names of the created partitions.
+    """
+    starts = []
+    start = partition_range(first_day, interval)[0]
+    while start <= last_day:
+        starts.append(start)
+        start = partition_range(start, interval)[1]
+    with connection.cursor() as cursor:
+        return _create_partitions(cursor, connection.ops.quote_name, table, interval, starts)
+
+
+def create_upcoming_partitions(connection: BaseDatabaseWrapper, table: str, interval: str, ahead: int) -> list[str]:
+    """
+    Create the partitions of the current interval and of the ``ahead`` following ones, if missing.
+    """
+    with connection.cursor() as cursor:
+        return _create_partitions(cursor, connection.ops.quote_name, table, interval,
+                                  _upcoming_starts(interval, ahead))
+
+
+def split_default_partition(connection: BaseDatabaseWrapper, table: str, interval: str) -> list[str]:
+    """
+    Create a partition for each interval holding rows of the default partition, and move those rows into it.
+    """
+    quote = connection.ops.quote_name
+    default = _default_partition_name(table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT DISTINCT date_trunc(%s, {quote(PARTITION_KEY)})::date FROM {quote(default)}",
+                       [interval])
+        return _create_partitions(cursor, quote, table, interval, [start for start, in cursor.fetchall()])
+
+
+def _upcoming_starts(interval: str, ahead: int) -> list[datetime.date]:
+    starts = [partition_range(datetime.date.today(), interval)[0]]
+    for _ in range(ahead):
+        starts.append(partition_range(starts[-1], interval)[1])
+    return starts
+
+
+def _create_partitions(cursor: CursorWrapper, quote: Quote, table: str, interval: str,
+                       starts: Iterable[datetime.date]) -> list[str]:
+    """
+    Create the partitions starting at the given days, skipping intervals that overlap an existing partition.
+
+    Each partition is filled and indexed as a standalone table before being attached, so its indexes are named
+    after the parent's (``<table>_p2024_01`` gets ``p2024_01_<parent index>``) and are attached to the parent's
+    indexes instead of being built again. Attaching only has to check the partition's own rows, and the rows of
+    the default partition that fall into the new range are moved first, as PostgreSQL refuses to attach otherwise.
+    """
+    existing = get_partitions(cursor.db, table)
+    indexes = _get_index_definitions(cursor, table)
+    default = _default_partition_name(table)
+    has_default = _table_exists(cursor, default)
+    created = []
+    for start in sorted(set(starts)):
+        start, end = partition_range(start, interval)
+        if any(partition.start < end and start < partition.end for partition in existing):
+            continue
+        suffix = partition_suffix(start, interval)
+        name = f'{table}_{suffix}'
+        cursor.execute(f'CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        if has_default:
+            cursor.execute(f'WITH moved AS (DELETE FROM {quote(default)} WHERE {quote(PARTITION_KEY)} >= %s '
+                           f'AND {quote(PARTITION_KEY)} < %s RETURNING *) '
+                           f'INSERT INTO {quote(name)} SELECT * FROM moved', [start, end])
+        _create_partition_indexes(cursor, quote, name, suffix, indexes)
+        cursor.execute(f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} FOR VALUES FROM (%s) TO (%s)',
+                       [start, end])
+        existing.append(Partition(name, start, end))
+        created.append(name)
+        logger.info(f"Created partition {name} for [{start}, {end})")
+    return created
+
+
+def _create_default_partition(cursor: CursorWrapper, quote: Quote, table: str) -> None:
+    name = _default_partition_name(table)
+    cursor.execute(f'CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    _create_partition_indexes(cursor, quote, name, DEFAULT_PARTITION_SUFFIX, _get_index_definitions(cursor, table))
+    cursor.execute(f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} DEFAULT')
+
+
+def _create_partition_indexes(cursor: CursorWrapper, quote: Quote, partition: str, suffix: str,
+                              indexes: list[tuple[str, bool, str]]) -> None:
+    max_length = cursor.db.ops.max_name_length()
+    for index, unique, method in indexes:
+        name = f'{suffix}_{index}'[:max_length]
+        cursor.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX {quote(name)} ON {quote(partition)} USING {method}')
+
+
+def _add_constraints(cursor: CursorWrapper, quote: Quote, table: str, primary_key: str,
+                     primary_key_columns: Iterable[str], constraints: list[tuple[str, str]],
+                     indexes: list[tuple[str, bool, str]]) -> None:
+    columns = ', '.join(quote(column) for column in primary_key_columns)
+    cursor.execute(f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(primary_key)} PRIMARY KEY ({columns})')
+    for name, definition in constraints:
+        cursor.execute(f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}')
+    for name, unique, method in indexes:
+        cursor.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX {quote(name)} ON {quote(table)} USING {method}')
+
+
+def _get_index_definitions(cursor: CursorWrapper, table: str) -> list[tuple[str, bool, str]]:
+    """
+    Return the indexes of the table other than those backing constraints, as ``(name, unique, method and columns)``,
+    e.g. ``('transaction_date_id_idx', False, 'btree (date, id)')``.
+    """
+    cursor.execute('SELECT c.relname, i.indisunique, pg_get_indexdef(i.indexrelid) FROM pg_index i '
+                   'JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indrelid = %s::regclass '
+                   'AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = i.indexrelid) ORDER BY c.relname',
+                   [table])
+    return [(name, unique, definition.split(' USING ', 1)[1]) for name, unique, definition in cursor.fetchall()]
+
+
+def _get_constraint_definitions(cursor: CursorWrapper, table: str) -> list[tuple[str, str]]:
+    """
+    Return the foreign key, check and unique constraints declared on the table itself, as ``(name, definition)``.
+    """
+    cursor.execute("SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                   "WHERE conrelid = %s::regclass AND contype IN ('f', 'c', 'u') AND conparentid = 0 "
+                   "ORDER BY conname", [table])
+    return cursor.fetchall()
+
+
+def _get_primary_key_name(cursor: CursorWrapper, table: str) -> str:
+    cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", [table])
+    return cursor.fetchone()[0]
+
+
+def _table_exists(cursor: CursorWrapper, table: str) -> bool:
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [table])
+    return cursor.fetchone()[0]
+
+
+def _default_partition_name(table: str) -> str:
+    return f'{table}_{DEFAULT_PARTITION_SUFFIX}'
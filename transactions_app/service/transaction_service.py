@@ -1,6 +1,11 @@
+import datetime
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from decimal import Decimal
+from typing import Any, List, Mapping, Optional, Sequence
+
+from django.db.models import QuerySet
+
 from transactions_app.models import Transaction
 
 
@@ -28,11 +33,26 @@ class TransactionService(ABC):
 
     @staticmethod
     @abstractmethod
-    def update_transaction(transaction_id: uuid.UUID, **kwargs: dict[str, str]) -> Transaction:
+    def create_transactions(transactions: Sequence[Mapping[str, Any]]) -> List[Transaction]:
+        """
+        Create a batch of transactions with a single bulk INSERT inside one database transaction.
+
+        :param transactions: The validated values of each transaction: user_id, amount, transaction_type,
+                             category and date.
+        :return: The created Transaction instances, in the given order.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def update_transaction(transaction_id: uuid.UUID, transaction_date: Optional[datetime.date] = None,
+                           **kwargs: dict[str, str]) -> Transaction:
         """
         Update an existing transaction's details in the database.
 
         :param transaction_id: The ID of the transaction to be updated.
+        :param transaction_date: The date the transaction is currently stored under, if known, so only its
+                                 partition is searched.
         :param kwargs: A dictionary of fields to update (e.g., amount, category).
         :return: The updated Transaction instance.
         """
@@ -40,11 +60,35 @@ class TransactionService(ABC):
 
     @staticmethod
     @abstractmethod
-    def delete_transaction(transaction_id: uuid.UUID) -> None:
+    def update_transactions(filters: Mapping[str, Any], **kwargs: Any) -> int:
+        """
+        Update all transactions matching the filters with a single UPDATE statement.
+
+        :param filters: Keyword arguments of `filter_transactions` selecting the transactions to update.
+        :param kwargs: The fields to set on every matching transaction (e.g., category).
+        :return: The number of updated transactions.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def delete_transaction(transaction_id: uuid.UUID, transaction_date: Optional[datetime.date] = None) -> None:
         """
         Delete an existing transaction from the database.
 
         :param transaction_id: The ID of the transaction to be deleted.
+        :param transaction_date: The date of the transaction, if known, so only its partition is searched.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def delete_transactions(filters: Mapping[str, Any]) -> int:
+        """
+        Delete all transactions matching the filters with a single DELETE statement.
+
+        :param filters: Keyword arguments of `filter_transactions` selecting the transactions to delete.
+        :return: The number of deleted transactions.
         """
         pass
 
@@ -60,11 +104,36 @@ class TransactionService(ABC):
 
     @staticmethod
     @abstractmethod
-    def get_transaction_by_id(transaction_id: uuid.UUID) -> Transaction:
+    def filter_transactions(start_date: Optional[datetime.date] = None,
+                            end_date: Optional[datetime.date] = None,
+                            user_id: Optional[uuid.UUID] = None,
+                            category: Optional[str] = None,
+                            transaction_type: Optional[str] = None,
+                            min_amount: Optional[Decimal] = None,
+                            max_amount: Optional[Decimal] = None) -> QuerySet[Transaction]:
+        """
+        Retrieve the transactions matching all of the given filters. Filters left as None are not applied.
+
+        :param start_date: The earliest transaction date to include.
+        :param end_date: The latest transaction date to include.
+        :param user_id: The ID of the user who made the transactions.
+        :param category: The category of the transactions.
+        :param transaction_type: The type of the transactions (e.g., 'income', 'expense').
+        :param min_amount: The smallest transaction amount to include.
+        :param max_amount: The largest transaction amount to include.
+        :return: A lazy queryset of the matching Transaction instances.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def get_transaction_by_id(transaction_id: uuid.UUID,
+                              transaction_date: Optional[datetime.date] = None) -> Transaction:
         """
         Retrieve a transaction by its unique ID.
 
         :param transaction_id: The ID of the transaction to retrieve.
+        :param transaction_date: The date of the transaction, if known, so only its partition is searched.
         :return: The Transaction instance that matches the given ID.
         """
         pass
@@ -1,9 +1,16 @@
+import datetime
 import uuid
 import logging
-from typing import List
+from decimal import Decimal
+from typing import Any, List, Mapping, Optional, Sequence
+
+from django.db import transaction as db_transaction
+from django.db.models import QuerySet
+
+from core_app.db import update_returning
 from transactions_app.models import Transaction
 from transactions_app.service.transaction_service import TransactionService
-from users_app.service.user_service_impl import UserServiceImpl
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
 
 
 class TransactionServiceImpl(TransactionService):
@@ -13,34 +20,63 @@ class TransactionServiceImpl(TransactionService):
     def create_transaction(user_id: uuid.UUID, amount: float, transaction_type: str, category: str,
                            date: str) -> Transaction:
         TransactionServiceImpl.logger.info(f"Creating a new transaction for user {user_id}")
-        user = UserServiceImpl.get_user_by_id(user_id)
-
-        transaction = Transaction(
-            user=user,
+        # The user has been resolved by the caller; a dangling id is rejected by the foreign key constraint.
+        transaction = Transaction.objects.create(
+            user_id=user_id,
             amount=amount,
             transaction_type=transaction_type,
             category=category,
             date=date
         )
-
-        transaction.save()
+        DataVersionServiceImpl.bump_version(Transaction)
         return transaction
 
     @staticmethod
-    def update_transaction(transaction_id: uuid.UUID, **kwargs: dict[str, str]) -> Transaction:
+    def create_transactions(transactions: Sequence[Mapping[str, Any]]) -> List[Transaction]:
+        TransactionServiceImpl.logger.info(f"Creating a batch of {len(transactions)} transactions")
+        with db_transaction.atomic():
+            created = Transaction.objects.bulk_create(Transaction(**values) for values in transactions)
+            DataVersionServiceImpl.bump_version(Transaction)
+        return created
+
+    @staticmethod
+    def update_transaction(transaction_id: uuid.UUID, transaction_date: Optional[datetime.date] = None,
+                           **kwargs: dict[str, str]) -> Transaction:
         TransactionServiceImpl.logger.info(f"Updating transaction with id: {transaction_id}")
-        transaction = Transaction.objects.get(id=transaction_id)
-        for attr, value in kwargs.items():
-            if hasattr(transaction, attr):
-                setattr(transaction, attr, value)
-        transaction.save()
+        values = {attr: value for attr, value in kwargs.items() if hasattr(Transaction, attr)}
+        transaction = update_returning(Transaction, transaction_id, values,
+                                       TransactionServiceImpl._partition_filter(transaction_date))
+        if values:
+            DataVersionServiceImpl.bump_version(Transaction)
         return transaction
 
     @staticmethod
-    def delete_transaction(transaction_id: uuid.UUID) -> None:
+    def update_transactions(filters: Mapping[str, Any], **kwargs: Any) -> int:
+        TransactionServiceImpl.logger.info(f"Updating transactions matching {dict(filters)}")
+        with db_transaction.atomic():
+            updated = TransactionServiceImpl.filter_transactions(**filters).update(**kwargs)
+            if updated:
+                DataVersionServiceImpl.bump_version(Transaction)
+        return updated
+
+    @staticmethod
+    def delete_transaction(transaction_id: uuid.UUID, transaction_date: Optional[datetime.date] = None) -> None:
         TransactionServiceImpl.logger.info(f"Deleting transaction with id: {transaction_id}")
-        transaction = Transaction.objects.get(id=transaction_id)
-        transaction.delete()
+        deleted, _ = Transaction.objects.filter(
+            id=transaction_id, **TransactionServiceImpl._partition_filter(transaction_date)).delete()
+        if not deleted:
+            raise Transaction.DoesNotExist(f"Transaction {transaction_id} does not exist.")
+        DataVersionServiceImpl.bump_version(Transaction)
+
+    @staticmethod
+    def delete_transactions(filters: Mapping[str, Any]) -> int:
+        TransactionServiceImpl.logger.info(f"Deleting transactions matching {dict(filters)}")
+        with db_transaction.atomic():
+            # Nothing references transactions, so this is a single DELETE without loading any rows.
+            deleted, _ = TransactionServiceImpl.filter_transactions(**filters).delete()
+            if deleted:
+                DataVersionServiceImpl.bump_version(Transaction)
+        return deleted
 
     @staticmethod
     def get_all_transactions() -> List[Transaction]:
@@ -49,7 +85,41 @@ class TransactionServiceImpl(TransactionService):
         return transactions
 
     @staticmethod
-    def get_transaction_by_id(transaction_id: uuid.UUID) -> Transaction:
+    def filter_transactions(start_date: Optional[datetime.date] = None,
+                            end_date: Optional[datetime.date] = None,
+                            user_id: Optional[uuid.UUID] = None,
+                            category: Optional[str] = None,
+                            transaction_type: Optional[str] = None,
+                            min_amount: Optional[Decimal] = None,
+                            max_amount: Optional[Decimal] = None) -> QuerySet[Transaction]:
+        TransactionServiceImpl.logger.info("Retrieving filtered transactions")
+        transactions = Transaction.objects.all()
+        if start_date is not None:
+            transactions = transactions.filter(date__gte=start_date)
+        if end_date is not None:
+            transactions = transactions.filter(date__lte=end_date)
+        if user_id is not None:
+            transactions = transactions.filter(user_id=user_id)
+        if category is not None:
+            transactions = transactions.filter(category=category)
+        if transaction_type is not None:
+            transactions = transactions.filter(transaction_type=transaction_type)
+        if min_amount is not None:
+            transactions = transactions.filter(amount__gte=min_amount)
+        if max_amount is not None:
+            transactions = transactions.filter(amount__lte=max_amount)
+        return transactions
+
+    @staticmethod
+    def get_transaction_by_id(transaction_id: uuid.UUID,
+                              transaction_date: Optional[datetime.date] = None) -> Transaction:
         TransactionServiceImpl.logger.info(f"Retrieving transaction with id: {transaction_id}")
-        transaction = Transaction.objects.get(id=transaction_id)
+        transaction = Transaction.objects.get(id=transaction_id,
+                                              **TransactionServiceImpl._partition_filter(transaction_date))
         return transaction
+
+    @staticmethod
+    def _partition_filter(transaction_date: Optional[datetime.date]) -> dict[str, datetime.date]:
+        # The transactions table is partitioned by date: a lookup by ID alone probes the primary key index of
+        # every partition, while one that also matches the date is pruned to a single partition.
+        return {} if transaction_date is None else {'date': transaction_date}
@@ -0,0 +1,255 @@
+import datetime
+import io
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from import_app.service.import_service_impl import ImportServiceImpl
+from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
+from transactions_app.models import DailyTotal, DailyTotalChange, Transaction
+from transactions_app.service import daily_totals
+from transactions_app.service.transaction_partitioning import MONTH, create_partitions
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+from users_app.service.user_service_impl import UserServiceImpl
+
+JAN_1 = datetime.date(2024, 1, 1)
+JAN_2 = datetime.date(2024, 1, 2)
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.fixture
+def other_user():
+    return User.objects.create(first_name="Jane", last_name="Doe", email="jane@example.com")
+
+
+def totals(**filters):
+    """Return the daily totals as {(date, type, user_id, category): (total, count)}."""
+    return {(row.date, row.transaction_type, row.user_id, row.category): (row.total, row.count)
+            for row in DailyTotal.objects.filter(**filters)}
+
+
+def assert_consistent():
+    assert daily_totals.verify(connection) == []
+
+
+@pytest.mark.django_db
+def test_create_transactions_adds_to_daily_totals(user, other_user):
+    """
+    Test case: Create a transaction, then a batch of transactions of two users.
+
+    Expected Result:
+    - Each day and type has a row over all users and categories and one per user and category, summing
+      the amounts and counting the transactions.
+    """
+    TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+    TransactionServiceImpl.create_transactions([
+        {'user_id': user.id, 'amount': Decimal('2.50'), 'transaction_type': 'income', 'category': 'salary',
+         'date': JAN_1},
+        {'user_id': other_user.id, 'amount': Decimal('4.00'), 'transaction_type': 'income', 'category': 'gifts',
+         'date': JAN_1},
+        {'user_id': user.id, 'amount': Decimal('1.00'), 'transaction_type': 'expense', 'category': 'food',
+         'date': JAN_2},
+    ])
+
+    assert totals() == {
+        (JAN_1, 'income', None, None): (Decimal('16.50'), 3),
+        (JAN_1, 'income', user.id, 'salary'): (Decimal('12.50'), 2),
+        (JAN_1, 'income', other_user.id, 'gifts'): (Decimal('4.00'), 1),
+        (JAN_2, 'expense', None, None): (Decimal('1.00'), 1),
+        (JAN_2, 'expense', user.id, 'food'): (Decimal('1.00'), 1),
+    }
+    assert_consistent()
+
+
+@pytest.mark.django_db
+def test_update_transaction_moves_amount_between_totals(user):
+    """
+    Test case: Change the amount, type and date of a transaction, moving it to the partition of another month.
+
+    Expected Result:
+    - Its amount is taken off the totals of its former day and type, which disappear at zero transactions,
+      and added to the new ones.
+    """
+    feb_2 = datetime.date(2024, 2, 2)
+    create_partitions(connection, Transaction._meta.db_table, MONTH, JAN_1, feb_2)
+    transaction = TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+
+    TransactionServiceImpl.update_transaction(transaction.id, amount=Decimal('7.25'), date=feb_2,
+                                              transaction_type='expense')
+
+    assert totals() == {
+        (feb_2, 'expense', None, None): (Decimal('7.25'), 1),
+        (feb_2, 'expense', user.id, 'salary'): (Decimal('7.25'), 1),
+    }
+    assert_consistent()
+
+
+@pytest.mark.django_db
+def test_bulk_update_and_delete_keep_daily_totals(user, other_user):
+    """
+    Test case: Update transactions by filter, delete one, then delete the rest by filter.
+
+    Expected Result:
+    - The totals match the transactions after each statement, and are gone with the last transaction.
+    """
+    for owner in (user, user, other_user):
+        TransactionServiceImpl.create_transaction(owner.id, Decimal('5.00'), 'expense', 'food', JAN_1)
+
+    TransactionServiceImpl.update_transactions({'user_id': user.id}, category='rent')
+    assert totals(user_id=user.id) == {(JAN_1, 'expense', user.id, 'rent'): (Decimal('10.00'), 2)}
+    assert_consistent()
+
+    TransactionServiceImpl.delete_transaction(Transaction.objects.filter(user=other_user).get().id)
+    assert totals(user_id=None) == {(JAN_1, 'expense', None, None): (Decimal('10.00'), 2)}
+    assert_consistent()
+
+    TransactionServiceImpl.delete_transactions({'start_date': JAN_1})
+    assert not DailyTotal.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_and_user_purge_keep_daily_totals(user, settings, django_capture_on_commit_callbacks):
+    """
+    Test case: Import transactions from CSV, then delete their user.
+
+    Expected Result:
+    - The imported rows are added to the totals, and the purge removes them again.
+    """
+    settings.BACKGROUND_TASKS_EAGER = True
+    lines = io.StringIO('amount,date,transaction_type,category,user_id\n'
+                        f'3.00,2024-01-01,income,salary,{user.id}\n'
+                        f'4.00,2024-01-01,income,salary,{user.id}\n')
+
+    ImportServiceImpl.import_transactions_csv(lines)
+    assert totals(user_id=None) == {(JAN_1, 'income', None, None): (Decimal('7.00'), 2)}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        UserServiceImpl.delete_user(user.id)
+    assert not DailyTotal.objects.exists()
+
+
+@pytest.mark.django_db
+def test_change_log_records_days_written(user, other_user):
+    """
+    Test case: Create, move and delete transactions, then prune the change log.
+
+    Expected Result:
+    - Each statement logs the days whose totals over all users and categories it wrote, with the id of the
+      database transaction; pruning deletes the changes logged before the given time.
+    """
+    transaction = TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+    TransactionServiceImpl.update_transaction(transaction.id, date=JAN_2)
+    TransactionServiceImpl.delete_transaction(transaction.id)
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_current_xact_id()::text::bigint')
+        xid = cursor.fetchone()[0]
+    changes = DailyTotalChange.objects.count()
+    assert set(DailyTotalChange.objects.values_list('date', flat=True)) == {JAN_1, JAN_2}
+    assert set(DailyTotalChange.objects.values_list('xid', flat=True)) == {xid}
+
+    assert daily_totals.prune_change_log(connection, timezone.now() + datetime.timedelta(seconds=1)) == changes
+    assert not DailyTotalChange.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_expired_changes_are_pruned_without_range_index(user, settings):
+    """
+    Test case: With the range index turned off, log changes, let them expire, then create reports, once right
+    away and once after the prune interval, and run prune_daily_total_changes.
+
+    Expected Result:
+    - The first report only starts the prune interval of the process; the second one prunes the expired
+      changes, and so does the command at any time.
+    """
+    settings.REPORT_RANGE_INDEX_DIR = ''
+    settings.REPORT_RANGE_INDEX_CHANGE_RETENTION_SECONDS = 0
+    TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+    DailyTotalChange.objects.update(changed_at=timezone.now() - datetime.timedelta(seconds=1))
+
+    with mock.patch.dict(daily_totals._pruned_at, clear=True):
+        TransactionReportServiceImpl.create_report(JAN_1, JAN_2)
+        assert DailyTotalChange.objects.exists()
+
+        daily_totals._pruned_at[connection.alias] -= daily_totals._PRUNE_INTERVAL_SECONDS
+        TransactionReportServiceImpl.create_report(JAN_1, JAN_2)
+        assert not DailyTotalChange.objects.exists()
+
+    TransactionServiceImpl.create_transaction(user.id, Decimal('5.00'), 'income', 'salary', JAN_2)
+    DailyTotalChange.objects.update(changed_at=timezone.now() - datetime.timedelta(seconds=1))
+    out = io.StringIO()
+    call_command('prune_daily_total_changes', stdout=out)
+
+    assert not DailyTotalChange.objects.exists()
+    assert 'Pruned' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_report_reads_daily_totals(user, django_assert_num_queries):
+    """
+    Test case: Compute the totals of a period.
+
+    Expected Result:
+    - They are read with one query on the daily totals and match a scan of the transactions.
+    """
+    TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+    TransactionServiceImpl.create_transaction(user.id, Decimal('3.50'), 'expense', 'food', JAN_2)
+    TransactionServiceImpl.create_transaction(user.id, Decimal('99.00'), 'expense', 'food', datetime.date(2024, 2, 1))
+
+    with django_assert_num_queries(1) as queries:
+        report_totals = TransactionReportServiceImpl.compute_totals(JAN_1, datetime.date(2024, 1, 31))
+
+    assert DailyTotal._meta.db_table in queries.captured_queries[0]['sql']
+    assert report_totals == {'total_income': Decimal('10.00'), 'total_expense': Decimal('3.50'),
+                             'net_income': Decimal('6.50'), 'income_count': 1, 'expense_count': 1}
+
+
+@pytest.mark.django_db
+def test_rebuild_daily_totals_command(user):
+    """
+    Test case: Corrupt the daily totals, verify them, rebuild them and verify them again.
+
+    Expected Result:
+    - Verification lists the differences and fails; after the rebuild it succeeds.
+    """
+    TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+    DailyTotal.objects.filter(user_id=None).update(total=Decimal('1.00'))
+    DailyTotal.objects.filter(user_id=user.id).delete()
+
+    errors = io.StringIO()
+    with pytest.raises(CommandError):
+        call_command('rebuild_daily_totals', verify=True, stdout=io.StringIO(), stderr=errors)
+    assert len(errors.getvalue().splitlines()) == 2
+
+    out = io.StringIO()
+    call_command('rebuild_daily_totals', stdout=out)
+    call_command('rebuild_daily_totals', verify=True, stdout=out)
+
+    assert 'Rebuilt 2 daily total(s)' in out.getvalue()
+    assert 'Daily totals match the transactions' in out.getvalue()
+    assert_consistent()
+
+
+@pytest.mark.django_db
+def test_daily_total_keys_do_not_rely_on_nulls_not_distinct(user):
+    """
+    Test case: Add a second row over all users and categories for a day and type that already has one.
+
+    Expected Result:
+    - The row is rejected by a partial unique key, which PostgreSQL enforces before version 15 too, unlike
+      unique constraints with NULLS NOT DISTINCT.
+    """
+    TransactionServiceImpl.create_transaction(user.id, Decimal('10.00'), 'income', 'salary', JAN_1)
+
+    assert all(constraint.nulls_distinct is None for constraint in DailyTotal._meta.constraints)
+    with pytest.raises(IntegrityError), transaction.atomic():
+        DailyTotal.objects.create(date=JAN_1, transaction_type='income', total=Decimal('1.00'), count=1)
@@ -0,0 +1,117 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from transactions_app.serializers import TransactionSerializer
+from transactions_app.service.transaction_batch_validator import validate_transaction_rows
+from users_app.models import User
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def make_row(user_id, **overrides):
+    row = {'amount': '10.50', 'date': '2024-01-01', 'transaction_type': 'income', 'category': 'salary',
+           'user': str(user_id)}
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.django_db
+def test_validate_transaction_rows_cleans_values(user):
+    """Test valid rows are converted to model values."""
+    valid, errors = validate_transaction_rows([(1, make_row(user.id))])
+
+    assert errors == []
+    assert valid == [(1, {'amount': Decimal('10.50'), 'date': datetime.date(2024, 1, 1),
+                          'transaction_type': 'income', 'category': 'salary', 'user_id': user.id})]
+
+
+@pytest.mark.django_db
+def test_validate_transaction_rows_trims_strings(user):
+    """Test the category is stripped of surrounding whitespace, and numbers are accepted as strings."""
+    valid, errors = validate_transaction_rows([(1, make_row(user.id, category=42)),
+                                               (2, make_row(user.id, category='  food  ')),
+                                               (3, make_row(user.id, category=1.5))])
+
+    assert errors == []
+    assert [row['category'] for _, row in valid] == ['42', 'food', '1.5']
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("overrides, field, message", [
+    ({'amount': '-1'}, 'amount', 'Amount must be non-negative.'),
+    ({'amount': 'ten'}, 'amount', 'A valid number is required.'),
+    ({'amount': '1.234'}, 'amount', 'Ensure that there are no more than 2 decimal places.'),
+    ({'amount': '100000000'}, 'amount', 'Ensure that there are no more than 10 digits in total.'),
+    ({'date': '01/02/2024'}, 'date', 'Date has wrong format. Use one of these formats instead: YYYY-MM-DD.'),
+    ({'transaction_type': 'refund'}, 'transaction_type', '"refund" is not a valid choice.'),
+    ({'category': 'x' * 51}, 'category', 'Ensure this field has no more than 50 characters.'),
+    ({'category': ''}, 'category', 'This field is required.'),
+    ({'category': '   '}, 'category', 'This field may not be blank.'),
+    ({'category': {'name': 'salary'}}, 'category', 'Not a valid string.'),
+    ({'category': True}, 'category', 'Not a valid string.'),
+    ({'transaction_type': ['income']}, 'transaction_type', '"[\'income\']" is not a valid choice.'),
+    ({'transaction_type': ' expense'}, 'transaction_type', '" expense" is not a valid choice.'),
+    ({'date': datetime.datetime(2024, 1, 1, 12)}, 'date', 'Expected a date but got a datetime.'),
+    ({'transaction_type': 1}, 'transaction_type', '"1" is not a valid choice.'),
+    ({'user': 'nobody'}, 'user', 'Must be a valid UUID.'),
+])
+def test_validate_transaction_rows_reports_errors(user, overrides, field, message):
+    """Test invalid values are reported per field, in the serializer's error format."""
+    valid, errors = validate_transaction_rows([(7, make_row(user.id, **overrides))])
+
+    assert valid == []
+    assert errors == [(7, {field: [message]})]
+
+
+@pytest.mark.django_db
+def test_validate_transaction_rows_checks_users_once_per_batch(user, django_assert_num_queries):
+    """Test the users of a whole batch are checked with a single query."""
+    missing = uuid.uuid4()
+    rows = [(number, make_row(user.id)) for number in range(1, 50)] + [(50, make_row(missing))]
+
+    with django_assert_num_queries(1):
+        valid, errors = validate_transaction_rows(rows)
+
+    assert len(valid) == 49
+    assert errors == [(50, {'user': [f'Invalid pk "{missing}" - object does not exist.']})]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("field, value", [
+    ('date', '2024-01-05'),
+    ('date', '20240105'),
+    ('date', '2024-W01-5'),
+    ('date', '2024-1-5'),
+    ('date', ' 2024-01-05'),
+    ('date', '2024-02-30'),
+    ('date', 20240105),
+    ('transaction_type', 'expense'),
+    ('transaction_type', ' expense'),
+    ('transaction_type', ['income']),
+    ('transaction_type', True),
+    ('category', 1.5),
+    ('category', 42),
+    ('category', ' food '),
+    ('category', '   '),
+    ('category', False),
+    ('category', {'name': 'salary'}),
+    ('category', 'sal\x00ary'),
+])
+def test_validate_transaction_rows_matches_serializer(user, field, value):
+    """Test a value is accepted, cleaned or rejected like TransactionSerializer does, with the same error."""
+    row = make_row(user.id, **{field: value})
+    serializer = TransactionSerializer(data=row)
+    serializer.is_valid()
+
+    valid, errors = validate_transaction_rows([(1, row)])
+
+    if serializer.errors:
+        assert errors == [(1, {field: [str(error) for error in serializer.errors[field]]})]
+    else:
+        assert valid[0][1][field] == serializer.validated_data[field]
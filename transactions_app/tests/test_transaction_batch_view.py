@@ -0,0 +1,126 @@
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from transactions_app.models import Transaction
+from users_app.models import User
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def users():
+    return [User.objects.create(first_name="John", last_name=str(n), email=f"john{n}@example.com") for n in range(3)]
+
+
+def make_item(owner, **overrides):
+    item = {"user": str(owner.id), "amount": "12.50", "transaction_type": "expense", "category": "food",
+            "date": "2024-01-01"}
+    item.update(overrides)
+    return item
+
+
+@pytest.mark.django_db
+def test_create_transactions_batch(api_client, users):
+    """
+    Test case: Create a batch of transactions for several users.
+
+    Expected Result:
+    - The response status code is 201 (Created) and lists the created transactions in order.
+    - The users are resolved with one query and the rows are inserted with one INSERT.
+    """
+    items = [make_item(users[n % 3], amount=f"{n}.00") for n in range(10)]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.post(reverse('transactions-batch'), items, format='json')
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [row['amount'] for row in response.data] == [f"{n}.00" for n in range(10)]
+    assert Transaction.objects.count() == 10
+    statements = [query['sql'] for query in queries.captured_queries]
+    assert sum('FROM "users_app_user"' in sql for sql in statements) == 1
+    assert sum(sql.startswith('INSERT INTO "transactions_app_transaction"') for sql in statements) == 1
+
+
+@pytest.mark.django_db
+def test_create_transactions_batch_reports_item_errors(api_client, users):
+    """
+    Test case: Create a batch where some items are invalid.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request) and nothing is created.
+    - The errors are aligned with the items, with an empty object for each valid item.
+    """
+    items = [
+        make_item(users[0]),
+        make_item(users[0], amount="-1"),
+        make_item(users[1], transaction_type="refund"),
+        make_item(users[0], user=str(uuid.uuid4())),
+        "not an object",
+    ]
+
+    response = api_client.post(reverse('transactions-batch'), items, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert Transaction.objects.count() == 0
+    assert response.data[0] == {}
+    assert response.data[1] == {'amount': ['Amount must be non-negative.']}
+    assert list(response.data[2]) == ['transaction_type']
+    assert list(response.data[3]) == ['user']
+    assert list(response.data[4]) == ['non_field_errors']
+
+
+@pytest.mark.django_db
+def test_create_transactions_batch_rejects_non_string_values(api_client, users):
+    """
+    Test case: Create a batch with a list as transaction type and an object as category.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request) with an error on each of these fields, and nothing is created.
+    """
+    items = [make_item(users[0], transaction_type=["expense"]), make_item(users[0], category={"name": "food"})]
+
+    response = api_client.post(reverse('transactions-batch'), items, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data == [{'transaction_type': ['"[\'expense\']" is not a valid choice.']},
+                             {'category': ['Not a valid string.']}]
+    assert Transaction.objects.count() == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("payload", [[], {"amount": "1.00"}])
+def test_create_transactions_batch_requires_list(api_client, payload):
+    """
+    Test case: Send something other than a non-empty list.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request).
+    """
+    response = api_client.post(reverse('transactions-batch'), payload, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_create_transactions_batch_too_large(api_client, users, settings):
+    """
+    Test case: Send more items than TRANSACTION_BATCH_MAX_SIZE.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request) and nothing is created.
+    """
+    settings.TRANSACTION_BATCH_MAX_SIZE = 2
+
+    response = api_client.post(reverse('transactions-batch'), [make_item(users[0])] * 3, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert Transaction.objects.count() == 0
@@ -0,0 +1,133 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from transactions_app.models import Transaction
+from users_app.models import User
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def users():
+    return [User.objects.create(first_name="John", last_name=str(n), email=f"john{n}@example.com") for n in range(2)]
+
+
+@pytest.fixture
+def transactions(users):
+    return [
+        Transaction.objects.create(user=users[0], amount=10, transaction_type="expense", category="coffee",
+                                   date="2024-01-01"),
+        Transaction.objects.create(user=users[0], amount=20, transaction_type="expense", category="coffee",
+                                   date="2024-01-02"),
+        Transaction.objects.create(user=users[1], amount=30, transaction_type="expense", category="coffee",
+                                   date="2024-01-03"),
+        Transaction.objects.create(user=users[0], amount=40, transaction_type="income", category="salary",
+                                   date="2024-01-04"),
+    ]
+
+
+def bulk_url(**filters):
+    return f"{reverse('transactions-bulk')}?{'&'.join(f'{name}={value}' for name, value in filters.items())}"
+
+
+def statements(queries, prefix):
+    return [query['sql'] for query in queries.captured_queries if query['sql'].startswith(prefix)]
+
+
+@pytest.mark.django_db
+def test_bulk_update_transactions(api_client, users, transactions, django_capture_on_commit_callbacks):
+    """
+    Test case: Re-categorise the transactions of one user and category.
+
+    Expected Result:
+    - The response reports the number of updated transactions.
+    - Only the matching transactions change, with a single UPDATE statement.
+    - The data version of the transactions is bumped.
+    """
+    version = DataVersionServiceImpl.get_version(Transaction)
+
+    with CaptureQueriesContext(connection) as queries, django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(bulk_url(category='coffee', user=users[0].id), {'category': 'cafe'},
+                                    format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {'updated': 2}
+    assert len(statements(queries, 'UPDATE "transactions_app_transaction"')) == 1
+    assert list(Transaction.objects.order_by('date').values_list('category', flat=True)) == [
+        'cafe', 'cafe', 'coffee', 'salary']
+    assert DataVersionServiceImpl.get_version(Transaction) != version
+
+
+@pytest.mark.django_db
+def test_bulk_delete_transactions(api_client, transactions):
+    """
+    Test case: Delete the transactions matching a category and date range.
+
+    Expected Result:
+    - The response reports the number of deleted transactions.
+    - Only the matching transactions are deleted, with a single DELETE statement and no SELECT of the rows.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.delete(bulk_url(category='coffee', start_date='2024-01-02'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {'deleted': 2}
+    assert len(statements(queries, 'DELETE FROM "transactions_app_transaction"')) == 1
+    assert not statements(queries, 'SELECT "transactions_app_transaction"')
+    assert list(Transaction.objects.values_list('id', flat=True).order_by('date')) == [
+        transactions[0].id, transactions[3].id]
+
+
+@pytest.mark.django_db
+def test_bulk_delete_nothing_matches(api_client, transactions):
+    """
+    Test case: Delete with filters matching no transaction.
+
+    Expected Result:
+    - Zero transactions are reported as deleted and the data version is unchanged.
+    """
+    version = DataVersionServiceImpl.get_version(Transaction)
+
+    response = api_client.delete(bulk_url(category='rent'))
+
+    assert response.data == {'deleted': 0}
+    assert Transaction.objects.count() == 4
+    assert DataVersionServiceImpl.get_version(Transaction) == version
+
+
+@pytest.mark.django_db
+def test_bulk_operations_require_a_filter(api_client, transactions):
+    """
+    Test case: Send a bulk update or delete without any filter.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request) and no transaction is changed.
+    """
+    update = api_client.patch(reverse('transactions-bulk'), {'category': 'cafe'}, format='json')
+    delete = api_client.delete(reverse('transactions-bulk'))
+
+    assert update.status_code == status.HTTP_400_BAD_REQUEST
+    assert delete.status_code == status.HTTP_400_BAD_REQUEST
+    assert Transaction.objects.filter(category='coffee').count() == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("data", [{}, {'transaction_type': 'refund'}, {'category': 'x' * 51}])
+def test_bulk_update_invalid_values(api_client, transactions, data):
+    """
+    Test case: Send a bulk update without values or with invalid values.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request).
+    """
+    response = api_client.patch(bulk_url(category='coffee'), data, format='json')
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
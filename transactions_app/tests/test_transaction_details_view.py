@@ -8,6 +8,7 @@ from rest_framework.test import APIClient
 
 from transactions_app.models import Transaction
 from users_app.models import User
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
 
 
 @pytest.fixture
@@ -70,6 +71,29 @@ def test_get_transaction_by_id_not_found(api_client):
     assert response.data['error'] == 'Transaction not found'
 
 
+@pytest.mark.django_db
+def test_transaction_lookups_by_date(api_client, transaction):
+    """
+    Test case: Retrieve, update and delete a transaction giving its date, then a different and an invalid date.
+
+    Expected Result:
+    - With its date, the transaction is found; with another date it is not (404), and an invalid date is
+      rejected (400).
+    """
+    url = reverse('transaction-detail', args=[transaction.id])
+
+    assert api_client.get(url, {'date': '2024-01-01'}).status_code == status.HTTP_200_OK
+    assert api_client.get(url, {'date': '2024-01-02'}).status_code == status.HTTP_404_NOT_FOUND
+    assert api_client.get(url, {'date': 'yesterday'}).status_code == status.HTTP_400_BAD_REQUEST
+    assert api_client.put(f'{url}?date=2024-01-02', {'category': 'bonus'},
+                          format='json').status_code == status.HTTP_404_NOT_FOUND
+    assert api_client.put(f'{url}?date=2024-01-01', {'category': 'bonus'},
+                          format='json').status_code == status.HTTP_200_OK
+    assert api_client.delete(f'{url}?date=2024-01-02').status_code == status.HTTP_404_NOT_FOUND
+    assert api_client.delete(f'{url}?date=2024-01-01').status_code == status.HTTP_204_NO_CONTENT
+    assert not Transaction.objects.exists()
+
+
 @pytest.mark.django_db
 def test_update_transaction(api_client, transaction, user):
     """
@@ -187,3 +211,66 @@ def test_delete_transaction_not_found(api_client):
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.data['error'] == 'Transaction not found'
+
+
+@pytest.fixture
+def seeded_version():
+    """Create the data version row, so bumping it is a single UPDATE."""
+    DataVersionServiceImpl.get_version(Transaction)
+
+
+@pytest.mark.django_db
+def test_create_transaction_query_count(api_client, user, seeded_version, django_assert_num_queries,
+                                        django_capture_on_commit_callbacks):
+    """
+    Test case: Count the queries of creating a transaction.
+
+    Expected Result:
+    - The serializer resolves the user once, then one INSERT and one version bump; the user is not re-fetched.
+    """
+    data = {"user": str(user.id), "amount": "10.00", "transaction_type": "expense", "category": "food",
+            "date": "2024-01-01"}
+
+    with django_assert_num_queries(3), django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(reverse('transactions'), data, format='json')
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+def test_update_transaction_query_count(api_client, transaction, seeded_version, django_assert_num_queries,
+                                        django_capture_on_commit_callbacks):
+    """
+    Test case: Count the queries of updating a transaction.
+
+    Expected Result:
+    - One UPDATE ... RETURNING writing only the changed column, and one version bump.
+    """
+    with django_assert_num_queries(2) as queries, django_capture_on_commit_callbacks(execute=True):
+        response = api_client.put(reverse('transaction-detail', args=[transaction.id]), {'category': 'bonus'},
+                                  format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    update = queries.captured_queries[0]['sql']
+    assert update.startswith('UPDATE "transactions_app_transaction" SET "category"') and 'RETURNING' in update
+    assert '"amount" =' not in update
+    transaction.refresh_from_db()
+    assert transaction.category == 'bonus' and transaction.amount == Decimal('100.00')
+
+
+@pytest.mark.django_db
+def test_delete_transaction_query_count(api_client, transaction, seeded_version, django_assert_num_queries,
+                                        django_capture_on_commit_callbacks):
+    """
+    Test case: Count the queries of deleting a transaction, and of deleting one that does not exist.
+
+    Expected Result:
+    - One DELETE and one version bump; a missing transaction costs only the DELETE and returns 404.
+    """
+    with django_assert_num_queries(2), django_capture_on_commit_callbacks(execute=True):
+        response = api_client.delete(reverse('transaction-detail', args=[transaction.id]))
+    with django_assert_num_queries(1):
+        missing = api_client.delete(reverse('transaction-detail', args=[transaction.id]))
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
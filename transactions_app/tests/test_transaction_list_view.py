@@ -1,10 +1,15 @@
+import datetime
+import re
 import uuid
 from decimal import Decimal
 
 import pytest
+from django.db import connection
 from rest_framework.test import APIClient
 from django.urls import reverse
+from core_app.pagination import KeysetPagination
 from transactions_app.models import Transaction
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
 from users_app.models import User
 from rest_framework import status
 
@@ -197,3 +202,235 @@ def test_create_transaction_invalid_date(api_client, user):
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "date" in response.data
+
+
+def fetch_all_pages(api_client, url, page_size):
+    pages = []
+    params = {'page_size': page_size}
+    while True:
+        response = api_client.get(url, params)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        if 'X-Next-Cursor' not in response:
+            assert 'Link' not in response
+            return pages
+        assert response['Link'].endswith('; rel="next"')
+        params = {'page_size': page_size, 'cursor': response['X-Next-Cursor']}
+
+
+@pytest.mark.django_db
+def test_get_transactions_paginated(api_client, user):
+    """
+    Test case: Walk through the transactions page by page with the next cursor.
+
+    Expected Result:
+    - Every transaction is returned exactly once, ordered by date and ID, also across equal dates.
+    - The last page has no next cursor.
+    """
+    transactions = [Transaction.objects.create(user=user, amount=i, transaction_type="income", category="salary",
+                                               date=f"2024-01-0{1 + i % 2}") for i in range(7)]
+
+    pages = fetch_all_pages(api_client, reverse('transactions'), page_size=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    expected = sorted(transactions, key=lambda t: (str(t.date), str(t.id)))
+    assert [row['id'] for page in pages for row in page] == [str(t.id) for t in expected]
+
+
+@pytest.mark.django_db
+def test_get_transactions_page_size_is_capped(api_client, user, settings):
+    """
+    Test case: Ask for more rows than the configured maximum page size.
+
+    Expected Result:
+    - The page holds at most API_MAX_PAGE_SIZE transactions.
+    """
+    settings.API_MAX_PAGE_SIZE = 2
+    for i in range(3):
+        Transaction.objects.create(user=user, amount=i, transaction_type="income", category="salary",
+                                   date="2024-01-01")
+
+    response = api_client.get(reverse('transactions'), {'page_size': 1000})
+
+    assert len(response.data) == 2
+    assert 'X-Next-Cursor' in response
+
+
+@pytest.mark.django_db
+def test_get_transactions_unpaginated(api_client, user, settings):
+    """
+    Test case: Retrieve the transactions without a cursor or page size, with more than the default page size.
+
+    Expected Result:
+    - Every transaction is returned in one plain list ordered by date, without a next cursor.
+    """
+    settings.API_DEFAULT_PAGE_SIZE = 2
+    for i in range(3):
+        Transaction.objects.create(user=user, amount=i, transaction_type="income", category="salary",
+                                   date=f"2024-01-0{3 - i}")
+
+    response = api_client.get(reverse('transactions'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [row['date'] for row in response.data] == ['2024-01-01', '2024-01-02', '2024-01-03']
+    assert 'X-Next-Cursor' not in response and 'Link' not in response
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cursor", ['garbage', 'WyJub3QtYS1kYXRlIiwgIngiXQ', 'WzEsIDJd'])
+def test_get_transactions_invalid_cursor(api_client, cursor):
+    """
+    Test case: Request a page with a cursor that was not issued by the API.
+
+    Expected Result:
+    - The response status code is 404 (Not Found).
+    """
+    response = api_client.get(reverse('transactions'), {'cursor': cursor})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_transactions_page_query_uses_composite_index(user):
+    """
+    Test case: Inspect the plan of a page after a cursor, over a table seeded with a few thousand transactions
+    spread over a year and analyzed.
+
+    Expected Result:
+    - The planner reads the page from the (date, id) index in order, without sorting or skipping rows.
+    """
+    Transaction.objects.bulk_create(
+        Transaction(user=user, amount=i, transaction_type="income", category="salary",
+                    date=datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 366))
+        for i in range(5000))
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE {Transaction._meta.db_table}')
+    paginator = KeysetPagination(ordering=('date', 'id'))
+    first = Transaction.objects.order_by('date', 'id').first()
+    values = paginator.decode_cursor(paginator.encode_cursor(first))
+    queryset = Transaction.objects.order_by('date', 'id').filter(paginator._seek_condition(Transaction, values))[:100]
+
+    plan = queryset.explain()
+
+    assert 'transaction_date_id_idx' in plan
+    # Partitions are merged in order by a Merge Append ("Sort Key: ..."), but no partition is sorted.
+    assert not re.search(r'^\s*(->)?\s*Sort\s+\(', plan, re.MULTILINE)
+    assert 'OFFSET' not in str(queryset.query)
+
+
+@pytest.fixture
+def filterable_transactions(user):
+    other = User.objects.create(first_name="Jane", last_name="Doe", email="jane@example.com")
+    return [
+        Transaction.objects.create(user=user, amount=10, transaction_type="income", category="salary",
+                                   date="2024-01-01"),
+        Transaction.objects.create(user=user, amount=50, transaction_type="expense", category="food",
+                                   date="2024-02-01"),
+        Transaction.objects.create(user=other, amount=200, transaction_type="expense", category="rent",
+                                   date="2024-03-01"),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params, expected", [
+    ({'transaction_type': 'expense'}, [1, 2]),
+    ({'category': 'food'}, [1]),
+    ({'start_date': '2024-01-15', 'end_date': '2024-02-15'}, [1]),
+    ({'min_amount': '20'}, [1, 2]),
+    ({'min_amount': '20', 'max_amount': '100'}, [1]),
+    ({'max_amount': '10'}, [0]),
+    ({'transaction_type': 'expense', 'max_amount': '100'}, [1]),
+])
+def test_get_transactions_filtered(api_client, filterable_transactions, params, expected):
+    """
+    Test case: Retrieve the transactions matching the given query filters.
+
+    Expected Result:
+    - Only the matching transactions are returned, ordered by date.
+    """
+    response = api_client.get(reverse('transactions'), params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [row['id'] for row in response.data] == [str(filterable_transactions[i].id) for i in expected]
+
+
+@pytest.mark.django_db
+def test_get_transactions_filtered_by_user(api_client, user, filterable_transactions):
+    """
+    Test case: Retrieve the transactions of one user.
+
+    Expected Result:
+    - Only the transactions of that user are returned.
+    """
+    response = api_client.get(reverse('transactions'), {'user': user.id})
+
+    assert [row['id'] for row in response.data] == [str(t.id) for t in filterable_transactions[:2]]
+
+
+@pytest.mark.django_db
+def test_get_transactions_filtered_paginated(api_client, user):
+    """
+    Test case: Walk through the pages of a filtered list by following the Link header.
+
+    Expected Result:
+    - The next page links keep the filters, and every matching transaction is returned exactly once.
+    """
+    for i in range(6):
+        Transaction.objects.create(user=user, amount=i, transaction_type="income" if i % 2 else "expense",
+                                   category="salary", date=f"2024-01-0{1 + i}")
+
+    response = api_client.get(reverse('transactions'), {'transaction_type': 'income', 'page_size': 2})
+    pages = [response.data]
+    while 'Link' in response:
+        response = api_client.get(response['Link'][1:response['Link'].index('>')])
+        pages.append(response.data)
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert all(row['transaction_type'] == 'income' for page in pages for row in page)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [
+    {'start_date': '2024-02-01', 'end_date': '2024-01-01'},
+    {'min_amount': '100', 'max_amount': '10'},
+    {'min_amount': 'abc'},
+    {'transaction_type': 'refund'},
+    {'user': 'not-a-uuid'},
+])
+def test_get_transactions_invalid_filters(api_client, params):
+    """
+    Test case: Retrieve transactions with invalid query filters.
+
+    Expected Result:
+    - The response status code is 400 (Bad Request).
+    """
+    response = api_client.get(reverse('transactions'), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("filters, index", [
+    ({'user_id': uuid.uuid4()}, 'transaction_user_date_id_idx'),
+    ({'transaction_type': 'income'}, 'transaction_type_date_id_idx'),
+    ({'category': 'salary'}, 'transaction_cat_date_id_idx'),
+    ({'start_date': '2024-01-01', 'end_date': '2024-01-31'}, 'transaction_date_id_idx'),
+    ({'min_amount': Decimal('10'), 'max_amount': Decimal('20')}, 'transaction_amount_idx'),
+])
+def test_filtered_transactions_query_uses_index(user, filters, index):
+    """
+    Test case: Inspect the plan of a filtered transactions page.
+
+    Expected Result:
+    - Each supported filter is served by its index rather than a sequential scan.
+    """
+    Transaction.objects.create(user=user, amount=1, transaction_type="income", category="salary",
+                               date="2024-01-01")
+    queryset = TransactionServiceImpl.filter_transactions(**filters).order_by('date', 'id')[:100]
+
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+
+    assert index in plan
+    assert 'Seq Scan' not in plan
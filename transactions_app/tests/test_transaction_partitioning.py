@@ -0,0 +1,189 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from transactions_app.models import Transaction
+from transactions_app.service.transaction_partitioning import (MONTH, YEAR, convert_to_partitioned, convert_to_plain,
+                                                                create_partitions, get_partitions, is_partitioned,
+                                                                partition_range)
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+
+TABLE = Transaction._meta.db_table
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+def create_transaction(user, date):
+    return Transaction.objects.create(user=user, amount="10.00", transaction_type="income", category="salary",
+                                      date=date)
+
+
+def partition_of(transaction):
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT tableoid::regclass::text FROM {TABLE} WHERE id = %s', [transaction.id])
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.parametrize('day, interval, expected', [
+    (datetime.date(2024, 2, 29), MONTH, (datetime.date(2024, 2, 1), datetime.date(2024, 3, 1))),
+    (datetime.date(2024, 12, 31), MONTH, (datetime.date(2024, 12, 1), datetime.date(2025, 1, 1))),
+    (datetime.date(2024, 7, 4), YEAR, (datetime.date(2024, 1, 1), datetime.date(2025, 1, 1))),
+])
+def test_partition_range(day, interval, expected):
+    """
+    Test case: Compute the bounds of the partition holding a day.
+
+    Expected Result:
+    - The bounds are the first day of the interval and the first day of the next one.
+    """
+    assert partition_range(day, interval) == expected
+
+
+def test_partition_range_rejects_unknown_interval():
+    """
+    Test case: Compute partition bounds for an unsupported interval.
+
+    Expected Result:
+    - ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        partition_range(datetime.date(2024, 1, 1), 'week')
+
+
+@pytest.mark.django_db
+def test_transactions_table_is_partitioned_by_month():
+    """
+    Test case: Inspect the transactions table after the migrations.
+
+    Expected Result:
+    - It is partitioned, with monthly partitions from the current month on.
+    """
+    current = partition_range(datetime.date.today(), MONTH)
+
+    assert is_partitioned(connection, TABLE)
+    assert [(partition.start, partition.end) for partition in get_partitions(connection, TABLE)][0] == current
+
+
+@pytest.mark.django_db
+def test_command_moves_rows_out_of_default_partition(user):
+    """
+    Test case: Store a transaction dated before every partition, then run `partition_transactions`.
+
+    Expected Result:
+    - The transaction first lands in the default partition, then is moved to a new partition of its month,
+      whose indexes are named after the table's.
+    """
+    transaction = create_transaction(user, datetime.date(2020, 5, 17))
+    assert partition_of(transaction) == f'{TABLE}_pdefault'
+
+    out = StringIO()
+    call_command('partition_transactions', stdout=out)
+
+    assert partition_of(transaction) == f'{TABLE}_p2020_05'
+    assert f'Created partition {TABLE}_p2020_05' in out.getvalue()
+    assert Transaction.objects.get(pk=transaction.pk).date == datetime.date(2020, 5, 17)
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT indexname FROM pg_indexes WHERE tablename = %s', [f'{TABLE}_p2020_05'])
+        assert 'p2020_05_transaction_user_date_id_idx' in {name for name, in cursor.fetchall()}
+
+
+@pytest.mark.django_db
+def test_date_range_queries_only_scan_matching_partitions(user):
+    """
+    Test case: Inspect the plans of a report range query and of a filtered list query for one month.
+
+    Expected Result:
+    - Only the partition of that month is scanned; other months and the default partition are pruned.
+    """
+    create_partitions(connection, TABLE, MONTH, datetime.date(2024, 1, 1), datetime.date(2024, 3, 31))
+    for month in (1, 2, 3):
+        create_transaction(user, datetime.date(2024, month, 10))
+    report_range = Transaction.objects.filter(date__range=[datetime.date(2024, 2, 1), datetime.date(2024, 2, 29)])
+    listing = TransactionServiceImpl.filter_transactions(start_date=datetime.date(2024, 2, 5),
+                                                         end_date=datetime.date(2024, 2, 20)).order_by('date', 'id')
+
+    for queryset in (report_range, listing):
+        plan = queryset.explain()
+        assert f'{TABLE}_p2024_02' in plan
+        assert f'{TABLE}_p2024_01' not in plan
+        assert f'{TABLE}_p2024_03' not in plan
+        assert f'{TABLE}_pdefault' not in plan
+
+
+@pytest.mark.django_db
+def test_lookups_by_id_and_date_only_scan_one_partition(user):
+    """
+    Test case: Retrieve, update and delete a transaction by its ID and date, and inspect the plans of the
+    statements.
+
+    Expected Result:
+    - Each statement only reads the partition of the date; the others, probed by a lookup by ID alone, are pruned.
+    """
+    create_partitions(connection, TABLE, MONTH, datetime.date(2024, 1, 1), datetime.date(2024, 3, 31))
+    day = datetime.date(2024, 2, 10)
+    transaction = create_transaction(user, day)
+
+    with CaptureQueriesContext(connection) as queries:
+        TransactionServiceImpl.get_transaction_by_id(transaction.id, day)
+        TransactionServiceImpl.update_transaction(transaction.id, day, category='bonus')
+        TransactionServiceImpl.delete_transaction(transaction.id, day)
+
+    statements = [query['sql'] for query in queries.captured_queries if TABLE in query['sql']]
+    assert len(statements) == 3
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(f'EXPLAIN {statement}')
+            plan = '\n'.join(row for row, in cursor.fetchall())
+            assert f'{TABLE}_p2024_02' in plan
+            assert f'{TABLE}_p2024_01' not in plan
+            assert f'{TABLE}_p2024_03' not in plan
+            assert f'{TABLE}_pdefault' not in plan
+
+
+@pytest.mark.django_db
+def test_update_moves_transaction_between_partitions(user):
+    """
+    Test case: Change the date of a transaction to another month.
+
+    Expected Result:
+    - The row moves to the partition of the new month.
+    """
+    create_partitions(connection, TABLE, MONTH, datetime.date(2024, 1, 1), datetime.date(2024, 2, 1))
+    transaction = create_transaction(user, datetime.date(2024, 1, 10))
+
+    TransactionServiceImpl.update_transaction(transaction.id, date=datetime.date(2024, 2, 10))
+
+    assert partition_of(transaction) == f'{TABLE}_p2024_02'
+
+
+@pytest.mark.django_db
+def test_convert_round_trip_keeps_rows_and_constraints(user):
+    """
+    Test case: Turn the table back into a plain table, then partition it again by year.
+
+    Expected Result:
+    - Rows are kept, the command refuses to run on the plain table, and the yearly partitions hold the rows.
+    """
+    transactions = [create_transaction(user, datetime.date(year, 6, 1)) for year in (2022, 2023)]
+
+    convert_to_plain(connection, TABLE, ['id'])
+    assert not is_partitioned(connection, TABLE)
+    with pytest.raises(CommandError):
+        call_command('partition_transactions', stdout=StringIO())
+
+    convert_to_partitioned(connection, TABLE, YEAR, 1)
+
+    assert is_partitioned(connection, TABLE)
+    assert [partition_of(transaction) for transaction in transactions] == [f'{TABLE}_p2022', f'{TABLE}_p2023']
+    assert Transaction.objects.count() == 2
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT contype FROM pg_constraint WHERE conrelid = %s::regclass", [TABLE])
+        assert sorted(contype for contype, in cursor.fetchall()) == ['f', 'p']
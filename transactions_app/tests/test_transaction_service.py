@@ -7,6 +7,14 @@ from transactions_app.models import Transaction
 from transactions_app.service.transaction_service_impl import TransactionServiceImpl
 from users_app.models import User
 from users_app.service.user_service_impl import UserServiceImpl
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+
+@pytest.fixture(autouse=True)
+def mock_bump_version():
+    """The data version lives in the database, which these tests do not use."""
+    with mock.patch.object(DataVersionServiceImpl, "bump_version") as bump_version:
+        yield bump_version
 
 
 @pytest.fixture
@@ -47,109 +55,94 @@ def user_entity() -> User:
 @mock.patch.object(Transaction, "save")
 def test_create_transaction(mock_transaction_save: MagicMock,
                             mock_user_service: MagicMock,
-                            user_entity,
-                            request_data,
-                            transaction_entity):
+                            request_data):
     """Test creating a new transaction successfully.
 
     This test mocks the save method of the Transaction model and asserts that
-    the method is called once when saving a new transaction.
+    the method is called once when saving a new transaction, with the user
+    assigned by ID rather than fetched again.
     """
-    transaction_entity.user_id = request_data['user_id']
-    mock_user_service.return_value = user_entity
     result = TransactionServiceImpl.create_transaction(**request_data)
     mock_transaction_save.assert_called_once()
+    mock_user_service.assert_not_called()
     assert result.amount == request_data['amount']
+    assert result.user_id == request_data['user_id']
 
 
-@mock.patch.object(UserServiceImpl, "get_user_by_id")
 @mock.patch.object(Transaction, "save")
-def test_create_transaction_fail(mock_transaction_save: MagicMock, mock_user_service: MagicMock, request_data,
-                                 user_entity):
+def test_create_transaction_fail(mock_transaction_save: MagicMock, request_data):
     """Test creating a new transaction fails due to a database error.
 
     This test mocks the save method to raise an exception and checks
     that the exception is correctly raised.
     """
-    mock_user_service.return_value = user_entity
     mock_transaction_save.side_effect = Exception("Database error")
     with pytest.raises(Exception, match="Database error"):
         TransactionServiceImpl.create_transaction(**request_data)
     mock_transaction_save.assert_called_once()
 
 
-@mock.patch.object(Transaction, "save")
-@mock.patch.object(Transaction, "objects")
-def test_update_transaction(mock_transaction_objects: MagicMock,
-                            mock_transaction_save: MagicMock,
-                            request_data,
-                            transaction_entity):
+@mock.patch("transactions_app.service.transaction_service_impl.update_returning")
+def test_update_transaction(mock_update_returning: MagicMock, mock_bump_version, transaction_entity):
     """Test updating an existing transaction successfully.
 
-    This test checks that the update_transaction method calls the
-    get method and save method of the Transaction model correctly, and asserts
-    that the returned transaction has the updated amount.
+    This test checks that the update_transaction method writes only the given
+    fields with a single UPDATE ... RETURNING and returns the updated transaction.
     """
     updated_amount = 200.0
     transaction_id = transaction_entity.id
-    transaction_entity.user_id = request_data['user_id']
-
-    mock_transaction_objects.get.return_value = transaction_entity
+    mock_update_returning.return_value = transaction_entity
 
-    result = TransactionServiceImpl.update_transaction(transaction_id, amount=updated_amount)
+    result = TransactionServiceImpl.update_transaction(transaction_id, amount=updated_amount, unknown='x')
 
-    mock_transaction_objects.get.assert_called_once_with(id=transaction_id)
-    mock_transaction_save.assert_called_once()
-
-    assert result.amount == updated_amount
+    mock_update_returning.assert_called_once_with(Transaction, transaction_id, {'amount': updated_amount}, {})
+    mock_bump_version.assert_called_once_with(Transaction)
+    assert result is transaction_entity
 
 
-@mock.patch.object(Transaction, "objects")
-def test_update_transaction_not_found(mock_transaction_objects: MagicMock, transaction_entity):
+@mock.patch("transactions_app.service.transaction_service_impl.update_returning")
+def test_update_transaction_not_found(mock_update_returning: MagicMock, mock_bump_version, transaction_entity):
     """Test updating an existing transaction fails when transaction is not found.
 
     This test checks that attempting to update a transaction that does not exist
     raises an ObjectDoesNotExist exception.
     """
-    mock_transaction_objects.get.side_effect = ObjectDoesNotExist("Not Found")
+    mock_update_returning.side_effect = Transaction.DoesNotExist("Not Found")
 
     with pytest.raises(ObjectDoesNotExist):
         TransactionServiceImpl.update_transaction(transaction_entity.id, amount=200.0)
 
-    mock_transaction_objects.get.assert_called_once_with(id=transaction_entity.id)
+    mock_bump_version.assert_not_called()
 
 
-@mock.patch.object(Transaction, "delete")
 @mock.patch.object(Transaction, "objects")
-def test_delete_transaction(mock_transaction_objects: MagicMock, mock_transaction_delete: MagicMock,
-                            transaction_entity):
+def test_delete_transaction(mock_transaction_objects: MagicMock, mock_bump_version, transaction_entity):
     """Test deleting an existing transaction successfully.
 
-    This test verifies that the delete_transaction method correctly calls the
-    delete method of the Transaction model for the given transaction.
+    This test verifies that the delete_transaction method deletes the transaction
+    with a single DELETE filtered by its ID.
     """
-    mock_transaction_objects.get.return_value = transaction_entity
+    mock_transaction_objects.filter.return_value.delete.return_value = (1, {'transactions_app.Transaction': 1})
 
     TransactionServiceImpl.delete_transaction(transaction_entity.id)
-    mock_transaction_delete.assert_called_once()
+
+    mock_transaction_objects.filter.assert_called_once_with(id=transaction_entity.id)
+    mock_bump_version.assert_called_once_with(Transaction)
 
 
-@mock.patch.object(Transaction, "delete")
 @mock.patch.object(Transaction, "objects")
-def test_delete_transaction_not_found(mock_transaction_objects: MagicMock, mock_transaction_delete: MagicMock,
-                                      transaction_entity):
+def test_delete_transaction_not_found(mock_transaction_objects: MagicMock, mock_bump_version, transaction_entity):
     """Test deleting a transaction fails when transaction is not found.
 
     This test checks that attempting to delete a transaction that does not exist
     raises an ObjectDoesNotExist exception.
     """
-    mock_transaction_objects.get.side_effect = ObjectDoesNotExist("Not Found")
+    mock_transaction_objects.filter.return_value.delete.return_value = (0, {})
 
     with pytest.raises(ObjectDoesNotExist):
         TransactionServiceImpl.delete_transaction(transaction_entity.id)
 
-    mock_transaction_objects.get.assert_called_once_with(id=transaction_entity.id)
-    mock_transaction_delete.assert_not_called()
+    mock_bump_version.assert_not_called()
 
 
 @mock.patch.object(Transaction, "objects")
@@ -191,3 +184,35 @@ def test_get_transaction_by_id_not_found(mock_transaction_objects: MagicMock, tr
         TransactionServiceImpl.get_transaction_by_id(transaction_entity.id)
 
     mock_transaction_objects.get.assert_called_once_with(id=transaction_entity.id)
+
+
+@mock.patch.object(Transaction, "objects")
+def test_filter_transactions(mock_transaction_objects: MagicMock, transaction_entity):
+    """Test filtering transactions applies only the given filters.
+
+    This test checks that filter_transactions chains one filter call per provided
+    argument and skips the filters left as None.
+    """
+    queryset = mock_transaction_objects.all.return_value
+    queryset.filter.return_value = queryset
+    user_id = uuid.uuid4()
+
+    result = TransactionServiceImpl.filter_transactions(start_date="2024-01-01", user_id=user_id)
+
+    mock_transaction_objects.all.assert_called_once()
+    queryset.filter.assert_has_calls([mock.call(date__gte="2024-01-01"), mock.call(user_id=user_id)])
+    assert queryset.filter.call_count == 2
+    assert result == queryset
+
+
+@mock.patch.object(Transaction.objects, "bulk_create")
+@mock.patch("transactions_app.service.transaction_service_impl.db_transaction.atomic")
+def test_create_transactions(mock_atomic: MagicMock, mock_bulk_create: MagicMock, mock_bump_version, request_data):
+    mock_bulk_create.side_effect = list
+
+    created = TransactionServiceImpl.create_transactions([request_data, request_data])
+
+    assert len(created) == 2
+    assert created[0].user_id == request_data["user_id"]
+    mock_bulk_create.assert_called_once()
+    mock_bump_version.assert_called_once_with(Transaction)
@@ -1,6 +1,8 @@
 import uuid
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponseBase
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -8,7 +10,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from transactions_app.serializers import TransactionSerializer
+from core_app.pagination import KEYSET_PAGINATION_PARAMETERS, KeysetPagination
+from core_app.streaming import STREAM_QUERY_PARAMETERS, get_stream_format, stream_records
+from transactions_app.serializers import (TRANSACTION_LIST_SERIALIZER, TransactionBulkUpdateSerializer,
+                                          TransactionFilterSerializer, TransactionLookupSerializer,
+                                          TransactionSerializer)
+from transactions_app.service.transaction_batch_validator import validate_transaction_rows
 from transactions_app.service.transaction_service_impl import TransactionServiceImpl
 
 
@@ -17,8 +24,11 @@ class TransactionListView(APIView):
     API view to retrieve list of transactions or create a new transaction.
 
     GET:
-    Return the list of all transactions.
-    If no transactions exist, return an empty list.
+    Return a page of transactions ordered by date and ID, optionally filtered by user, date range, type,
+    category and amount range. If no transactions match, return an empty list.
+    The next page is linked in the `Link` header and can be requested with the `cursor` parameter.
+    With `stream=1` (or `stream=ndjson`), all matching transactions are streamed in the same order instead,
+    as one JSON array (or one JSON object per line).
 
     POST:
     Create a new transaction based on the provided data.
@@ -26,19 +36,35 @@ class TransactionListView(APIView):
     """
 
     @swagger_auto_schema(
-        operation_description="Retrieve a list of all transactions",
-        responses={200: TransactionSerializer(many=True)}
+        operation_description="Retrieve the transactions matching the given filters, a page at a time if a cursor "
+                              "or page size is given",
+        query_serializer=TransactionFilterSerializer,
+        manual_parameters=KEYSET_PAGINATION_PARAMETERS + STREAM_QUERY_PARAMETERS,
+        responses={200: TransactionSerializer(many=True), 400: 'Invalid filters', 404: 'Invalid cursor'}
     )
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> HttpResponseBase:
         """
-        Handle GET requests to return a list of all transactions.
+        Handle GET requests to return the matching transactions, or a page of them.
 
-        This method retrieves all transactions from the database via the `TransactionServiceImpl`,
-        serializes them into JSON, and returns the serialized data in the response.
+        This method validates the query filters using the `TransactionFilterSerializer`, retrieves the matching
+        transactions via the `TransactionServiceImpl`, takes the page following the cursor with `KeysetPagination`
+        if a cursor or page size is given, serializes them with the compiled `TRANSACTION_LIST_SERIALIZER`, and
+        returns the serialized data in the response. When streaming is requested, every matching transaction is
+        streamed with `stream_records` instead. If the filters are invalid, it returns the validation errors.
         """
-        transactions = TransactionServiceImpl.get_all_transactions()
-        serializer = TransactionSerializer(transactions, many=True)
-        return Response(serializer.data)
+        filter_serializer = TransactionFilterSerializer(data=request.query_params)
+        if not filter_serializer.is_valid():
+            return Response(filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        stream_format = get_stream_format(request)
+        transactions = TransactionServiceImpl.filter_transactions(**filter_serializer.get_service_filters())
+        if stream_format is not None:
+            return stream_records(transactions.order_by('date', 'id'), TRANSACTION_LIST_SERIALIZER, stream_format)
+        paginator = KeysetPagination(ordering=('date', 'id'))
+        records = TRANSACTION_LIST_SERIALIZER.records(transactions)
+        page = paginator.paginate_queryset(records, request, self)
+        if page is None:
+            return Response(TRANSACTION_LIST_SERIALIZER.many(records.order_by(*paginator.ordering)))
+        return paginator.get_paginated_response(TRANSACTION_LIST_SERIALIZER.many(page))
 
     @swagger_auto_schema(
         operation_description="Create a new transaction",
@@ -69,6 +95,122 @@ class TransactionListView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class TransactionBatchView(APIView):
+    """
+    API view to create many transactions at once.
+
+    POST:
+    Create all transactions of the provided list, or none of them.
+    Each item takes the same data as a single transaction. If any item is invalid, nothing is created
+    and the errors are returned as a list aligned with the items, with an empty object for valid items.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Create a batch of transactions",
+        request_body=TransactionSerializer(many=True),
+        responses={
+            201: openapi.Response('Transactions created', TransactionSerializer(many=True)),
+            400: 'Bad Request'
+        }
+    )
+    def post(self, request: Request) -> Response:
+        """
+        Handle POST requests to create a batch of transactions.
+
+        This method validates all items in one pass with `validate_transaction_rows`, which checks the referenced
+        users with a single query, and if every item is valid, inserts them through `TransactionServiceImpl` with
+        one bulk INSERT. Otherwise it returns the errors of each item.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({'non_field_errors': ["Expected a non-empty list of transactions."]},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.TRANSACTION_BATCH_MAX_SIZE:
+            return Response({'non_field_errors': [
+                f"Ensure this list has no more than {settings.TRANSACTION_BATCH_MAX_SIZE} transactions."]},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        errors: list[dict[str, list[str]]] = [{} for _ in items]
+        rows = []
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                rows.append((index, item))
+            else:
+                errors[index] = {'non_field_errors': [
+                    f"Invalid data. Expected a dictionary, but got {type(item).__name__}."]}
+        valid, invalid = validate_transaction_rows(rows)
+        for index, item_errors in invalid:
+            errors[index] = item_errors
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        transactions = TransactionServiceImpl.create_transactions([values for _, values in valid])
+        return Response(TransactionSerializer(transactions, many=True).data, status=status.HTTP_201_CREATED)
+
+
+class TransactionBulkView(APIView):
+    """
+    API view to update or delete all transactions matching a set of filters.
+
+    The filters are given as query parameters, as for the transaction list, and at least one is required.
+
+    PATCH:
+    Set the provided fields on every matching transaction and return the number of updated transactions.
+
+    DELETE:
+    Delete every matching transaction and return the number of deleted transactions.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Update all transactions matching the given filters",
+        query_serializer=TransactionFilterSerializer,
+        request_body=TransactionBulkUpdateSerializer,
+        responses={200: openapi.Response('Number of updated transactions'), 400: 'Bad Request'}
+    )
+    def patch(self, request: Request) -> Response:
+        """
+        Handle PATCH requests to update the transactions matching the query filters.
+
+        This method validates the filters using the `TransactionFilterSerializer` and the new values using the
+        `TransactionBulkUpdateSerializer`, and updates the matching transactions with one UPDATE statement through
+        the `TransactionServiceImpl`. If the filters or values are invalid, it returns the validation errors.
+        """
+        filter_serializer = TransactionFilterSerializer(data=request.query_params)
+        if not filter_serializer.is_valid():
+            return Response(filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if not filter_serializer.validated_data:
+            return Response({'non_field_errors': ["Provide at least one filter."]}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = TransactionBulkUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        updated = TransactionServiceImpl.update_transactions(filter_serializer.get_service_filters(),
+                                                             **serializer.validated_data)
+        return Response({'updated': updated}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_description="Delete all transactions matching the given filters",
+        query_serializer=TransactionFilterSerializer,
+        responses={200: openapi.Response('Number of deleted transactions'), 400: 'Bad Request'}
+    )
+    def delete(self, request: Request) -> Response:
+        """
+        Handle DELETE requests to delete the transactions matching the query filters.
+
+        This method validates the filters using the `TransactionFilterSerializer` and deletes the matching
+        transactions with one DELETE statement through the `TransactionServiceImpl`. If the filters are invalid,
+        it returns the validation errors.
+        """
+        filter_serializer = TransactionFilterSerializer(data=request.query_params)
+        if not filter_serializer.is_valid():
+            return Response(filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if not filter_serializer.validated_data:
+            return Response({'non_field_errors': ["Provide at least one filter."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        deleted = TransactionServiceImpl.delete_transactions(filter_serializer.get_service_filters())
+        return Response({'deleted': deleted}, status=status.HTTP_200_OK)
+
+
 class TransactionDetailsView(APIView):
     """
     API view to retrieve, update or delete a specific transaction by ID.
@@ -85,12 +227,17 @@ class TransactionDetailsView(APIView):
     DELETE:
     Delete a transaction by its ID.
     If the transaction is not found, return a 404 error.
+
+    Each method takes the current date of the transaction as an optional `date` parameter, which lets the
+    database search only the partition of that date; a transaction stored under another date is not found.
     """
 
     @swagger_auto_schema(
         operation_description="Retrieve a transaction by ID",
+        query_serializer=TransactionLookupSerializer,
         responses={
             200: TransactionSerializer(),
+            400: 'Invalid date',
             404: openapi.Response('Transaction not found')
         }
     )
@@ -101,8 +248,12 @@ class TransactionDetailsView(APIView):
         This method retrieves the transaction via the `TransactionServiceImpl`, serializes it into JSON,
         and returns the serialized data in the response. If the transaction is not found, a 404 error is returned.
         """
+        lookup_serializer = TransactionLookupSerializer(data=request.query_params)
+        if not lookup_serializer.is_valid():
+            return Response(lookup_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         try:
-            transaction = TransactionServiceImpl.get_transaction_by_id(id)
+            transaction = TransactionServiceImpl.get_transaction_by_id(id,
+                                                                       lookup_serializer.validated_data.get('date'))
             serializer = TransactionSerializer(transaction)
             return Response(serializer.data)
         except ObjectDoesNotExist:
@@ -110,6 +261,7 @@ class TransactionDetailsView(APIView):
 
     @swagger_auto_schema(
         operation_description="Update a transaction by ID",
+        query_serializer=TransactionLookupSerializer,
         request_body=TransactionSerializer,
         responses={
             200: openapi.Response('Transaction updated', TransactionSerializer),
@@ -125,10 +277,14 @@ class TransactionDetailsView(APIView):
         and updates the transaction through the `TransactionServiceImpl`. If the transaction is not found,
         a 404 error is returned.
         """
+        lookup_serializer = TransactionLookupSerializer(data=request.query_params)
+        if not lookup_serializer.is_valid():
+            return Response(lookup_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         serializer = TransactionSerializer(data=request.data, partial=True)
         if serializer.is_valid():
             try:
-                TransactionServiceImpl.update_transaction(id, **serializer.validated_data)
+                TransactionServiceImpl.update_transaction(id, lookup_serializer.validated_data.get('date'),
+                                                          **serializer.validated_data)
                 return Response({'detail': 'Transaction updated'}, status=status.HTTP_200_OK)
             except ObjectDoesNotExist:
                 return Response({'error': 'Transaction not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -136,8 +292,10 @@ class TransactionDetailsView(APIView):
 
     @swagger_auto_schema(
         operation_description="Delete a transaction by ID",
+        query_serializer=TransactionLookupSerializer,
         responses={
             204: 'No Content',
+            400: 'Invalid date',
             404: openapi.Response('Transaction not found')
         }
     )
@@ -148,8 +306,11 @@ class TransactionDetailsView(APIView):
         This method deletes the transaction through the `TransactionServiceImpl`.
         If the transaction is not found, a 404 error is returned.
         """
+        lookup_serializer = TransactionLookupSerializer(data=request.query_params)
+        if not lookup_serializer.is_valid():
+            return Response(lookup_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         try:
-            TransactionServiceImpl.delete_transaction(id)
+            TransactionServiceImpl.delete_transaction(id, lookup_serializer.validated_data.get('date'))
             return Response(status=status.HTTP_204_NO_CONTENT)
         except ObjectDoesNotExist:
             return Response({'error': 'Transaction not found'}, status=status.HTTP_404_NOT_FOUND)
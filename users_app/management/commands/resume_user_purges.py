@@ -0,0 +1,14 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from users_app.service.user_service_impl import UserServiceImpl
+
+
+class Command(BaseCommand):
+    help = ("Resume the user purges interrupted by a restart, running them in this process until they finish. "
+            "Meant to be run on a schedule (cron).")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        resumed = UserServiceImpl.resume_stale_purges()
+        self.stdout.write(self.style.SUCCESS(f"Resumed {resumed} user purge(s)"))
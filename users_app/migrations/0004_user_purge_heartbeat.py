@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:43
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def fail_duplicate_active_purges(apps, schema_editor):
+    """Keep the oldest pending or running purge of each user, so the uniqueness constraint can be added."""
+    UserPurge = apps.get_model('users_app', 'UserPurge')
+    active = UserPurge.objects.filter(status__in=['pending', 'running'])
+    kept = set()
+    for purge_id, user_id in active.order_by('created_at').values_list('id', 'user_id'):
+        if user_id in kept:
+            active.filter(id=purge_id).update(status='failed', error='Superseded by another purge of the user',
+                                              finished_at=django.utils.timezone.now())
+        kept.add(user_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users_app', '0003_user_purge'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userpurge',
+            name='heartbeat_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(fail_duplicate_active_purges, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='userpurge',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('user_id',), name='user_purge_one_active_per_user'),
+        ),
+    ]
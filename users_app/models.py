@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.utils import timezone
 
 # Create your models here.
 class User(models.Model):
@@ -8,3 +9,42 @@ class User(models.Model):
     last_name = models.CharField(max_length=50)
     email = models.EmailField(unique=True)
     reg_date = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['reg_date', 'id'], name='user_reg_date_id_idx'),
+        ]
+
+
+class UserPurgeStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    FINISHED = 'finished', 'Finished'
+    FAILED = 'failed', 'Failed'
+
+
+class UserPurge(models.Model):
+    """
+    A background deletion of a user, which removes the user's transactions in bounded batches
+    before deleting the user itself.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Not a foreign key: the purge outlives the user it deletes.
+    user_id = models.UUIDField()
+    status = models.CharField(max_length=8, choices=UserPurgeStatus.choices, default=UserPurgeStatus.PENDING)
+    transactions_deleted = models.BigIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True)
+    # Refreshed after every batch; pending and running purges whose heartbeat is older than
+    # USER_PURGE_STALE_SECONDS were lost with the process that ran them and are resumed.
+    heartbeat_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user_id', 'status'], name='user_purge_user_status_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user_id'], condition=models.Q(status__in=['pending', 'running']),
+                                    name='user_purge_one_active_per_user'),
+        ]
@@ -1,9 +1,20 @@
 from rest_framework import serializers
 
-from users_app.models import User
+from core_app.compiled_serializers import CompiledSerializer
+from users_app.models import User, UserPurge
 
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = '__all__'
+
+
+# Read path of the user list, with the same output as UserSerializer(many=True).
+USER_LIST_SERIALIZER = CompiledSerializer(UserSerializer)
+
+
+class UserPurgeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserPurge
+        fields = '__all__'
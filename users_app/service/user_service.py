@@ -1,8 +1,10 @@
+import datetime
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
 
-from users_app.models import User
+from django.db.models import QuerySet
+
+from users_app.models import User, UserPurge
 
 
 class UserService(ABC):
@@ -38,21 +40,63 @@ class UserService(ABC):
 
     @staticmethod
     @abstractmethod
-    def delete_user(user_id: uuid.UUID) -> None:
+    def delete_user(user_id: uuid.UUID) -> UserPurge:
         """
-        Delete an existing user from the database.
+        Schedule the deletion of an existing user and all of the user's transactions in the background.
+
+        If a purge of the user is already pending or running, that purge is returned instead of a new one,
+        and resumed if it was interrupted (see `resume_stale_purges`).
 
         :param user_id: The ID of the user to be deleted.
+        :return: The UserPurge tracking the deletion.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def purge_user(purge_id: uuid.UUID, claimed_at: datetime.datetime) -> None:
+        """
+        Run a user purge: delete the user's transactions in bounded batches, each in its own short
+        database transaction, then delete the user. Progress and failures are recorded on the purge.
+
+        The run only goes ahead while the purge's heartbeat is the one it last wrote, starting from the one
+        it was scheduled with, so a run that was scheduled again, or resumed by another one, stops.
+
+        :param purge_id: The ID of the UserPurge to run.
+        :param claimed_at: The heartbeat of the purge when this run was scheduled.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def resume_stale_purges() -> int:
+        """
+        Schedule again the pending and running purges without a heartbeat for USER_PURGE_STALE_SECONDS,
+        whose process-local worker is gone, e.g. after a restart. Purges are idempotent, so they resume
+        with the transactions that are left.
+
+        :return: The number of resumed purges.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def get_purge_by_id(purge_id: uuid.UUID) -> UserPurge:
+        """
+        Retrieve a user purge by its unique ID.
+
+        :param purge_id: The ID of the purge to retrieve.
+        :return: The UserPurge instance that matches the given ID.
         """
         pass
 
     @staticmethod
     @abstractmethod
-    def get_all_users() -> List[User]:
+    def get_all_users() -> QuerySet[User]:
         """
         Retrieve all users from the database.
 
-        :return: A list of all User instances.
+        :return: A queryset of all User instances.
         """
         pass
 
@@ -1,9 +1,19 @@
+import datetime
 import uuid
 import logging
-from typing import List
+from typing import Any, Optional
 
-from users_app.models import User
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from core_app.background import submit_background_task
+from core_app.db import update_returning
+from transactions_app.models import Transaction
+from users_app.models import User, UserPurge, UserPurgeStatus
 from users_app.service.user_service import UserService
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
 
 
 class UserServiceImpl(UserService):
@@ -19,21 +29,118 @@ class UserServiceImpl(UserService):
     @staticmethod
     def update_existing_user(user_id: uuid.UUID, **kwargs: dict[str, str]) -> User:
         UserServiceImpl.logger.info(f"Updating user with id: {user_id}")
-        user = User.objects.get(id=user_id)
-        for attr, value in kwargs.items():
-            if hasattr(user, attr):
-                setattr(user, attr, value)
-        user.save()
-        return user
+        values = {attr: value for attr, value in kwargs.items() if hasattr(User, attr)}
+        return update_returning(User, user_id, values)
 
     @staticmethod
-    def delete_user(user_id: uuid.UUID) -> None:
-        UserServiceImpl.logger.info(f"Deleting user with id: {user_id}")
-        user = User.objects.get(id=user_id)
-        user.delete()
+    def delete_user(user_id: uuid.UUID) -> UserPurge:
+        UserServiceImpl.logger.info(f"Scheduling deletion of user with id: {user_id}")
+        if not User.objects.filter(id=user_id).exists():
+            raise User.DoesNotExist(f"User {user_id} does not exist.")
+        # At most one purge per user is pending or running (see `user_purge_one_active_per_user`), so
+        # concurrent requests agree on the same purge.
+        purge, created = UserPurge.objects.get_or_create(
+            user_id=user_id, status__in=[UserPurgeStatus.PENDING, UserPurgeStatus.RUNNING])
+        claimed_at = purge.heartbeat_at if created else UserServiceImpl._claim_stale_purge(purge)
+        if claimed_at is not None:
+            submit_background_task(UserServiceImpl.purge_user, purge.id, claimed_at)
+        return purge
+
+    @staticmethod
+    def purge_user(purge_id: uuid.UUID, claimed_at: datetime.datetime) -> None:
+        UserServiceImpl.logger.info(f"Running user purge with id: {purge_id}")
+        user_id = UserPurge.objects.filter(id=purge_id).values_list('user_id', flat=True).get()
+        # Every write compares and sets the heartbeat, so once a purge waiting in the queue for longer than
+        # USER_PURGE_STALE_SECONDS was scheduled again, only one of its runs goes ahead.
+        started = UserServiceImpl._advance_purge(purge_id, claimed_at, status=UserPurgeStatus.RUNNING)
+        if started is None:
+            UserServiceImpl.logger.warning(f"User purge {purge_id} is no longer active or was claimed by another "
+                                           f"run, not running it")
+            return
+        heartbeat = started
+        try:
+            while deleted := UserServiceImpl._delete_transaction_batch(user_id):
+                advanced = UserServiceImpl._advance_purge(
+                    purge_id, heartbeat, transactions_deleted=F('transactions_deleted') + deleted)
+                if advanced is None:
+                    UserServiceImpl.logger.warning(f"User purge {purge_id} was claimed by another run, stopping")
+                    return
+                heartbeat = advanced
+            with transaction.atomic():
+                # Transactions created while the purge ran are removed by the cascade.
+                User.objects.filter(id=user_id).delete()
+                DataVersionServiceImpl.bump_version(Transaction)
+        except Exception as exc:
+            UserServiceImpl.logger.exception(f"User purge {purge_id} failed")
+            UserServiceImpl._advance_purge(purge_id, heartbeat, status=UserPurgeStatus.FAILED, error=str(exc),
+                                           finished_at=timezone.now())
+            return
+        UserServiceImpl._advance_purge(purge_id, heartbeat, status=UserPurgeStatus.FINISHED,
+                                       finished_at=timezone.now())
+
+    @staticmethod
+    def resume_stale_purges() -> int:
+        resumed = 0
+        stale = UserPurge.objects.filter(status__in=[UserPurgeStatus.PENDING, UserPurgeStatus.RUNNING],
+                                         heartbeat_at__lt=UserServiceImpl._stale_before())
+        for purge in stale:
+            claimed_at = UserServiceImpl._claim_stale_purge(purge)
+            if claimed_at is not None:
+                UserServiceImpl.logger.warning(f"Resuming interrupted user purge {purge.id}")
+                submit_background_task(UserServiceImpl.purge_user, purge.id, claimed_at)
+                resumed += 1
+        return resumed
+
+    @staticmethod
+    def get_purge_by_id(purge_id: uuid.UUID) -> UserPurge:
+        UserServiceImpl.logger.info(f"Getting user purge with id: {purge_id}")
+        purge = UserPurge.objects.get(id=purge_id)
+        return purge
+
+    @staticmethod
+    def _claim_stale_purge(purge: UserPurge) -> Optional[datetime.datetime]:
+        """
+        Refresh the heartbeat of a purge whose heartbeat is stale, so a single caller resumes it.
+
+        :return: The new heartbeat, which the resumed run starts from, or None if the purge was not stale or
+                 was claimed by another caller.
+        """
+        if purge.heartbeat_at >= UserServiceImpl._stale_before():
+            return None
+        return UserServiceImpl._advance_purge(purge.id, purge.heartbeat_at)
+
+    @staticmethod
+    def _advance_purge(purge_id: uuid.UUID, heartbeat: datetime.datetime,
+                       **values: Any) -> Optional[datetime.datetime]:
+        """
+        Write the given values and a new heartbeat to an active purge, provided its heartbeat is still the given one.
+
+        :return: The new heartbeat, or None if the purge is no longer active or its heartbeat changed.
+        """
+        now = timezone.now()
+        updated = UserPurge.objects.filter(id=purge_id, heartbeat_at=heartbeat, status__in=[
+            UserPurgeStatus.PENDING, UserPurgeStatus.RUNNING]).update(heartbeat_at=now, **values)
+        return now if updated else None
+
+    @staticmethod
+    def _stale_before() -> datetime.datetime:
+        return timezone.now() - datetime.timedelta(seconds=settings.USER_PURGE_STALE_SECONDS)
+
+    @staticmethod
+    def _delete_transaction_batch(user_id: uuid.UUID) -> int:
+        """
+        Delete up to ``USER_PURGE_BATCH_SIZE`` transactions of the user, located through the (user, date, id)
+        index, and commit, so no lock is held for longer than one batch.
+        """
+        batch = Transaction.objects.filter(user_id=user_id).values('pk')[:settings.USER_PURGE_BATCH_SIZE]
+        with transaction.atomic():
+            deleted, _ = Transaction.objects.filter(pk__in=batch).delete()
+            if deleted:
+                DataVersionServiceImpl.bump_version(Transaction)
+        return deleted
 
     @staticmethod
-    def get_all_users() -> List[User]:
+    def get_all_users() -> QuerySet[User]:
         UserServiceImpl.logger.info("Getting all users")
         user_list = User.objects.all()
         return user_list
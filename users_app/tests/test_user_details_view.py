@@ -1,8 +1,18 @@
+import datetime
+import io
 import uuid
+from unittest import mock
+
 import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from users_app.models import User
+from transactions_app.models import Transaction
+from users_app.models import User, UserPurge, UserPurgeStatus
+from users_app.service.user_service_impl import UserServiceImpl
 from rest_framework.test import APIClient
 
 
@@ -105,24 +115,181 @@ def test_update_user_invalid(api_client):
 
 
 @pytest.mark.django_db
-def test_delete_user_valid(api_client):
+def test_delete_user_valid(api_client, settings, django_capture_on_commit_callbacks):
     """
     Test case: Delete a user by valid user ID.
 
     Scenario:
-    - Create a user in the database.
-    - Make a DELETE request to remove the user by ID.
+    - Create a user with transactions in the database.
+    - Make a DELETE request to remove the user by ID and let the background purge run.
+    - Poll the purge status endpoint.
 
     Expected Result:
-    - The response status code is 204 (No Content).
-    - The user no longer exists in the database.
+    - The response status code is 202 (Accepted) with a Location header pointing to the purge.
+    - The purge is finished and reports the deleted transactions.
+    - The user and the user's transactions no longer exist in the database.
     """
+    settings.BACKGROUND_TASKS_EAGER = True
+    settings.USER_PURGE_BATCH_SIZE = 2
     user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+    other = User.objects.create(first_name="Jane", last_name="Doe", email="jane@example.com")
+    for owner in (user, user, user, user, user, other):
+        Transaction.objects.create(user=owner, amount=1, transaction_type="income", category="salary",
+                                   date="2024-01-01")
     url = reverse('user-detail', args=[user.id])
-    response = api_client.delete(url)
 
-    assert response.status_code == status.HTTP_204_NO_CONTENT
-    assert User.objects.count() == 0
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.delete(url)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data['status'] == UserPurgeStatus.PENDING
+    assert response['Location'] == reverse('user-purge-detail', args=[response.data['id']])
+    purge = api_client.get(response['Location'])
+    assert purge.data['status'] == UserPurgeStatus.FINISHED
+    assert purge.data['transactions_deleted'] == 5
+    assert list(User.objects.all()) == [other]
+    assert list(Transaction.objects.values_list('user_id', flat=True)) == [other.id]
+
+
+@pytest.mark.django_db
+def test_delete_user_purges_in_batches(settings):
+    """
+    Test case: Run the purge of a user with more transactions than fit in one batch.
+
+    Expected Result:
+    - Each batch is a single DELETE located by a bounded subquery, so no statement touches more than
+      USER_PURGE_BATCH_SIZE transactions.
+    """
+    settings.USER_PURGE_BATCH_SIZE = 2
+    user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+    for _ in range(3):
+        Transaction.objects.create(user=user, amount=1, transaction_type="income", category="salary",
+                                   date="2024-01-01")
+    purge = UserPurge.objects.create(user_id=user.id)
+
+    with CaptureQueriesContext(connection) as queries:
+        UserServiceImpl.purge_user(purge.id, purge.heartbeat_at)
+
+    deletes = [query['sql'] for query in queries.captured_queries
+               if query['sql'].startswith('DELETE FROM "transactions_app_transaction"')]
+    assert len(deletes) >= 2 and all('LIMIT 2' in sql for sql in deletes[:2])
+    assert not User.objects.filter(id=user.id).exists()
+
+
+@pytest.mark.django_db
+def test_delete_user_resumes_interrupted_purge(api_client, settings, django_capture_on_commit_callbacks):
+    """
+    Test case: Delete a user whose purge was left running by a restart, then delete the user again.
+
+    Expected Result:
+    - The interrupted purge is returned and resumed instead of a second purge being created; it deletes the
+      remaining transactions and the user.
+    """
+    settings.BACKGROUND_TASKS_EAGER = True
+    user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+    Transaction.objects.create(user=user, amount=1, transaction_type="income", category="salary", date="2024-01-01")
+    stale = UserPurge.objects.create(user_id=user.id, status=UserPurgeStatus.RUNNING,
+                                     heartbeat_at=timezone.now() - datetime.timedelta(hours=1))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.delete(reverse('user-detail', args=[user.id]))
+
+    assert response.data['id'] == str(stale.id)
+    stale.refresh_from_db()
+    assert stale.status == UserPurgeStatus.FINISHED
+    assert UserPurge.objects.count() == 1
+    assert not User.objects.filter(id=user.id).exists()
+
+
+@pytest.mark.django_db
+def test_purge_scheduled_again_runs_once():
+    """
+    Test case: Schedule again a pending purge that waited in the queue for too long, then start its first run,
+    and its second one, which another caller takes over after a batch.
+
+    Expected Result:
+    - The first run, whose claim was superseded, does nothing; the second one stops as soon as it no longer holds
+      the claim, leaving the purge to the run that took it over.
+    """
+    user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+    for _ in range(2):
+        Transaction.objects.create(user=user, amount=1, transaction_type="income", category="salary",
+                                   date="2024-01-01")
+    purge = UserPurge.objects.create(user_id=user.id, heartbeat_at=timezone.now() - datetime.timedelta(hours=1))
+    first_claim = purge.heartbeat_at
+    second_claim = UserServiceImpl._claim_stale_purge(purge)
+
+    UserServiceImpl.purge_user(purge.id, first_claim)
+
+    assert Transaction.objects.count() == 2
+    assert UserPurge.objects.get().status == UserPurgeStatus.PENDING
+
+    delete_batch = UserServiceImpl._delete_transaction_batch
+
+    def delete_batch_then_lose_claim(user_id):
+        deleted = delete_batch(user_id)
+        UserPurge.objects.update(heartbeat_at=timezone.now() + datetime.timedelta(seconds=1))
+        return deleted
+    with mock.patch.object(UserServiceImpl, '_delete_transaction_batch', side_effect=delete_batch_then_lose_claim):
+        UserServiceImpl.purge_user(purge.id, second_claim)
+
+    purge.refresh_from_db()
+    assert purge.status == UserPurgeStatus.RUNNING
+    assert purge.transactions_deleted == 0
+    assert User.objects.filter(id=user.id).exists()
+
+
+@pytest.mark.django_db
+def test_resume_user_purges_command(settings, django_capture_on_commit_callbacks):
+    """
+    Test case: Run `resume_user_purges` with an interrupted purge and one that is still running.
+
+    Expected Result:
+    - Only the interrupted purge is resumed and finishes.
+    """
+    settings.BACKGROUND_TASKS_EAGER = True
+    users = [User.objects.create(first_name="John", last_name=str(n), email=f"john{n}@example.com")
+             for n in range(2)]
+    stale = UserPurge.objects.create(user_id=users[0].id, heartbeat_at=timezone.now() - datetime.timedelta(hours=1))
+    alive = UserPurge.objects.create(user_id=users[1].id, status=UserPurgeStatus.RUNNING)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command('resume_user_purges', stdout=io.StringIO())
+
+    stale.refresh_from_db()
+    alive.refresh_from_db()
+    assert stale.status == UserPurgeStatus.FINISHED
+    assert alive.status == UserPurgeStatus.RUNNING
+    assert list(User.objects.all()) == [users[1]]
+
+
+@pytest.mark.django_db
+def test_one_active_purge_per_user():
+    """
+    Test case: Create a second pending purge of a user whose purge is running.
+
+    Expected Result:
+    - The database rejects it; finished and failed purges of the user do not count.
+    """
+    user_id = uuid.uuid4()
+    UserPurge.objects.create(user_id=user_id, status=UserPurgeStatus.FAILED)
+    UserPurge.objects.create(user_id=user_id, status=UserPurgeStatus.RUNNING)
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        UserPurge.objects.create(user_id=user_id)
+
+
+@pytest.mark.django_db
+def test_delete_user_purge_not_found(api_client):
+    """
+    Test case: Poll a user purge that does not exist.
+
+    Expected Result:
+    - The response status code is 404 (Not Found).
+    """
+    response = api_client.get(reverse('user-purge-detail', args=[uuid.uuid4()]))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.django_db
@@ -144,3 +311,37 @@ def test_delete_user_invalid(api_client):
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
     assert response.data['detail'] == "User not found"
+
+
+@pytest.mark.django_db
+def test_update_user_query_count(api_client, django_assert_num_queries):
+    """
+    Test case: Count the queries of updating a user's name.
+
+    Expected Result:
+    - A single UPDATE ... RETURNING that writes only the changed column.
+    """
+    user = User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+    with django_assert_num_queries(1) as queries:
+        response = api_client.put(reverse('user-detail', args=[user.id]), {'first_name': 'Jane'}, format='json')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert queries.captured_queries[0]['sql'].startswith('UPDATE "users_app_user" SET "first_name"')
+    user.refresh_from_db()
+    assert (user.first_name, user.last_name) == ('Jane', 'Doe')
+
+
+@pytest.mark.django_db
+def test_update_user_not_found_query_count(api_client, django_assert_num_queries):
+    """
+    Test case: Count the queries of updating a user that does not exist.
+
+    Expected Result:
+    - The UPDATE matching no row is the only query, and drives the 404 response.
+    """
+    with django_assert_num_queries(1):
+        response = api_client.put(reverse('user-detail', args=[uuid.uuid4()]), {'first_name': 'Jane'},
+                                  format='json')
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -74,3 +74,47 @@ def test_create_user_invalid(api_client):
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "first_name" in response.data
+
+
+@pytest.mark.django_db
+def test_get_user_list_paginated(api_client):
+    """
+    Test case: Walk through the users page by page with the next cursor.
+
+    Expected Result:
+    - Every user is returned exactly once, ordered by registration date and ID.
+    - The last page has no next cursor.
+    """
+    users = [User.objects.create(first_name=f"User{i}", last_name="Doe", email=f"user{i}@example.com")
+             for i in range(5)]
+
+    ids = []
+    params = {'page_size': 2}
+    while True:
+        response = api_client.get(reverse('users'), params)
+        assert response.status_code == status.HTTP_200_OK
+        ids.extend(row['id'] for row in response.data)
+        if 'X-Next-Cursor' not in response:
+            break
+        params['cursor'] = response['X-Next-Cursor']
+
+    assert ids == [str(user.id) for user in sorted(users, key=lambda user: (user.reg_date, str(user.id)))]
+
+
+@pytest.mark.django_db
+def test_get_user_list_unpaginated(api_client, settings):
+    """
+    Test case: Retrieve the users without a cursor or page size, with more users than the default page size.
+
+    Expected Result:
+    - Every user is returned in one plain list, without a next cursor.
+    """
+    settings.API_DEFAULT_PAGE_SIZE = 2
+    for i in range(3):
+        User.objects.create(first_name=f"User{i}", last_name="Doe", email=f"user{i}@example.com")
+
+    response = api_client.get(reverse('users'))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 3
+    assert 'X-Next-Cursor' not in response
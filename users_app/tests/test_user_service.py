@@ -4,8 +4,16 @@ from unittest import mock
 import pytest
 from unittest.mock import patch, MagicMock
 from django.core.exceptions import ObjectDoesNotExist
-from users_app.models import User
+from users_app.models import User, UserPurge
 from users_app.service.user_service_impl import UserServiceImpl
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+
+@pytest.fixture(autouse=True)
+def mock_bump_version():
+    """The data version lives in the database, which these tests do not use."""
+    with mock.patch.object(DataVersionServiceImpl, "bump_version") as bump_version:
+        yield bump_version
 
 
 @pytest.fixture
@@ -49,36 +57,31 @@ def test_save_new_user_fail(mock_user_save: MagicMock, request_data):
     mock_user_save.assert_called_once()
 
 
-@mock.patch.object(User, "save")
-@mock.patch.object(User, "objects")
-def test_update_existing_user(mock_user_objects: MagicMock, mock_user_save: MagicMock, request_data, user_entity):
+@mock.patch("users_app.service.user_service_impl.update_returning")
+def test_update_existing_user(mock_update_returning: MagicMock, user_entity):
     """Test updating an existing user successfully.
 
-    This test checks that the update_existing_user method calls the
-    get method and save method of the User model correctly, and asserts
-    that the returned user has the updated first name.
+    This test checks that the update_existing_user method writes only the given
+    fields with a single UPDATE ... RETURNING and returns the updated user.
     """
     updated_name = 'updatedName'
     user_id = user_entity.id
-
-    mock_user_objects.get.return_value = user_entity
+    mock_update_returning.return_value = user_entity
 
     result = UserServiceImpl.update_existing_user(user_id, first_name=updated_name)
 
-    mock_user_objects.get.assert_called_once_with(id=user_id)
-    mock_user_save.assert_called_once()
-
-    assert result.first_name == updated_name
+    mock_update_returning.assert_called_once_with(User, user_id, {'first_name': updated_name})
+    assert result is user_entity
 
 
-@mock.patch.object(User, "objects")
-def test_update_existing_user_not_found(mock_user_objects: MagicMock, user_entity):
+@mock.patch("users_app.service.user_service_impl.update_returning")
+def test_update_existing_user_not_found(mock_update_returning: MagicMock, user_entity):
     """Test updating an existing user fails when user is not found.
 
     This test checks that attempting to update a user that does not exist
     raises an ObjectDoesNotExist exception.
     """
-    mock_user_objects.get.side_effect = ObjectDoesNotExist("Not Found")
+    mock_update_returning.side_effect = User.DoesNotExist("Not Found")
 
     with pytest.raises(ObjectDoesNotExist):
         UserServiceImpl.update_existing_user(user_entity.id,
@@ -86,38 +89,63 @@ def test_update_existing_user_not_found(mock_user_objects: MagicMock, user_entit
                                              last_name = user_entity.last_name,
                                              email = user_entity.email)
 
-    mock_user_objects.get.assert_called_once_with(id=user_entity.id)
-
 
-@mock.patch.object(User, "delete")
+@mock.patch("users_app.service.user_service_impl.submit_background_task")
+@mock.patch.object(UserPurge, "objects")
 @mock.patch.object(User, "objects")
-def test_delete_user(mock_user_objects: MagicMock, mock_user_delete: MagicMock, user_entity):
+def test_delete_user(mock_user_objects: MagicMock, mock_purge_objects: MagicMock, mock_submit: MagicMock,
+                     user_entity):
     """Test deleting an existing user successfully.
 
-    This test verifies that the delete_user method correctly calls the
-    delete method of the User model for the given user.
+    This test verifies that the delete_user method creates a purge of the user
+    and schedules it in the background instead of deleting inline.
     """
-    mock_user_objects.get.return_value = user_entity
+    purge = UserPurge(id=uuid.uuid4(), user_id=user_entity.id)
+    mock_user_objects.filter.return_value.exists.return_value = True
+    mock_purge_objects.get_or_create.return_value = (purge, True)
+
+    result = UserServiceImpl.delete_user(user_entity.id)
 
-    UserServiceImpl.delete_user(user_entity.id)
-    mock_user_delete.assert_called_once()
+    assert result is purge
+    mock_purge_objects.get_or_create.assert_called_once_with(user_id=user_entity.id,
+                                                             status__in=['pending', 'running'])
+    mock_submit.assert_called_once_with(UserServiceImpl.purge_user, purge.id, purge.heartbeat_at)
+    mock_user_objects.filter.return_value.delete.assert_not_called()
 
 
-@mock.patch.object(User, "delete")
+@mock.patch("users_app.service.user_service_impl.submit_background_task")
+@mock.patch.object(UserPurge, "objects")
 @mock.patch.object(User, "objects")
-def test_delete_user_not_found(mock_user_objects: MagicMock, mock_user_delete: MagicMock, user_entity):
+def test_delete_user_already_purging(mock_user_objects: MagicMock, mock_purge_objects: MagicMock,
+                                     mock_submit: MagicMock, user_entity):
+    """Test deleting a user whose purge is already pending.
+
+    This test verifies that the pending purge, whose heartbeat is recent, is returned and no second purge
+    is scheduled.
+    """
+    purge = UserPurge(id=uuid.uuid4(), user_id=user_entity.id)
+    mock_user_objects.filter.return_value.exists.return_value = True
+    mock_purge_objects.get_or_create.return_value = (purge, False)
+    mock_purge_objects.filter.return_value.update.return_value = 0
+
+    assert UserServiceImpl.delete_user(user_entity.id) is purge
+    mock_submit.assert_not_called()
+
+
+@mock.patch("users_app.service.user_service_impl.submit_background_task")
+@mock.patch.object(User, "objects")
+def test_delete_user_not_found(mock_user_objects: MagicMock, mock_submit: MagicMock, user_entity):
     """Test deleting a user fails when user is not found.
 
     This test checks that attempting to delete a user that does not exist
     raises an ObjectDoesNotExist exception.
     """
-    mock_user_objects.get.side_effect = ObjectDoesNotExist("Not Found")
+    mock_user_objects.filter.return_value.exists.return_value = False
 
     with pytest.raises(ObjectDoesNotExist):
         UserServiceImpl.delete_user(user_entity.id)
 
-    mock_user_objects.get.assert_called_once_with(id=user_entity.id)
-    mock_user_delete.assert_not_called()
+    mock_submit.assert_not_called()
 
 
 @mock.patch.object(User, "objects")
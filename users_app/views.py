@@ -1,6 +1,8 @@
 import uuid
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponseBase
+from django.urls import reverse
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -8,7 +10,9 @@ from rest_framework.request import Request
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
-from users_app.serializers import UserSerializer
+from core_app.pagination import KEYSET_PAGINATION_PARAMETERS, KeysetPagination
+from core_app.streaming import STREAM_QUERY_PARAMETERS, get_stream_format, stream_records
+from users_app.serializers import USER_LIST_SERIALIZER, UserPurgeSerializer, UserSerializer
 from users_app.service.user_service_impl import UserServiceImpl
 
 
@@ -17,24 +21,36 @@ class UserListView(APIView):
     API View to handle the retrieval and creation of users.
 
     Methods:
-    - GET: Retrieve a list of all users in the system.
+    - GET: Retrieve a page of users, ordered by registration date and ID. The next page is linked
+      in the `Link` header and can be requested with the `cursor` parameter. With `stream=1` (or
+      `stream=ndjson`), all users are streamed in the same order as one JSON array (or one JSON object per line).
     - POST: Create a new user using the provided data.
     """
 
     @swagger_auto_schema(
-        operation_description="Retrieve a list of all users",
-        responses={200: UserSerializer(many=True)}
+        operation_description="Retrieve all users, a page at a time if a cursor or page size is given",
+        manual_parameters=KEYSET_PAGINATION_PARAMETERS + STREAM_QUERY_PARAMETERS,
+        responses={200: UserSerializer(many=True), 400: 'Invalid stream format', 404: 'Invalid cursor'}
     )
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> HttpResponseBase:
         """
-        Handle GET requests to return a list of all users.
+        Handle GET requests to return all users, or a page of them.
 
-        This method retrieves all users from the database via the `UserServiceImpl` service,
-        serializes them into JSON, and returns the serialized data in the response.
+        This method retrieves the users from the database via the `UserServiceImpl` service, takes the page
+        following the cursor with `KeysetPagination` if a cursor or page size is given, serializes them with the
+        compiled `USER_LIST_SERIALIZER`, and returns the serialized data in the response. When streaming is
+        requested, every user is streamed with `stream_records` instead.
         """
-        users = UserServiceImpl.get_all_users()
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+        stream_format = get_stream_format(request)
+        if stream_format is not None:
+            return stream_records(UserServiceImpl.get_all_users().order_by('reg_date', 'id'), USER_LIST_SERIALIZER,
+                                  stream_format)
+        paginator = KeysetPagination(ordering=('reg_date', 'id'))
+        records = USER_LIST_SERIALIZER.records(UserServiceImpl.get_all_users())
+        users = paginator.paginate_queryset(records, request, self)
+        if users is None:
+            return Response(USER_LIST_SERIALIZER.many(records.order_by(*paginator.ordering)))
+        return paginator.get_paginated_response(USER_LIST_SERIALIZER.many(users))
 
     @swagger_auto_schema(
         operation_description="Create a new user",
@@ -69,7 +85,7 @@ class UserDetailsView(APIView):
     Methods:
     - GET: Retrieve user by ID.
     - PUT: Update user by ID.
-    - DELETE: Delete user by ID.
+    - DELETE: Delete user by ID. The user and the user's transactions are purged in the background.
     """
 
     @swagger_auto_schema(
@@ -122,16 +138,44 @@ class UserDetailsView(APIView):
 
     @swagger_auto_schema(
         operation_description="Delete user by ID",
-        responses={204: 'No Content', 404: 'User not found'}
+        responses={202: openapi.Response('User purge accepted', UserPurgeSerializer), 404: 'User not found'}
     )
     def delete(self, request: Request, id: uuid.UUID) -> Response:
         """
         Handle DELETE requests to delete a user by ID.
 
-        This method deletes a user by ID through the `UserServiceImpl` service.
+        This method schedules the deletion of the user and the user's transactions through the `UserServiceImpl`
+        service and responds immediately. The response points to the status endpoint of the purge.
         """
         try:
-            UserServiceImpl.delete_user(id)
-            return Response({"detail": "Successfully deleted user"}, status=status.HTTP_204_NO_CONTENT)
+            purge = UserServiceImpl.delete_user(id)
+            return Response(UserPurgeSerializer(purge).data, status=status.HTTP_202_ACCEPTED,
+                            headers={'Location': reverse('user-purge-detail', args=[purge.id])})
         except ObjectDoesNotExist:
             return Response({"detail": "User not found"}, status=status.HTTP_404_NOT_FOUND)
+
+
+class UserPurgeDetailsView(APIView):
+    """
+    API View to poll the status of a user deletion.
+
+    Methods:
+    - GET: Retrieve the status and progress of a user purge by ID.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Retrieve the status of a user purge",
+        responses={200: UserPurgeSerializer(), 404: 'User purge not found'}
+    )
+    def get(self, request: Request, id: uuid.UUID) -> Response:
+        """
+        Handle GET requests to retrieve a user purge by ID.
+
+        This method retrieves the purge via the `UserServiceImpl` service and returns its status together with
+        the number of transactions deleted so far.
+        """
+        try:
+            purge = UserServiceImpl.get_purge_by_id(id)
+            return Response(UserPurgeSerializer(purge).data)
+        except ObjectDoesNotExist:
+            return Response({"detail": "User purge not found"}, status=status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:36
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('generation', models.UUIDField(default=uuid.uuid4, editable=False)),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
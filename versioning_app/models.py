@@ -0,0 +1,14 @@
+import uuid
+from django.db import models
+
+
+class DataVersion(models.Model):
+    """
+    Change counter of a model's table, bumped by the service layer on every write.
+
+    The generation changes whenever the row is recreated (e.g. after a database reset),
+    so version numbers are never reused for different data.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    generation = models.UUIDField(default=uuid.uuid4, editable=False)
+    version = models.BigIntegerField(default=0)
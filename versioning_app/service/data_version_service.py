@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+from django.db import models
+
+
+class DataVersionService(ABC):
+    """
+    Abstract class that defines the interface for the data versions of model tables.
+    A data version identifies the state of a table, so derived data such as exports can be cached
+    until the next write.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def get_version(model: type[models.Model]) -> str:
+        """
+        Retrieve the current data version of a model's table.
+
+        :param model: The model whose table is versioned.
+        :return: An opaque token that changes with every write to the table.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def bump_version(*tables: type[models.Model]) -> None:
+        """
+        Record a write to the tables of the given models, taking effect when the current transaction commits.
+
+        Must be called after the write, within the same transaction if the caller runs one.
+
+        :param tables: The models whose tables were written.
+        """
+        pass
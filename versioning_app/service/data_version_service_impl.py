@@ -0,0 +1,57 @@
+import logging
+
+from django.db import models, transaction
+from django.db.models import F
+
+from versioning_app.models import DataVersion
+from versioning_app.service.data_version_service import DataVersionService
+
+
+class DataVersionServiceImpl(DataVersionService):
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def get_version(model: type[models.Model]) -> str:
+        data_version, _ = DataVersion.objects.get_or_create(name=model._meta.label)
+        return f'{data_version.generation.hex}.{data_version.version}'
+
+    @staticmethod
+    def bump_version(*tables: type[models.Model]) -> None:
+        """
+        Increment the counters once per transaction, with a single UPDATE when it commits. The counter rows are
+        then locked for that statement only rather than until the end of every writing transaction, so
+        concurrent writers no longer queue up on them, and repeated writes to a table within a transaction
+        bump it once. Bumping after the write means a reader can at worst pair newer data with the previous
+        version, which only costs one extra regeneration; it can never pair stale data with the current version.
+        """
+        names = {model._meta.label for model in tables}
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            for _, callback, _ in connection.run_on_commit:
+                if isinstance(callback, _PendingBump) and not callback.done:
+                    callback.names |= names
+                    return
+        transaction.on_commit(_PendingBump(names))
+
+    @staticmethod
+    def _bump(names: set[str]) -> None:
+        DataVersionServiceImpl.logger.info(f"Bumping data version of {', '.join(sorted(names))}")
+        updated = DataVersion.objects.filter(name__in=names).update(version=F('version') + 1)
+        if updated < len(names):
+            # A new row starts a new generation, which differs from any token handed out before.
+            for name in names:
+                DataVersion.objects.get_or_create(name=name)
+
+
+class _PendingBump:
+    """
+    The data version bump of the tables written by a transaction, run when it commits.
+    """
+
+    def __init__(self, names: set[str]) -> None:
+        self.names = names
+        self.done = False
+
+    def __call__(self) -> None:
+        self.done = True
+        DataVersionServiceImpl._bump(self.names)
@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+from django.db import transaction as db_transaction
+
+from reports_app.models import TransactionReport
+from reports_app.service.transaction_report_service_impl import TransactionReportServiceImpl
+from transactions_app.models import Transaction
+from transactions_app.service.transaction_service_impl import TransactionServiceImpl
+from users_app.models import User
+from users_app.service.user_service_impl import UserServiceImpl
+from versioning_app.models import DataVersion
+from versioning_app.service.data_version_service_impl import DataVersionServiceImpl
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+
+
+@pytest.mark.django_db
+def test_get_version_is_stable_until_bumped(django_capture_on_commit_callbacks):
+    """Test the version token only changes when the table is written."""
+    version = DataVersionServiceImpl.get_version(Transaction)
+    assert DataVersionServiceImpl.get_version(Transaction) == version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        DataVersionServiceImpl.bump_version(Transaction)
+
+    assert DataVersionServiceImpl.get_version(Transaction) != version
+    assert DataVersionServiceImpl.get_version(TransactionReport) != version
+
+
+@pytest.mark.django_db
+def test_bump_version_creates_missing_rows(django_capture_on_commit_callbacks):
+    """Test bumping a table that was never read starts a new generation."""
+    with django_capture_on_commit_callbacks(execute=True):
+        DataVersionServiceImpl.bump_version(Transaction, TransactionReport)
+
+    assert DataVersion.objects.filter(name__in=['transactions_app.Transaction',
+                                                'reports_app.TransactionReport']).count() == 2
+
+
+@pytest.mark.django_db
+def test_recreated_row_does_not_reuse_versions():
+    """Test a recreated version row never hands out a token seen before."""
+    version = DataVersionServiceImpl.get_version(Transaction)
+    DataVersion.objects.all().delete()
+
+    assert DataVersionServiceImpl.get_version(Transaction) != version
+
+
+@pytest.mark.django_db
+def test_service_writes_bump_versions(user, settings, django_capture_on_commit_callbacks):
+    """Test every service-layer write bumps the version of the written table."""
+    settings.BACKGROUND_TASKS_EAGER = True
+    transactions_version = DataVersionServiceImpl.get_version(Transaction)
+    with django_capture_on_commit_callbacks(execute=True):
+        transaction = TransactionServiceImpl.create_transaction(user.id, 10.0, 'income', 'salary', '2024-01-01')
+    assert DataVersionServiceImpl.get_version(Transaction) != transactions_version
+
+    transactions_version = DataVersionServiceImpl.get_version(Transaction)
+    with django_capture_on_commit_callbacks(execute=True):
+        TransactionServiceImpl.update_transaction(transaction.id, amount=20.0)
+    assert DataVersionServiceImpl.get_version(Transaction) != transactions_version
+
+    transactions_version = DataVersionServiceImpl.get_version(Transaction)
+    with django_capture_on_commit_callbacks(execute=True):
+        UserServiceImpl.delete_user(user.id)
+    assert DataVersionServiceImpl.get_version(Transaction) != transactions_version
+
+    reports_version = DataVersionServiceImpl.get_version(TransactionReport)
+    with django_capture_on_commit_callbacks(execute=True):
+        TransactionReportServiceImpl.create_report(datetime.date(2024, 1, 1), datetime.date(2024, 1, 31))
+    assert DataVersionServiceImpl.get_version(TransactionReport) != reports_version
+
+
+@pytest.mark.django_db
+def test_versions_are_bumped_once_at_commit(user, django_capture_on_commit_callbacks):
+    """Test writes within a transaction bump each written table once, when it commits."""
+    version = DataVersionServiceImpl.get_version(Transaction)
+    reports_version = DataVersionServiceImpl.get_version(TransactionReport)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with db_transaction.atomic():
+            for amount in (10.0, 20.0, 30.0):
+                TransactionServiceImpl.create_transaction(user.id, amount, 'income', 'salary', '2024-01-01')
+            DataVersionServiceImpl.bump_version(TransactionReport)
+        assert DataVersionServiceImpl.get_version(Transaction) == version
+
+    assert len(callbacks) == 1
+    assert DataVersion.objects.get(name='transactions_app.Transaction').version == int(version.split('.')[1]) + 1
+    assert DataVersionServiceImpl.get_version(TransactionReport) != reports_version